@@ -0,0 +1,345 @@
+#coding:utf-8
+#
+#   PROGRAM/MODULE: interbase
+#   FILE:           aio.py
+#   DESCRIPTION:    asyncio interface for InterBase driver
+#   CREATED:        18.10.2026
+#
+#  Software distributed under the License is distributed AS IS,
+#  WITHOUT WARRANTY OF ANY KIND, either express or implied.
+#  See the License for the specific language governing rights
+#  and limitations under the License.
+#
+#  Portions created by Embarcadero Technologies to support
+#  InterBase are Copyright (c) 2023 by Embarcadero Technologies, Inc.
+#
+#  See LICENSE.TXT for details.
+
+"""asyncio interface for InterBase driver.
+
+Each :class:`AsyncConnection` owns a dedicated worker thread, and all calls to
+the InterBase client library made on behalf of this connection (and its
+transactions, cursors and event conduits) are executed by this thread. The
+event loop thread is never blocked.
+
+Example:
+
+.. code-block:: python
+
+   import interbase.aio
+
+   async def main():
+       async with await interbase.aio.connect(dsn='localhost:employee',
+                                              user='sysdba',
+                                              password='masterkey') as con:
+           cur = con.cursor()
+           await cur.execute('select * from country')
+           async for row in cur:
+               print(row)
+"""
+
+import asyncio
+import functools
+import concurrent.futures
+
+import interbase
+
+__all__ = ['connect', 'AsyncConnection', 'AsyncTransaction', 'AsyncCursor',
+           'AsyncEventConduit']
+
+
+def _new_executor():
+    return concurrent.futures.ThreadPoolExecutor(max_workers=1,
+                                                 thread_name_prefix='interbase-aio')
+
+async def connect(*args, **kwargs):
+    """Establishes a connection to the database like :func:`interbase.connect`,
+    and returns :class:`AsyncConnection` instance.
+
+    All parameters are passed to :func:`interbase.connect`.
+    """
+    executor = _new_executor()
+    try:
+        connection = await asyncio.get_running_loop().run_in_executor(
+            executor, functools.partial(interbase.connect, *args, **kwargs))
+    except BaseException:
+        executor.shutdown(wait=False)
+        raise
+    return AsyncConnection(connection, executor)
+
+
+class AsyncConnection(object):
+    """Wrapper around :class:`~interbase.Connection` that executes all its
+    operations in dedicated worker thread.
+
+    .. important::
+
+       DO NOT create instances of this class directly! Use only :func:`connect`.
+
+    Supports asynchronous context manager protocol, that closes the connection
+    on exit.
+    """
+    def __init__(self, connection, executor):
+        self._connection = connection
+        self._executor = executor
+    async def __aenter__(self):
+        return self
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+    async def run(self, func, *args, **kwargs):
+        """Calls `func` with given arguments in connection worker thread, and
+        returns its result.
+
+        Use this method to access functionality of underlying
+        :class:`~interbase.Connection` that has no asynchronous counterpart.
+        """
+        return await asyncio.get_running_loop().run_in_executor(
+            self._executor, functools.partial(func, *args, **kwargs))
+    def cursor(self):
+        """Creates new :class:`AsyncCursor` that operates within the context of
+        the main transaction.
+        """
+        return AsyncCursor(self, self._connection.cursor())
+    def trans(self, default_tpb=None):
+        """Creates new :class:`AsyncTransaction` that operates within the
+        context of this connection. See :meth:`interbase.Connection.trans`.
+        """
+        return AsyncTransaction(self, self._connection.trans(default_tpb))
+    async def begin(self, tpb=None):
+        "Starts main transaction. See :meth:`interbase.Connection.begin`."
+        await self.run(self._connection.begin, tpb)
+    async def commit(self, retaining=False):
+        "Commits main transaction. See :meth:`interbase.Connection.commit`."
+        await self.run(self._connection.commit, retaining)
+    async def rollback(self, retaining=False, savepoint=None):
+        "Rolls back main transaction. See :meth:`interbase.Connection.rollback`."
+        await self.run(self._connection.rollback, retaining, savepoint)
+    async def create_savepoint(self, name):
+        """Establishes a savepoint within main transaction. See
+        :meth:`interbase.Connection.create_savepoint`.
+        """
+        await self.run(self._connection.create_savepoint, name)
+    async def execute_immediate(self, sql):
+        """Executes a statement in context of main transaction without caching
+        its prepared form. See :meth:`interbase.Connection.execute_immediate`.
+        """
+        await self.run(self._connection.execute_immediate, sql)
+    async def event_conduit(self, event_names):
+        """Creates :class:`AsyncEventConduit` for specified events, and starts
+        listening for them.
+
+        :param event_names: Sequence of database event names.
+        """
+        conduit = self._connection.event_conduit(event_names)
+        result = AsyncEventConduit(self, conduit, asyncio.get_running_loop())
+        await self.run(conduit.begin)
+        return result
+    async def close(self):
+        """Closes the connection and stops its worker thread.
+        """
+        try:
+            if not self._connection.closed:
+                await self.run(self._connection.close)
+        finally:
+            self._executor.shutdown(wait=False)
+    def __get_closed(self):
+        return self._connection.closed
+    def __get_connection(self):
+        return self._connection
+
+    #: (Read Only) True if connection is closed.
+    closed = property(__get_closed)
+    #: (Read Only) Underlying :class:`~interbase.Connection`. Use it only
+    #: through :meth:`run`.
+    connection = property(__get_connection)
+
+
+class AsyncTransaction(object):
+    """Wrapper around :class:`~interbase.Transaction` that executes all its
+    operations in connection worker thread.
+
+    .. important::
+
+       DO NOT create instances of this class directly! Use only
+       :meth:`AsyncConnection.trans`.
+    """
+    def __init__(self, connection, transaction):
+        self._connection = connection
+        self._transaction = transaction
+    def cursor(self):
+        """Creates new :class:`AsyncCursor` that operates within the context of
+        this transaction.
+        """
+        return AsyncCursor(self._connection, self._transaction.cursor())
+    async def begin(self, tpb=None):
+        "Starts the transaction. See :meth:`interbase.Transaction.begin`."
+        await self._connection.run(self._transaction.begin, tpb)
+    async def commit(self, retaining=False):
+        "Commits the transaction. See :meth:`interbase.Transaction.commit`."
+        await self._connection.run(self._transaction.commit, retaining)
+    async def rollback(self, retaining=False, savepoint=None):
+        "Rolls back the transaction. See :meth:`interbase.Transaction.rollback`."
+        await self._connection.run(self._transaction.rollback, retaining,
+                                   savepoint)
+    async def create_savepoint(self, name):
+        """Establishes a savepoint within the transaction. See
+        :meth:`interbase.Transaction.create_savepoint`.
+        """
+        await self._connection.run(self._transaction.create_savepoint, name)
+    async def execute_immediate(self, sql):
+        """Executes a statement in context of this transaction. See
+        :meth:`interbase.Transaction.execute_immediate`.
+        """
+        await self._connection.run(self._transaction.execute_immediate, sql)
+    async def close(self):
+        "Closes the transaction. See :meth:`interbase.Transaction.close`."
+        await self._connection.run(self._transaction.close)
+    def __get_active(self):
+        return self._transaction.active
+    def __get_transaction(self):
+        return self._transaction
+
+    #: (Read Only) True if transaction is active.
+    active = property(__get_active)
+    #: (Read Only) Underlying :class:`~interbase.Transaction`.
+    transaction = property(__get_transaction)
+
+
+class AsyncCursor(object):
+    """Wrapper around :class:`~interbase.Cursor` that executes all its
+    operations in connection worker thread.
+
+    .. important::
+
+       DO NOT create instances of this class directly! Use only
+       :meth:`AsyncConnection.cursor` or :meth:`AsyncTransaction.cursor`.
+
+    Supports asynchronous iteration over rows of result set. Rows are fetched
+    from worker thread in batches of :attr:`arraysize` rows.
+    """
+    def __init__(self, connection, cursor):
+        self._connection = connection
+        self._cursor = cursor
+        #: (Read/Write) Number of rows fetched at once by :meth:`fetchmany`
+        #: and during asynchronous iteration.
+        self.arraysize = 100
+    def __execute(self, operation, parameters):
+        self._cursor.execute(operation, parameters)
+        # Description could require catalog queries, so it's prepared here
+        self._cursor.description
+    async def execute(self, operation, parameters=None):
+        """Prepares and executes a database operation. See
+        :meth:`interbase.Cursor.execute`.
+
+        :returns: self
+        """
+        await self._connection.run(self.__execute, operation, parameters or ())
+        return self
+    async def executemany(self, operation, seq_of_parameters):
+        """Executes operation for each parameter set. See
+        :meth:`interbase.Cursor.executemany`.
+
+        :returns: self
+        """
+        await self._connection.run(self._cursor.executemany, operation,
+                                   seq_of_parameters)
+        return self
+    async def callproc(self, procname, parameters=None):
+        "Calls a stored procedure. See :meth:`interbase.Cursor.callproc`."
+        return await self._connection.run(self._cursor.callproc, procname,
+                                          parameters)
+    async def fetchone(self):
+        "Fetches the next row. See :meth:`interbase.Cursor.fetchone`."
+        return await self._connection.run(self._cursor.fetchone)
+    async def fetchmany(self, size=None):
+        """Fetches the next set of rows (:attr:`arraysize` by default). See
+        :meth:`interbase.Cursor.fetchmany`.
+        """
+        return await self._connection.run(self._cursor.fetchmany,
+                                          size or self.arraysize)
+    async def fetchall(self):
+        "Fetches all remaining rows. See :meth:`interbase.Cursor.fetchall`."
+        return await self._connection.run(self._cursor.fetchall)
+    async def fetchonemap(self):
+        "Fetches the next row as mapping. See :meth:`interbase.Cursor.fetchonemap`."
+        return await self._connection.run(self._cursor.fetchonemap)
+    async def get_rowcount(self):
+        """Returns number of rows affected (or fetched) by last operation.
+        See :attr:`interbase.Cursor.rowcount`.
+        """
+        return await self._connection.run(getattr, self._cursor, 'rowcount')
+    async def close(self):
+        "Closes the cursor. See :meth:`interbase.Cursor.close`."
+        await self._connection.run(self._cursor.close)
+    async def iter(self, size=None):
+        """Asynchronous iterator over remaining rows, that fetches rows in
+        batches of `size` (:attr:`arraysize` by default) rows.
+        """
+        while True:
+            rows = await self.fetchmany(size)
+            if not rows:
+                return
+            for row in rows:
+                yield row
+    def __aiter__(self):
+        return self.iter()
+    def __get_description(self):
+        return self._cursor.description
+    def __get_cursor(self):
+        return self._cursor
+
+    #: (Read Only) Description of result columns. See
+    #: :attr:`interbase.Cursor.description`.
+    description = property(__get_description)
+    #: (Read Only) Underlying :class:`~interbase.Cursor`.
+    cursor = property(__get_cursor)
+
+
+class AsyncEventConduit(object):
+    """Wrapper around :class:`~interbase.EventConduit` that delivers event
+    notifications through :class:`asyncio.Queue`.
+
+    .. important::
+
+       DO NOT create instances of this class directly! Use only
+       :meth:`AsyncConnection.event_conduit`.
+
+    Each notification is a dictionary that maps `event_name ->
+    event_occurrence_count` for events posted since previous notification.
+    Supports asynchronous context manager protocol, that closes the conduit
+    on exit.
+    """
+    def __init__(self, connection, conduit, loop):
+        self._connection = connection
+        self._conduit = conduit
+        self._queue = asyncio.Queue()
+        conduit._add_listener(functools.partial(loop.call_soon_threadsafe,
+                                                self._queue.put_nowait))
+    async def __aenter__(self):
+        return self
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+    async def wait(self, timeout=None):
+        """Waits for next event notification.
+
+        :param timeout: Number of seconds (use a float to indicate fractions
+                        of seconds). The default timeout is infinite.
+        :returns: `None` if the wait timed out, otherwise a dictionary that
+                  maps `event_name -> event_occurrence_count`.
+        """
+        try:
+            return await asyncio.wait_for(self._queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+    async def close(self):
+        "Cancels the standing request for event notifications."
+        await self._connection.run(self._conduit.close)
+    def __get_closed(self):
+        return self._conduit.closed
+    def __get_queue(self):
+        return self._queue
+
+    #: (Read Only) True if conduit is closed.
+    closed = property(__get_closed)
+    #: (Read Only) :class:`asyncio.Queue` with event notifications.
+    queue = property(__get_queue)
@@ -0,0 +1,220 @@
+#coding:utf-8
+#
+#   PROGRAM/MODULE: interbase
+#   FILE:           cache.py
+#   DESCRIPTION:    Query result cache for InterBase driver
+#   CREATED:        18.10.2026
+#
+#  Software distributed under the License is distributed AS IS,
+#  WITHOUT WARRANTY OF ANY KIND, either express or implied.
+#  See the License for the specific language governing rights
+#  and limitations under the License.
+#
+#  Portions created by Embarcadero Technologies to support
+#  InterBase are Copyright (c) 2023 by Embarcadero Technologies, Inc.
+#
+#  See LICENSE.TXT for details.
+
+"""Client-side cache of query results, invalidated by database events.
+
+Example:
+
+.. code-block:: python
+
+   import interbase.cache
+
+   cache = interbase.cache.ResultCache(maxsize=500, ttl=3600)
+   # Triggers on COUNTRY table post 'country_changed' event
+   cache.subscribe(con, ['country_changed'])
+
+   cur = con.cursor()
+   rows = cache.fetchall(cur, 'select * from country',
+                         depends_on=['country_changed'])
+"""
+
+import time
+import threading
+import collections
+
+import interbase
+
+__all__ = ['ResultCache']
+
+
+class ResultCache(object):
+    """Thread-safe LRU cache of query results keyed by (database, SQL,
+    parameters).
+
+    Each cached result could depend on database events. When any of them is
+    posted (for example by trigger on table used by the query) and received
+    by conduit created by :meth:`subscribe`, the result is dropped from cache.
+
+    .. important::
+
+       Cached results are shared by all transactions, so they don't respect
+       transaction isolation. Use the cache only for data that are changed
+       rarely, and only for queries that return materialized values (not
+       stream BLOBs).
+    """
+    def __init__(self, maxsize=1000, ttl=None):
+        """
+        :param integer maxsize: Max. number of cached results. When cache is
+                                full, least recently used results are dropped.
+        :param ttl: Number of seconds after which cached result expires.
+                    `None` means never.
+
+        :raises ProgrammingError: For bad parameter values.
+        """
+        if maxsize < 1:
+            raise interbase.ProgrammingError("Cache size must be positive.")
+        #: (Read/Write) Max. number of cached results.
+        self.maxsize = maxsize
+        #: (Read/Write) Number of seconds after which cached result expires.
+        self.ttl = ttl
+        self.__lock = threading.RLock()
+        self.__entries = collections.OrderedDict()
+        self.__dependents = {}
+        self.__generations = {}
+        self.__epoch = 0
+        self.__conduits = []
+        self.__stats = {'hits': 0, 'misses': 0, 'evictions': 0,
+                        'expirations': 0, 'invalidations': 0}
+    def __enter__(self):
+        return self
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+    def __drop(self, key):
+        # Caller must hold the lock
+        rows, expires, events = self.__entries.pop(key)
+        for event in events:
+            keys = self.__dependents.get(event)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self.__dependents[event]
+    def __get_generations(self, events):
+        # Caller must hold the lock
+        return (self.__epoch, [self.__generations.get(event, 0)
+                               for event in events])
+    def __on_events(self, counts):
+        # Called by EventConduit from its event processing thread
+        self.invalidate([name for name, count in counts.items() if count])
+    def subscribe(self, connection, event_names):
+        """Starts listening for database events that invalidate cached
+        results.
+
+        :param connection: :class:`~interbase.Connection` used to receive
+                           events. It should not be used for anything else
+                           while the cache is in use.
+        :param event_names: Sequence of event names.
+        :returns: :class:`~interbase.EventConduit` instance, closed by
+                  :meth:`close`.
+        """
+        conduit = connection.event_conduit(event_names)
+        conduit._add_listener(self.__on_events)
+        conduit.begin()
+        with self.__lock:
+            self.__conduits.append(conduit)
+        return conduit
+    def invalidate(self, event_names=None):
+        """Drops cached results that depend on any of specified events.
+
+        :param event_names: Sequence of event names. `None` drops all cached
+                            results.
+        :returns: Number of dropped results.
+        """
+        with self.__lock:
+            if event_names is None:
+                count = len(self.__entries)
+                self.__entries.clear()
+                self.__dependents.clear()
+                self.__epoch += 1
+            else:
+                count = 0
+                for event in event_names:
+                    self.__generations[event] = self.__generations.get(event, 0) + 1
+                    for key in list(self.__dependents.get(event, ())):
+                        self.__drop(key)
+                        count += 1
+            self.__stats['invalidations'] += count
+            return count
+    def clear(self):
+        "Drops all cached results."
+        self.invalidate()
+    def fetchall(self, cursor, sql, parameters=None, depends_on=()):
+        """Returns all rows returned by query, from cache if possible.
+        Otherwise the query is executed by `cursor` and its result is stored
+        to cache.
+
+        :param cursor: :class:`~interbase.Cursor` instance.
+        :param string sql: SELECT statement.
+        :param parameters: Sequence of statement parameters.
+        :param depends_on: Sequence of names of events that invalidate the
+                           result.
+        :returns: List of tuples like :meth:`~interbase.Cursor.fetchall`.
+
+        .. note::
+
+           Results of queries with unhashable parameters are not cached.
+        """
+        parameters = tuple(parameters or ())
+        key = (cursor.connection._get_db_identity(), sql, parameters)
+        try:
+            hash(key)
+        except TypeError:
+            cursor.execute(sql, parameters)
+            return cursor.fetchall()
+        depends_on = frozenset(depends_on)
+        with self.__lock:
+            entry = self.__entries.get(key)
+            if entry is not None:
+                rows, expires, events = entry
+                if expires is not None and expires < time.time():
+                    self.__drop(key)
+                    self.__stats['expirations'] += 1
+                else:
+                    self.__entries.move_to_end(key)
+                    self.__stats['hits'] += 1
+                    return list(rows)
+            self.__stats['misses'] += 1
+            generations = self.__get_generations(depends_on)
+        cursor.execute(sql, parameters)
+        rows = cursor.fetchall()
+        with self.__lock:
+            # Result is not stored when it was invalidated during execution
+            if generations == self.__get_generations(depends_on):
+                if key in self.__entries:
+                    self.__drop(key)
+                self.__entries[key] = (tuple(rows),
+                                       None if self.ttl is None
+                                       else time.time() + self.ttl,
+                                       depends_on)
+                for event in depends_on:
+                    self.__dependents.setdefault(event, set()).add(key)
+                while len(self.__entries) > self.maxsize:
+                    self.__drop(next(iter(self.__entries)))
+                    self.__stats['evictions'] += 1
+        return rows
+    def close(self):
+        """Closes all event conduits created by :meth:`subscribe` and drops
+        all cached results.
+        """
+        with self.__lock:
+            conduits = self.__conduits
+            self.__conduits = []
+        for conduit in conduits:
+            conduit.close()
+        self.clear()
+    def __len__(self):
+        return len(self.__entries)
+    def __get_stats(self):
+        with self.__lock:
+            result = self.__stats.copy()
+            result['size'] = len(self.__entries)
+        return result
+
+    #: (Read Only) Dictionary with cache statistics: `size`, `hits`, `misses`,
+    #: `evictions` (results dropped because cache was full), `expirations`
+    #: and `invalidations` (results dropped because of events or
+    #: :meth:`invalidate` call).
+    stats = property(__get_stats)
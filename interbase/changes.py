@@ -0,0 +1,256 @@
+#coding:utf-8
+#
+#   PROGRAM/MODULE: interbase
+#   FILE:           changes.py
+#   DESCRIPTION:    Change view reader for InterBase driver
+#   CREATED:        18.10.2026
+#
+#  Software distributed under the License is distributed AS IS,
+#  WITHOUT WARRANTY OF ANY KIND, either express or implied.
+#  See the License for the specific language governing rights
+#  and limitations under the License.
+#
+#  Portions created by Embarcadero Technologies to support
+#  InterBase are Copyright (c) 2023 by Embarcadero Technologies, Inc.
+#
+#  See LICENSE.TXT for details.
+
+"""Reader of row changes reported by InterBase change view subscriptions.
+
+Example:
+
+.. code-block:: python
+
+   import interbase.changes
+
+   # Trigger on CUSTOMER table posts 'customer_changed' event
+   reader = interbase.changes.ChangeReader(con, 'SUB_CUSTOMER_CHANGE',
+                                           'CUSTOMER', 'CUST_NO',
+                                           event_names=['customer_changed'])
+   for batch in reader.batches():
+       for change in batch:
+           if change.operation == 'DELETE':
+               index.delete(change.key)
+           else:
+               index.update(change.key, change.values)
+"""
+
+import time
+import threading
+
+import interbase
+from interbase.ibcore import _SQLIND_CHANGES
+
+__all__ = ['ChangeReader', 'Change']
+
+#: Operation reported for row with given SQLIND flag, in order of precedence
+_OPERATIONS = ((interbase.SQLIND_DELETE, 'DELETE'),
+               (interbase.SQLIND_INSERT, 'INSERT'),
+               (interbase.SQLIND_UPDATE, 'UPDATE'))
+
+
+class Change(object):
+    """Row change reported by :class:`ChangeReader`.
+
+    .. important::
+
+       DO NOT create instances of this class directly! They're returned only
+       by :meth:`ChangeReader.batches`.
+    """
+    __slots__ = ('operation', 'key', 'values', 'changed')
+    def __init__(self, operation, key, values, changed):
+        #: (Read Only) Operation that changed the row: `'INSERT'`, `'UPDATE'`
+        #: or `'DELETE'`.
+        self.operation = operation
+        #: (Read Only) Value of key column, or tuple of values for compound key.
+        self.key = key
+        #: (Read Only) Dictionary that maps `column_name -> value` for all
+        #: selected columns.
+        self.values = values
+        #: (Read Only) Tuple with names of changed columns.
+        self.changed = changed
+    def __repr__(self):
+        return 'Change(%r, %r, %r)' % (self.operation, self.key, self.changed)
+
+
+class ChangeReader(object):
+    """Reads row changes from a table with change view subscription, in
+    batches.
+
+    Each poll starts SNAPSHOT transaction, activates the subscription by
+    `SET SUBSCRIPTION <name> ACTIVE` and selects changed rows from the table.
+    The transaction is committed, and so the changes are consumed, only after
+    all batches of the poll were processed. When processing is interrupted by
+    an exception (or the iteration is abandoned), the transaction is rolled
+    back and the same changes are returned again by next poll.
+
+    When there are no changes, the reader waits for database events before it
+    polls again (or for :attr:`poll_interval` seconds when no events are
+    specified).
+
+    Supports context manager protocol, that closes the reader on exit.
+
+    .. note::
+
+       Column changed to NULL is returned without change flags, so it's not
+       listed in :attr:`Change.changed`. Change views on ARRAY columns are not
+       supported.
+    """
+    #: (Read/Write) Number of seconds between polls when no events arrive.
+    poll_interval = 60.0
+    def __init__(self, connection, subscription, table, key, columns=None,
+                 batch_size=100, event_names=None):
+        """
+        :param connection: :class:`~interbase.Connection` instance. It should
+                           not be used for anything else while reader is in use.
+        :param string subscription: Name of change view subscription. The user
+                                    must have SUBSCRIBE privilege on it.
+        :param string table: Name of table with the subscription.
+        :param key: Name of key column, or sequence of names for compound key.
+        :param columns: Sequence of names of selected columns. All columns
+                        when not specified.
+        :param integer batch_size: Max. number of changes in one batch.
+        :param event_names: Sequence of names of events posted (usually by
+                            triggers) when the table is changed.
+
+        :raises ProgrammingError: For bad parameter values.
+        """
+        if batch_size < 1:
+            raise interbase.ProgrammingError("Batch size must be positive.")
+        #: (Read Only) Name of change view subscription.
+        self.subscription = subscription
+        #: (Read/Write) Max. number of changes in one batch.
+        self.batch_size = batch_size
+        self.__single_key = isinstance(key, str)
+        self.__key = [key] if self.__single_key else list(key)
+        if not self.__key:
+            raise interbase.ProgrammingError("Key column must be specified.")
+        self.__sql = 'SELECT %s FROM %s' % (', '.join(columns) if columns
+                                            else '*', table)
+        self.__transaction = connection.trans(interbase.ISOLATION_LEVEL_SNAPSHOT)
+        self.__wakeup = threading.Event()
+        self.__closed = False
+        self.__stats = {'polls': 0, 'changes': 0, 'wakeups': 0}
+        self.__conduit = None
+        if event_names:
+            self.__conduit = connection.event_conduit(event_names)
+            self.__conduit._add_listener(self.__on_events)
+            self.__conduit.begin()
+    def __enter__(self):
+        return self
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+    def __on_events(self, counts):
+        # Called by EventConduit from its event processing thread
+        if any(counts.values()):
+            self.__stats['wakeups'] += 1
+            self.__wakeup.set()
+    def __check_open(self):
+        if self.__closed:
+            raise interbase.ProgrammingError("Change reader is closed")
+    def __open_change_set(self):
+        transaction = self.__transaction
+        transaction.begin()
+        transaction.execute_immediate('SET SUBSCRIPTION %s ACTIVE'
+                                      % self.subscription)
+        cursor = transaction.cursor()
+        cursor.execute(self.__sql)
+        names = [d[0] for d in cursor.description]
+        if any(d[1] is list for d in cursor.description):
+            raise interbase.ProgrammingError("Change views on ARRAY columns"
+                                             " are not supported.")
+        upper = [name.upper() for name in names]
+        try:
+            key = [upper.index(name.upper()) for name in self.__key]
+        except ValueError:
+            raise interbase.ProgrammingError("Key column is not selected.")
+        self.__stats['polls'] += 1
+        return cursor, names, key
+    def __change(self, row, names, key):
+        values = {}
+        changed = []
+        flags = 0
+        for name, value in zip(names, row):
+            if isinstance(value, list):
+                value, flag = value
+                flags |= flag
+                if flag & _SQLIND_CHANGES:
+                    changed.append(name)
+            values[name] = value
+        for flag, operation in _OPERATIONS:
+            if flags & flag:
+                break
+        else:
+            # Only columns changed to NULL
+            operation = 'UPDATE'
+        if self.__single_key:
+            key_value = values[names[key[0]]]
+        else:
+            key_value = tuple(values[names[i]] for i in key)
+        return Change(operation, key_value, values, tuple(changed))
+    def batches(self, timeout=None):
+        """Generator that returns lists of :class:`Change` instances.
+
+        Changes returned by previous batches are consumed (the poll
+        transaction is committed) when next batch is requested after the last
+        batch of the poll.
+
+        :param timeout: Number of seconds after which the generator stops when
+                        there are no changes. `None` means wait until
+                        :meth:`close` is called (from another thread).
+
+        :raises ProgrammingError: When reader is closed.
+        """
+        self.__check_open()
+        deadline = None if timeout is None else time.time() + timeout
+        while not self.__closed:
+            # Events posted after this point wake up the next wait
+            self.__wakeup.clear()
+            found = False
+            try:
+                cursor, names, key = self.__open_change_set()
+                while True:
+                    rows = cursor.fetchmany(self.batch_size)
+                    if not rows:
+                        break
+                    found = True
+                    self.__stats['changes'] += len(rows)
+                    yield [self.__change(row, names, key) for row in rows]
+                self.__transaction.commit()
+            finally:
+                if self.__transaction.active:
+                    self.__transaction.rollback()
+            if found:
+                if timeout is not None:
+                    deadline = time.time() + timeout
+                continue
+            wait = self.poll_interval
+            if deadline is not None:
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    return
+                wait = min(wait, remaining)
+            self.__wakeup.wait(wait)
+    def close(self):
+        """Stops listening for events and rolls back active poll transaction.
+        Generator returned by :meth:`batches` waiting in another thread stops.
+        """
+        if self.__closed:
+            return
+        self.__closed = True
+        self.__wakeup.set()
+        if self.__conduit is not None:
+            self.__conduit.close()
+        if self.__transaction.active:
+            self.__transaction.rollback()
+    def __get_closed(self):
+        return self.__closed
+    def __get_stats(self):
+        return self.__stats.copy()
+
+    #: (Read Only) True if reader is closed.
+    closed = property(__get_closed)
+    #: (Read Only) Dictionary with reader statistics: `polls`, `changes`
+    #: (number of returned changes) and `wakeups` (number of event
+    #: notifications).
+    stats = property(__get_stats)
@@ -0,0 +1,233 @@
+#coding:utf-8
+#
+#   PROGRAM/MODULE: interbase
+#   FILE:           export.py
+#   DESCRIPTION:    Streaming export of query results for InterBase driver
+#   CREATED:        18.10.2026
+#
+#  Software distributed under the License is distributed AS IS,
+#  WITHOUT WARRANTY OF ANY KIND, either express or implied.
+#  See the License for the specific language governing rights
+#  and limitations under the License.
+#
+#  Portions created by Embarcadero Technologies to support
+#  InterBase are Copyright (c) 2023 by Embarcadero Technologies, Inc.
+#
+#  See LICENSE.TXT for details.
+
+"""Streaming export of query results to CSV and JSON Lines files.
+
+Values of numeric, date and time columns are formatted as text straight from
+fetched row buffers, without intermediate Python `datetime` and `Decimal`
+objects, and output is written in large chunks.
+
+Example:
+
+.. code-block:: python
+
+   import interbase.export
+
+   cur = con.cursor()
+   with open('sales.csv', 'w', newline='') as f:
+       stats = interbase.export.export_csv(cur, 'select * from sales', f)
+   print(stats['rows'], stats['bytes'])
+"""
+
+import io
+import csv
+import json
+
+import interbase
+
+__all__ = ['export_csv', 'export_jsonl']
+
+# JSON text of string, without non-ASCII characters escaped
+_encode_json_string = json.encoder.encode_basestring
+# Text of float values that have no JSON representation
+_NON_FINITE = frozenset(['nan', 'inf', '-inf'])
+
+
+def _value_text(value):
+    "Returns text of value returned for BLOB, ARRAY or OCTETS column."
+    if isinstance(value, interbase.BlobReader):
+        try:
+            return _value_text(value.read())
+        finally:
+            value.close()
+    if isinstance(value, bytes):
+        return value.hex()
+    return value if isinstance(value, str) else str(value)
+
+def _float_json(text):
+    "Returns JSON text of FLOAT or DOUBLE PRECISION value text."
+    return 'null' if text in _NON_FINITE else text
+
+def _value_json(value):
+    "Returns JSON text of value returned for BLOB, ARRAY or OCTETS column."
+    if isinstance(value, list):
+        return json.dumps(value, default=str, ensure_ascii=False)
+    return _encode_json_string(_value_text(value))
+
+
+class _ChunkWriter(object):
+    "Writes text to file in chunks of given size, and counts written data."
+    def __init__(self, file, encoding, chunk_size, callback):
+        self.file = file
+        self.encoding = None if isinstance(file, io.TextIOBase) else encoding
+        self.chunk_size = chunk_size
+        self.callback = callback
+        self.rows = 0
+        self.bytes = 0
+    def write(self, text, rows):
+        if self.encoding is not None:
+            text = text.encode(self.encoding)
+        self.file.write(text)
+        self.rows += rows
+        self.bytes += len(text)
+        if self.callback is not None:
+            self.callback(self.rows, self.bytes)
+    def get_stats(self):
+        return {'rows': self.rows, 'bytes': self.bytes}
+
+
+def _prepare(cursor, sql):
+    statement = cursor.prep(sql)
+    if not statement.n_output_params:
+        statement.close()
+        raise interbase.ProgrammingError("Statement does not return"
+                                         " result set.")
+    return statement
+
+def export_csv(cursor, sql, file, parameters=None, header=True,
+               encoding='utf-8', batch_size=1000, chunk_size=1048576,
+               callback=None, **fmtparams):
+    """Executes query and writes all returned rows to file in CSV format.
+
+    NULL values are written as empty fields. Numbers are written without
+    exponent where possible (NUMERIC and DECIMAL with all digits of their
+    scale), booleans as `true` and `false`, dates and times in ISO format
+    (like `str()` of :mod:`datetime` values), and binary data as
+    hexadecimal digits.
+
+    :param cursor: :class:`~interbase.Cursor` instance.
+    :param string sql: SELECT statement.
+    :param file: Text or binary file-like object. Text file should be opened
+                 with `newline=''`.
+    :param parameters: Sequence of statement parameters.
+    :param bool header: When True, the first line contains column names.
+    :param string encoding: Encoding of text written to binary file.
+    :param integer batch_size: Number of rows fetched at once.
+    :param integer chunk_size: Minimal number of characters written to file
+                               at once.
+    :param callback: Callable called with number of exported rows and
+                     written bytes (characters for text file) after each
+                     write.
+    :param fmtparams: Formatting parameters for :func:`csv.writer`.
+    :returns: Dictionary with number of exported `rows` and written `bytes`
+              (characters for text file).
+    """
+    statement = _prepare(cursor, sql)
+    try:
+        cursor.execute(statement, parameters or ())
+        return _write_csv(statement, file, header, encoding, batch_size,
+                          chunk_size, callback, fmtparams)
+    finally:
+        statement.close()
+
+def _write_csv(statement, file, header, encoding, batch_size, chunk_size,
+               callback, fmtparams):
+    out = _ChunkWriter(file, encoding, chunk_size, callback)
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, **fmtparams)
+    if header:
+        writer.writerow([d[0] for d in statement.description])
+    kinds = statement._get_text_kinds()
+    convert = [i for i, quoted in enumerate(kinds) if quoted is None]
+    pending = 0
+    while True:
+        rows = statement._fetch_text(batch_size)
+        if not rows:
+            break
+        for row in rows:
+            for i in convert:
+                if row[i] is not None:
+                    row[i] = _value_text(row[i])
+        writer.writerows(rows)
+        pending += len(rows)
+        if buffer.tell() >= chunk_size:
+            out.write(buffer.getvalue(), pending)
+            buffer.seek(0)
+            buffer.truncate()
+            pending = 0
+    if buffer.tell() or pending:
+        out.write(buffer.getvalue(), pending)
+    return out.get_stats()
+
+def export_jsonl(cursor, sql, file, parameters=None, encoding='utf-8',
+                 batch_size=1000, chunk_size=1048576, callback=None):
+    """Executes query and writes all returned rows to file in JSON Lines
+    format, one JSON object that maps column names to values per line.
+
+    Numbers and booleans are written as JSON numbers and booleans (NUMERIC
+    and DECIMAL with all digits of their scale), NULL values and non-finite
+    floats as `null`, dates and times as strings in ISO format (like `str()`
+    of :mod:`datetime` values), binary data as strings of hexadecimal digits
+    and ARRAY values as JSON arrays.
+
+    :param cursor: :class:`~interbase.Cursor` instance.
+    :param string sql: SELECT statement.
+    :param file: Text or binary file-like object.
+    :param parameters: Sequence of statement parameters.
+    :param string encoding: Encoding of text written to binary file.
+    :param integer batch_size: Number of rows fetched at once.
+    :param integer chunk_size: Minimal number of characters written to file
+                               at once.
+    :param callback: Callable called with number of exported rows and
+                     written bytes (characters for text file) after each
+                     write.
+    :returns: Dictionary with number of exported `rows` and written `bytes`
+              (characters for text file).
+    """
+    statement = _prepare(cursor, sql)
+    try:
+        cursor.execute(statement, parameters or ())
+        return _write_jsonl(statement, file, encoding, batch_size, chunk_size,
+                            callback)
+    finally:
+        statement.close()
+
+def _write_jsonl(statement, file, encoding, batch_size, chunk_size, callback):
+    out = _ChunkWriter(file, encoding, chunk_size, callback)
+    columns = []
+    for i, (d, quoted) in enumerate(zip(statement.description,
+                                        statement._get_text_kinds())):
+        prefix = ('{' if i == 0 else ',') + _encode_json_string(d[0]) + ':'
+        if quoted is None:
+            encode = _value_json
+        elif quoted:
+            encode = _encode_json_string
+        elif d[1] is float:
+            encode = _float_json
+        else:
+            encode = None
+        columns.append((prefix, encode))
+    lines = []
+    size = 0
+    while True:
+        rows = statement._fetch_text(batch_size)
+        if not rows:
+            break
+        for row in rows:
+            line = ''.join([prefix + ('null' if value is None else
+                                      value if encode is None else
+                                      encode(value))
+                            for (prefix, encode), value in zip(columns, row)])
+            lines.append(line)
+            size += len(line) + 2
+        if size >= chunk_size:
+            out.write('}\n'.join(lines) + '}\n', len(lines))
+            lines = []
+            size = 0
+    if lines:
+        out.write('}\n'.join(lines) + '}\n', len(lines))
+    return out.get_stats()
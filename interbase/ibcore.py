@@ -33,6 +33,10 @@ import datetime
 import decimal
 import weakref
 import threading
+import collections
+import array
+import codecs
+import queue
 
 from . import ibase
 from . import schema
@@ -70,7 +74,7 @@ from interbase.ibase import (
     isc_info_set_page_buffers, isc_info_sql_stmt_delete,
     isc_info_sql_stmt_exec_procedure,
     isc_info_sql_stmt_insert, isc_info_sql_stmt_select,
-    isc_info_sql_stmt_update, isc_info_sweep_interval,
+    isc_info_sql_stmt_update, isc_info_sql_stmt_ddl, isc_info_sweep_interval,
     isc_info_update_count, isc_info_user_names, isc_info_version,
     isc_info_writes, isc_tpb_concurrency, isc_tpb_consistency,
     isc_tpb_exclusive, isc_tpb_lock_read,
@@ -260,6 +264,8 @@ ROWID = DBAPITypeObject()
 
 _FS_ENCODING = sys.getfilesystemencoding()
 DIST_TRANS_MAX_DATABASES = 16
+#: Default number of idle prepared statements kept by :class:`StatementCache`.
+DEFAULT_STATEMENT_CACHE_SIZE = 64
 
 def bs(byte_array):
     return bytes(byte_array) if PYTHON_MAJOR_VER == 3 else ''.join((chr(c) for c in byte_array))
@@ -296,6 +302,61 @@ _SIZE_OF_SHORT = ctypes.sizeof(ctypes.c_short)
 
 _tenTo = [10 ** x for x in range(20)]
 
+# InterBase DATE is number of days since 17.11.1858
+_IB_DATE_ORDINAL = 678576    # datetime.date(1858, 11, 17).toordinal()
+_IB_TIMESTAMP_BASE = datetime.datetime(1858, 11, 17)
+_date_fromordinal = datetime.date.fromordinal
+# Number of days between 17.11.1858 and 1.1.1970
+_IB_UNIX_EPOCH_DAYS = 40587
+
+def _format_time_ticks(ticks):
+    "Returns text of InterBase TIME value (1/10000 seconds since midnight)."
+    s, fraction = divmod(ticks, 10000)
+    m, s = divmod(s, 60)
+    if fraction:
+        return '%02d:%02d:%02d.%06d' % (m // 60, m % 60, s, fraction * 100)
+    return '%02d:%02d:%02d' % (m // 60, m % 60, s)
+
+# SQLIND flags of rows returned for active change view subscription
+_SQLIND_CHANGES = SQLIND_INSERT | SQLIND_UPDATE | SQLIND_DELETE
+
+# Alignment of output column data in contiguous row buffer
+_DATA_ALIGNMENT = {
+    SQL_VARYING: 2, SQL_SHORT: 2, SQL_BOOLEAN: 2,
+    SQL_LONG: 4, SQL_FLOAT: 4, SQL_TYPE_DATE: 4, SQL_TYPE_TIME: 4,
+    SQL_TIMESTAMP: 4, SQL_BLOB: 4, SQL_ARRAY: 4,
+    SQL_INT64: 8, SQL_DOUBLE: 8, SQL_D_FLOAT: 8,
+}
+
+# Process-wide cache of fixed-point field precisions, keyed by database
+# identity (database file name and site name) and (relation, field) names
+_precision_cache = {}
+# Max. number of fields looked up by single catalog query
+_PRECISION_BATCH_SIZE = 50
+
+_unpack_short = struct.Struct('<h').unpack_from
+
+# Incremented in child process after fork(). Handles obtained in different
+# generation belong to the parent process and must not be released.
+_fork_generation = 0
+# All attached connections, invalidated in child process after fork()
+_connections = weakref.WeakSet()
+
+def _after_fork_in_child():
+    global _fork_generation
+    _fork_generation += 1
+    for connection in list(_connections):
+        connection._invalidate()
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_after_fork_in_child)
+
+# NumPy dtypes for ARRAY elements keyed by (blr type, element size)
+_ARRAY_NDARRAY_DTYPES = {
+    (blr_short, 2): '<i2', (blr_long, 4): '<i4', (blr_int64, 8): '<i8',
+    (blr_float, 4): '<f4', (blr_double, 8): '<f8', (blr_d_float, 8): '<f8',
+}
+
 if PYTHON_MAJOR_VER != 3:
     del x
 
@@ -321,6 +382,11 @@ _DATABASE_INFO_CODES_WITH_COUNT_RESULTS = (
 
 _DATABASE_INFO__KNOWN_LOW_LEVEL_EXCEPTIONS = (isc_info_user_names,)
 
+# Leading keywords of statements that change metadata. Used to recognize DDL
+# executed via execute_immediate(), where statement type is not available.
+_DDL_STATEMENT_PREFIXES = ('CREATE', 'ALTER', 'DROP', 'RECREATE', 'DECLARE',
+                           'GRANT', 'REVOKE')
+
 def xsqlda_factory(size):
     if size in __xsqlda_cache:
         cls = __xsqlda_cache[size]
@@ -359,6 +425,31 @@ def is_dead_proxy(obj):
     except ReferenceError:
         return True
 
+def _is_ddl_statement(sql):
+    "Returns True if SQL command (string) looks like metadata change."
+    if isinstance(sql, mybytes):
+        sql = sql.decode('latin-1')
+    words = sql.lstrip(' \t\r\n(').split(None, 1)
+    return bool(words) and words[0].upper() in _DDL_STATEMENT_PREFIXES
+
+def _ib_time(v):
+    "Returns InterBase TIME value (1/10000 seconds since midnight) for datetime.time."
+    return ((v.hour * 3600 + v.minute * 60 + v.second) * 10000
+            + v.microsecond // 100)
+
+def _import_numpy(feature):
+    "Returns numpy module, or raises NotSupportedError when it's not installed."
+    try:
+        import numpy
+    except ImportError:
+        raise NotSupportedError("NumPy is required for %s." % feature)
+    return numpy
+
+def _is_ndarray(value):
+    "Returns True if value is numpy.ndarray, without importing numpy."
+    numpy = sys.modules.get('numpy')
+    return numpy is not None and isinstance(value, numpy.ndarray)
+
 def b2u(st, charset):
     "Decode to unicode if charset is defined. For conversion of result set data."
     if charset:
@@ -714,7 +805,9 @@ def connect(
     if db_api_error(_isc_status):
         raise exception_from_status(DatabaseError, _isc_status, "Error while connecting to database:")
 
-    return connection_class(_db_handle, dpb, sql_dialect, charset, isolation_level)
+    connection = connection_class(_db_handle, dpb, sql_dialect, charset, isolation_level)
+    connection._dsn = dsn
+    return connection
 
 def create_database(sql='', sql_dialect=3, dsn='', user=None, password=None,
                     host=None, database=None,
@@ -902,6 +995,14 @@ class Connection(object):
 
        DO NOT create instances of this class directly! Use only
        :func:`connect` or :func:`create_database` to get Connection instances.
+
+    .. note::
+
+       Connection inherited by child process after `fork()` belongs to the
+       parent process. In the child it's reported as :attr:`closed`, and it's
+       attached again to the same database when it's used first time (only
+       connections created by :func:`connect`). Active transactions, prepared
+       statements and event conduits of the parent are not carried over.
     """
 
     # PEP 249 (Python DB API 2.0) extensions
@@ -918,6 +1019,24 @@ class Connection(object):
 
     #: (integer) sql_dialect for this connection, do not change.
     sql_dialect = 3
+    #: (boolean) When True, data of all output columns (and NULL indicators)
+    #: of statements prepared afterwards are placed into single contiguous
+    #: buffer, so each fetched row is unpacked with single call. Otherwise
+    #: each column has its own buffer.
+    contiguous_row_buffer = False
+    #: (integer) Default size limit (in bytes) for materialized BLOB values.
+    #: Larger BLOBs are returned as :class:`BlobReader` instances. None means
+    #: no limit. Could be overridden for individual :class:`Cursor`.
+    blob_stream_threshold = None
+    #: (boolean) When True, numeric ARRAY values are returned as
+    #: `numpy.ndarray` instead of (nested) lists. Scaled integers are returned
+    #: as float64 arrays. Could be overridden for individual :class:`Cursor`.
+    arrays_as_ndarray = False
+    #: (boolean) When False, precision of fixed-point columns is not looked
+    #: up in system tables and it's reported as 0 in :attr:`Cursor.description`.
+    resolve_precision = True
+    # Database specification used by connect(), for re-attachment after fork()
+    _dsn = None
 
     def __init__(self, db_handle, dpb=None, sql_dialect=3, charset=None,
                  isolation_level=ISOLATION_LEVEL_READ_COMMITED):
@@ -942,18 +1061,25 @@ class Connection(object):
         self._query_transaction = Transaction([self],
                                               default_tpb=ISOLATION_LEVEL_READ_COMMITED_RO)
         self._transactions = [self._main_transaction,self._query_transaction]
-        self.__precision_cache = {}
+        self.__db_identity = None
         self.__sqlsubtype_cache = {}
+        self.__array_desc_cache = {}
+        self.__statement_cache = StatementCache()
+        # Incremented by each metadata change. Statements prepared in earlier
+        # epoch are not returned to statement cache.
+        self._metadata_epoch = 0
         self.__conduits = []
         self.__group = None
         self.__schema = None
         self.__ods = None
+        self.__invalidated = False
 
         # (integer) sql_dialect for this connection, do not change.
         self.sql_dialect = sql_dialect
         self._dpb = dpb
         self._isc_status = ISC_STATUS_ARRAY()
         self._db_handle = db_handle
+        _connections.add(self)
         # Cursor for internal use
         self.__ic = self.query_transaction.cursor()
         self.__ic._set_as_internal()
@@ -979,6 +1105,7 @@ class Connection(object):
             if self.group is not None:
                 raise ProgrammingError(err_msg)
     def __check_attached(self):
+        self._ensure_attached()
         if self._db_handle == None:
             raise ProgrammingError("Connection object is detached from database")
     def __close(self, detach=True):
@@ -988,15 +1115,20 @@ class Connection(object):
             self.__ic.close()
             del self.__ic
             try:
+                self.__array_desc_cache.clear()
                 for conduit in self.__conduits:
                     conduit.close()
                 for transaction in self._transactions:
                     transaction.default_action = 'rollback' # Required by Python DB API 2.0
                     transaction.close()
+                # Cursors closed with transactions return their statements
+                # to cache, so it must be cleared after them
+                self.__statement_cache.clear()
                 if detach:
                     api.isc_detach_database(self._isc_status, self._db_handle)
             finally:
                 self._db_handle = None
+                _connections.discard(self)
 
     def __get_main_transaction(self):
         return self._main_transaction
@@ -1029,6 +1161,8 @@ class Connection(object):
             return self.__group()
         else:
             return None
+    def __get_statement_cache(self):
+        return self.__statement_cache
     def __get_ods(self):
         if not self.__ods:
             raw = self.db_info([ibase.isc_info_ods_version,
@@ -1074,6 +1208,93 @@ class Connection(object):
             self.__schema._set_as_internal()
         return self.__schema
 
+    def _metadata_changed(self):
+        "Drops all cached information that may be invalidated by DDL statement."
+        self._metadata_epoch += 1
+        if self.__db_identity is not None:
+            _precision_cache.pop(self.__db_identity, None)
+        self.__sqlsubtype_cache.clear()
+        self.__array_desc_cache.clear()
+        self.__statement_cache.clear()
+    def _reset(self):
+        """Returns connection into state it had right after attachment, so it
+        could be reused by other code (for example by connection pool).
+
+        Rolls back all active transactions, closes all cursors and event
+        conduits, and closes all transactions created by :meth:`trans`.
+        Prepared statement cache is left intact.
+
+        :raises ProgrammingError: If Connection is :attr:`closed`.
+        """
+        self.__check_attached()
+        for conduit in self.__conduits:
+            conduit.close()
+        del self.__conduits[:]
+        for transaction in self._transactions:
+            transaction.rollback()
+            for cursor in transaction.cursors:
+                if cursor is not None:
+                    cursor.close()
+        for transaction in self._transactions[2:]:
+            transaction.default_action = 'rollback'
+            transaction.close()
+        del self._transactions[2:]
+    def _invalidate(self):
+        """Detaches the connection from database handle and all transaction
+        handles without releasing them. Used in child process after fork(),
+        because these handles belong to the parent process. Connection is
+        :attr:`closed` afterwards, until it's re-attached by
+        :meth:`_ensure_attached` on first use.
+        """
+        if self._db_handle is not None:
+            for transaction in self._transactions:
+                transaction._tr_handle = None
+            self._db_handle = None
+            _connections.discard(self)
+            self.__invalidated = self._dsn is not None and self._dpb is not None
+    def _ensure_attached(self):
+        """Re-attaches connection invalidated by :meth:`_invalidate` to the
+        same database. Does nothing for other connections.
+
+        :raises DatabaseError: When connection cannot be established.
+        """
+        if self._db_handle is None and self.__invalidated:
+            db_handle = isc_db_handle(0)
+            api.isc_attach_database(self._isc_status, len(self._dsn), self._dsn,
+                                    db_handle, len(self._dpb), self._dpb)
+            if db_api_error(self._isc_status):
+                raise exception_from_status(DatabaseError, self._isc_status,
+                                            "Error while reconnecting to database:")
+            # Cached statements and event conduits belong to the parent
+            # process. Statements are dropped while connection is still
+            # closed, so their handles are not released.
+            self.__statement_cache.clear()
+            self.__conduits = []
+            self.__invalidated = False
+            self._db_handle = db_handle
+            _connections.add(self)
+    def _get_array_descriptor(self, relation, column, tr_handle):
+        """Returns :class:`_ArrayDescriptor` for ARRAY column. Descriptors are
+        looked up on server only once per column.
+        """
+        desc = self.__array_desc_cache.get((relation,column))
+        if desc is not None:
+            return desc
+        sqlsubtype = self._get_array_sqlsubtype(relation, column)
+        arraydesc = ISC_ARRAY_DESC_V2(0)
+        api.isc_array_lookup_bounds2(self._isc_status,
+                                      self._db_handle,
+                                      tr_handle,
+                                      relation,
+                                      column,
+                                      arraydesc)
+        if db_api_error(self._isc_status):
+            raise exception_from_status(DatabaseError,
+                                        self._isc_status,
+                                        "Connection._get_array_descriptor/isc_array_lookup_bounds2:")
+        desc = _ArrayDescriptor(arraydesc, sqlsubtype)
+        self.__array_desc_cache[(relation,column)] = desc
+        return desc
     def _get_array_sqlsubtype(self, relation, column):
         subtype = self.__sqlsubtype_cache.get((relation,column))
         if subtype is not None:
@@ -1091,55 +1312,93 @@ class Connection(object):
         if result:
             self.__sqlsubtype_cache[(relation,column)] = result[0]
             return result[0]
+    def _get_db_identity(self):
+        "Returns (database file name, site name) pair for this connection."
+        if self.__db_identity is None:
+            self.__db_identity = self.db_info(isc_info_db_id)[1:]
+        return self.__db_identity
+    def __get_precision_cache(self):
+        "Returns process-wide cache of field precisions for this database."
+        return _precision_cache.setdefault(self._get_db_identity(), {})
     def _determine_field_precision(self, sqlvar):
-        if sqlvar.relname_length == 0 or sqlvar.sqlname_length == 0:
-            # Either or both field name and relation name are not provided,
-            # so we cannot determine field precision. It's normal situation
-            # for example for queries with dynamically computed fields
-            return 0
-        # Special case for automatic RDB$DB_KEY fields.
-        if ((sqlvar.sqlname_length == 6 and sqlvar.sqlname == 'DB_KEY') or
-            (sqlvar.sqlname_length == 10 and sqlvar.sqlname == 'RDB$DB_KEY')):
-            return 0
-        precision = self.__precision_cache.get((sqlvar.relname,
-                                                sqlvar.sqlname))
-        if precision is not None:
-            return precision
-        # First, try table
-        self.__ic.execute("SELECT FIELD_SPEC.RDB$FIELD_PRECISION"
+        return self._determine_fields_precision([sqlvar])[0]
+    def _determine_fields_precision(self, sqlvars):
+        """Returns list of precisions for fixed-point columns described by
+        `sqlvars`. Precisions not found in cache are looked up with single
+        catalog query.
+        """
+        result = [0] * len(sqlvars)
+        if not self.resolve_precision:
+            return result
+        cache = self.__get_precision_cache()
+        missing = {}
+        for i, sqlvar in enumerate(sqlvars):
+            if sqlvar.relname_length == 0 or sqlvar.sqlname_length == 0:
+                # Either or both field name and relation name are not provided,
+                # so we cannot determine field precision. It's normal situation
+                # for example for queries with dynamically computed fields
+                continue
+            # Special case for automatic RDB$DB_KEY fields.
+            if sqlvar.sqlname in (b'DB_KEY', b'RDB$DB_KEY'):
+                continue
+            key = (p3fix(sqlvar.relname,self._python_charset),
+                   p3fix(sqlvar.sqlname,self._python_charset))
+            if key in cache:
+                result[i] = cache[key]
+            else:
+                missing.setdefault(key, []).append(i)
+        keys = list(missing)
+        for chunk in xrange(0, len(keys), _PRECISION_BATCH_SIZE):
+            found = self.__lookup_precision(keys[chunk:chunk + _PRECISION_BATCH_SIZE])
+            for key in keys[chunk:chunk + _PRECISION_BATCH_SIZE]:
+                # Not found precision is also cached, as we ran out of options
+                precision = found.get(key, 0)
+                cache[key] = precision
+                for i in missing[key]:
+                    result[i] = precision
+        return result
+    def __lookup_precision(self, keys):
+        """Returns dictionary of precisions for (relation, field) `keys`.
+        Table columns take precedence over stored procedure output parameters.
+        """
+        # Batch is padded by repeating the last key, so there is only one
+        # statement text that occupies only one slot in statement cache
+        fields = " OR ".join(["(REL_FIELDS.RDB$RELATION_NAME = ?"
+                              " AND REL_FIELDS.RDB$FIELD_NAME = ?)"] * _PRECISION_BATCH_SIZE)
+        parameters = " OR ".join(["(REL_FIELDS.RDB$PROCEDURE_NAME = ?"
+                                  " AND REL_FIELDS.RDB$PARAMETER_NAME = ?)"] * _PRECISION_BATCH_SIZE)
+        params = []
+        for key in keys:
+            params.extend(key)
+        params.extend(keys[-1] * (_PRECISION_BATCH_SIZE - len(keys)))
+        self.__ic.execute("SELECT 1, REL_FIELDS.RDB$RELATION_NAME,"
+                         " REL_FIELDS.RDB$FIELD_NAME,"
+                         " FIELD_SPEC.RDB$FIELD_PRECISION"
                          " FROM RDB$FIELDS FIELD_SPEC,"
                          " RDB$RELATION_FIELDS REL_FIELDS"
                          " WHERE"
                          " FIELD_SPEC.RDB$FIELD_NAME ="
                          " REL_FIELDS.RDB$FIELD_SOURCE"
-                         " AND REL_FIELDS.RDB$RELATION_NAME = ?"
-                         " AND REL_FIELDS.RDB$FIELD_NAME = ?",
-                         (p3fix(sqlvar.relname,self._python_charset),
-                          p3fix(sqlvar.sqlname,self._python_charset)))
-        result = self.__ic.fetchone()
-        self.__ic.close()
-        if result:
-            self.__precision_cache[(sqlvar.relname,sqlvar.sqlname)] = result[0]
-            return result[0]
-        # Next, try stored procedure output parameter
-        self.__ic.execute("SELECT FIELD_SPEC.RDB$FIELD_PRECISION"
+                         " AND (" + fields + ")"
+                         " UNION ALL"
+                         " SELECT 2, REL_FIELDS.RDB$PROCEDURE_NAME,"
+                         " REL_FIELDS.RDB$PARAMETER_NAME,"
+                         " FIELD_SPEC.RDB$FIELD_PRECISION"
                          " FROM RDB$FIELDS FIELD_SPEC,"
                          " RDB$PROCEDURE_PARAMETERS REL_FIELDS"
                          " WHERE"
                          " FIELD_SPEC.RDB$FIELD_NAME ="
                          " REL_FIELDS.RDB$FIELD_SOURCE"
-                         " AND RDB$PROCEDURE_NAME = ?"
-                         " AND RDB$PARAMETER_NAME = ?"
-                         " AND RDB$PARAMETER_TYPE = 1",
-                         (p3fix(sqlvar.relname,self._python_charset),
-                          p3fix(sqlvar.sqlname,self._python_charset)))
-        result = self.__ic.fetchone()
+                         " AND REL_FIELDS.RDB$PARAMETER_TYPE = 1"
+                         " AND (" + parameters + ")",
+                         params * 2)
+        found = {}
+        for source, relation, field, precision in self.__ic.fetchall():
+            key = (relation.rstrip(), field.rstrip())
+            if source == 1 or key not in found:
+                found[key] = precision
         self.__ic.close()
-        if result:
-            self.__precision_cache[(sqlvar.relname,sqlvar.sqlname)] = result[0]
-            return result[0]
-        # We ran out of options
-        return 0
+        return found
     def drop_database(self):
         """Drops the database to which this connection is attached.
 
@@ -1564,6 +1823,7 @@ class Connection(object):
         """
         self.__ensure_group_membership(False, "Cannot close a connection that"
                                        " is a member of a ConnectionGroup.")
+        self.__invalidated = False
         self.__close()
     def begin(self, tpb=None):
         """Starts a transaction explicitly.
@@ -1643,6 +1903,7 @@ class Connection(object):
         :param event_names: A sequence of string event names.
         :returns: An :class:`EventConduit` instance.
         """
+        self._ensure_attached()
         conduit = EventConduit(self._db_handle,event_names)
         self.__conduits.append(conduit)
         return conduit
@@ -1690,6 +1951,9 @@ class Connection(object):
     schema = utils.LateBindingProperty(_get_schema)
     #: (Read Only) (float) On-Disk Structure (ODS) version.
     ods = property(__get_ods)
+    #: (Read Only) :class:`StatementCache` with idle prepared statements created
+    #: by :meth:`Cursor.execute` on cursors of this connection.
+    statement_cache = property(__get_statement_cache)
 
 
 @utils.embed_attributes(schema.Schema,'schema')
@@ -1751,6 +2015,7 @@ class EventBlock(object):
 
         self.__results = RESULT_VECTOR(0)
         self.__closed = False
+        self.__generation = _fork_generation
         self.__callback = ISC_EVENT_CALLBACK(callback)
 
         self.event_buf = ctypes.pointer(ISC_UCHAR(0))
@@ -1792,8 +2057,11 @@ class EventBlock(object):
     def close(self):
         "Close this block canceling managed events."
         if not self.closed:
-            api.isc_cancel_events(self._isc_status,self._db_handle,self.event_id)
             self.__closed = True
+            if self.__generation != _fork_generation:
+                # Events were registered by parent process
+                return
+            api.isc_cancel_events(self._isc_status,self._db_handle,self.event_id)
             del self.__callback
             if db_api_error(self._isc_status):
                 raise exception_from_status(DatabaseError, self._isc_status,
@@ -1848,6 +2116,7 @@ class EventConduit(object):
         self.__events_ready = threading.Event()
         self.__blocks = [[x for x in y if x] for y in izip_longest(*[iter(event_names)]*15)]
         self.__initialized = False
+        self.__listeners = []
 
     def __enter__(self):
         self.begin()
@@ -1867,6 +2136,15 @@ class EventConduit(object):
                         for key,value in events.items():
                             self.__events[key] += value
                         self.__events_ready.set()
+                        if self.__listeners:
+                            counts = {}.fromkeys(self.__event_names,0)
+                            counts.update(events)
+                            for listener in self.__listeners:
+                                try:
+                                    listener(counts.copy())
+                                except Exception:
+                                    # Listener must not stop event processing
+                                    pass
                 elif operation == ibase.OP_DIE:
                     return
 
@@ -1914,6 +2192,16 @@ class EventConduit(object):
         if not self.closed:
             self.__events_ready.wait(timeout)
             return self.__events.copy()
+    def _add_listener(self, listener):
+        """Registers callable that is called with dictionary that maps
+        `event_name -> event_occurrence_count` for each notification received.
+
+        .. important::
+
+           Listener is called from internal event processing thread, so it
+           must be thread-safe and return quickly.
+        """
+        self.__listeners.append(listener)
     def flush(self):
         """Clear any event notifications that have accumulated in the conduit’s
         internal queue.
@@ -1940,6 +2228,203 @@ class EventConduit(object):
     #: (Read Only) (boolean) True if conduit is closed.
     closed = property(__get_closed)
 
+class _ArrayDescriptor(object):
+    """Description of ARRAY column obtained from `isc_array_lookup_bounds2`,
+    together with values derived from it, cached by :class:`Connection`.
+    """
+    __slots__ = ('desc', 'sqlsubtype', 'value_type', 'value_scale',
+                 'value_size', 'dimensions', 'total_num_elements', 'total_size',
+                 'ndarray_dtype', 'ndarray_factor')
+    def __init__(self, desc, sqlsubtype):
+        self.desc = desc
+        self.sqlsubtype = sqlsubtype
+        self.value_type = desc.array_desc_dtype
+        self.value_scale = int.from_bytes(desc.array_desc_scale,
+                                          byteorder="big")
+        self.value_size = desc.array_desc_length
+        if self.value_type in (blr_varying,blr_varying2):
+            self.value_size += 2
+        self.dimensions = []
+        self.total_num_elements = 1
+        for dimension in xrange(desc.array_desc_dimensions):
+            bounds = desc.array_desc_bounds[dimension]
+            self.dimensions.append((bounds.array_bound_upper+1)-bounds.array_bound_lower)
+            self.total_num_elements *= self.dimensions[dimension]
+        self.total_size = self.total_num_elements * self.value_size
+        # NumPy representation of numeric arrays. Scaled integers are
+        # returned as float64 values.
+        self.ndarray_dtype = _ARRAY_NDARRAY_DTYPES.get((self.value_type,
+                                                        self.value_size))
+        if (self.value_type in (blr_short,blr_long,blr_int64)
+            and self.value_scale):
+            self.ndarray_factor = _tenTo[abs(256-self.value_scale)]
+        else:
+            self.ndarray_factor = None
+    def get_slice(self, bounds):
+        """Returns :class:`_ArrayDescriptor` for part of the array delimited
+        by `bounds`, a sequence of (lower, upper) pairs for each dimension.
+        """
+        if len(bounds) != len(self.dimensions):
+            raise ValueError("Incorrect ARRAY slice bounds.")
+        desc = ISC_ARRAY_DESC_V2.from_buffer_copy(self.desc)
+        for dimension, (lower, upper) in enumerate(bounds):
+            declared = self.desc.array_desc_bounds[dimension]
+            if not (declared.array_bound_lower <= lower <= upper
+                    <= declared.array_bound_upper):
+                raise ValueError("Incorrect ARRAY slice bounds.")
+            desc.array_desc_bounds[dimension].array_bound_lower = lower
+            desc.array_desc_bounds[dimension].array_bound_upper = upper
+        return _ArrayDescriptor(desc, self.sqlsubtype)
+
+class _ParameterBuffer(object):
+    """Preallocated data buffer and NULL indicator for single input parameter
+    of :class:`PreparedStatement`.
+
+    SQLVAR is switched between the native data type (with value written into
+    `buf` by `encode` function) and SQL_TEXT (with value copied into `text_buf`
+    that grows when needed) only when value kind changes between executions.
+    """
+    __slots__ = ('sqlvar', 'sqltype', 'sqllen', 'vartype', 'is_string', 'ind',
+                 'buf', 'data', 'encode', 'text_buf', 'text_data', 'text_mode')
+    def __init__(self, sqlvar, sqltype, sqllen, buf, encode):
+        self.sqlvar = sqlvar
+        # Parameters are always declared as nullable
+        self.sqltype = sqltype | 1
+        self.sqllen = sqllen
+        self.vartype = sqltype & ~1
+        self.is_string = self.vartype in (SQL_TEXT, SQL_VARYING)
+        self.ind = ISC_SHORT(0)
+        self.buf = buf
+        self.data = ctypes.cast(ctypes.pointer(buf), buf_pointer)
+        self.encode = encode
+        self.text_buf = None
+        self.text_data = None
+        self.text_mode = False
+        sqlvar.sqlind = ctypes.pointer(self.ind)
+        self.set_native()
+    def set_native(self):
+        "Switches SQLVAR to native data type and buffer."
+        self.sqlvar.sqltype = self.sqltype
+        self.sqlvar.sqllen = self.sqllen
+        self.sqlvar.sqldata = self.data
+        self.text_mode = False
+    def set_text(self, value, size):
+        "Switches SQLVAR to SQL_TEXT and copies string value to text buffer."
+        if self.text_buf is None or size > len(self.text_buf):
+            self.text_buf = ctypes.create_string_buffer(size)
+            self.text_data = ctypes.cast(self.text_buf, buf_pointer)
+            self.sqlvar.sqldata = self.text_data
+        elif not self.text_mode:
+            self.sqlvar.sqldata = self.text_data
+        if not self.text_mode:
+            self.sqlvar.sqltype = SQL_TEXT | 1
+            self.text_mode = True
+        ctypes.memmove(self.text_buf, value, size)
+        self.sqlvar.sqllen = size
+
+
+class StatementCache(object):
+    """LRU cache of idle :class:`PreparedStatement` instances created internally
+    by :meth:`Cursor.execute`, shared by all cursors of single :class:`Connection`.
+
+    Statement is taken out from the cache while it's used by a cursor, and
+    returned back when cursor executes another command or it's closed. When
+    cache is full, least recently used statements are dropped.
+
+    .. important::
+
+       DO NOT create instances of this class directly! Each :class:`Connection`
+       has its own instance available as :attr:`Connection.statement_cache`.
+
+    .. note::
+
+       Cache is cleared automatically when DDL statement is executed via
+       :class:`Cursor` or `execute_immediate()`, and when transaction in
+       which such statement was executed is ended. Statements used by cursors
+       at that time are not returned to the cache.
+    """
+    def __init__(self, maxsize=DEFAULT_STATEMENT_CACHE_SIZE):
+        """
+        :param integer maxsize: Max. number of idle statements kept in cache.
+        """
+        self.__statements = collections.OrderedDict()
+        self.__maxsize = maxsize
+        self.__hits = 0
+        self.__misses = 0
+        self.__evictions = 0
+    def __len__(self):
+        return len(self.__statements)
+    def __contains__(self, operation):
+        return operation in self.__statements
+    def __get_maxsize(self):
+        return self.__maxsize
+    def __set_maxsize(self, value):
+        if not isinstance(value, (IntType, LongType)) or value < 0:
+            raise ProgrammingError("Statement cache size must be non-negative integer.")
+        self.__maxsize = value
+        self.__shrink()
+    def __get_hits(self):
+        return self.__hits
+    def __get_misses(self):
+        return self.__misses
+    def __get_evictions(self):
+        return self.__evictions
+    def __shrink(self):
+        while len(self.__statements) > self.__maxsize:
+            operation, ps = self.__statements.popitem(last=False)
+            self.__evictions += 1
+            ps._close()
+    def _get(self, operation):
+        """Returns idle PreparedStatement for `operation` removed from cache,
+        or None if there is no such statement in cache.
+        """
+        ps = self.__statements.pop(operation, None)
+        if ps is None:
+            self.__misses += 1
+        else:
+            self.__hits += 1
+        return ps
+    def _put(self, ps, metadata_epoch):
+        """Stores idle PreparedStatement to cache. Statement is dropped when
+        cache is disabled, it's a DDL statement, it was prepared by parent
+        process before fork() or before last metadata change (`metadata_epoch`
+        of connection), or cache already holds statement for the same command.
+        """
+        if (self.__maxsize == 0 or not ps._is_current()
+            or ps._metadata_epoch != metadata_epoch
+            or ps.statement_type == isc_info_sql_stmt_ddl
+            or ps.sql in self.__statements):
+            ps._close()
+        else:
+            self.__statements[ps.sql] = ps
+            self.__shrink()
+    def clear(self):
+        """Drops all statements stored in cache.
+
+        :raises DatabaseError: When error is returned by server.
+        """
+        exc = None
+        while self.__statements:
+            operation, ps = self.__statements.popitem()
+            try:
+                ps._close()
+            except Exception as e:
+                exc = exc or e
+        if exc:
+            raise exc
+
+    #: (Read/Write) (integer) Max. number of idle statements kept in cache.
+    #: Zero disables the cache.
+    maxsize = property(__get_maxsize, __set_maxsize)
+    #: (Read Only) (integer) Number of cache lookups that returned prepared statement.
+    hits = property(__get_hits)
+    #: (Read Only) (integer) Number of cache lookups that required new statement
+    #: to be prepared.
+    misses = property(__get_misses)
+    #: (Read Only) (integer) Number of statements dropped because cache was full.
+    evictions = property(__get_evictions)
+
+
 class PreparedStatement(object):
     """Represents a prepared statement, an "inner" database cursor, which is used
     to manage the SQL statement execution and context of a fetch operation.
@@ -1970,9 +2455,11 @@ class PreparedStatement(object):
 
     def __init__(self, operation, cursor, internal=True):
         self.__sql = operation
-        self.__internal = internal
+        # True for statements created by Cursor.execute() that could be
+        # stored in connection's StatementCache.
+        self._cacheable = internal
         if internal:
-            self.cursor = weakref.proxy(cursor, _weakref_callback(self.__cursor_deleted))
+            self._bind_cursor(cursor)
         else:
             self.cursor = cursor
         self._stmt_handle = None
@@ -1989,6 +2476,9 @@ class PreparedStatement(object):
         self.statement_type = None
         self.__streamed_blobs = []
         self.__blob_readers = []
+        self.__array_slices = {}
+        # When True, ARRAY columns are returned as ISC_QUAD array IDs
+        self._raw_arrays = False
         self.__executed = False
         self.__prepared = False
         self.__closed = False
@@ -1996,11 +2486,15 @@ class PreparedStatement(object):
         self.__output_cache = None
         self._last_fetch_status = ISC_STATUS(self.NO_FETCH_ATTEMPTED_YET)
         connection = self.cursor._connection
+        self.__contiguous = connection.contiguous_row_buffer
         self.__charset = connection.charset
         self.__python_charset = connection._python_charset
         self.__sql_dialect = connection.sql_dialect
 
         # allocate statement handle
+        self.__generation = _fork_generation
+        # Metadata epoch of connection, checked when returned to statement cache
+        self._metadata_epoch = connection._metadata_epoch
         self._stmt_handle = isc_stmt_handle(0)
         api.isc_dsql_allocate_statement(self._isc_status,
                                           connection._db_handle,
@@ -2055,6 +2549,7 @@ class PreparedStatement(object):
         # subsequent executions (mind the implicit string conversions!)
         for sqlvar in self._in_sqlda.sqlvar[:self.n_input_params]:
             self._in_sqlda_save.append((sqlvar.sqltype, sqlvar.sqllen))
+        self.__build_input_plan()
         # Init output XSQLDA
         api.isc_dsql_describe(self._isc_status, self._stmt_handle,
                                 self.__sql_dialect,
@@ -2074,11 +2569,21 @@ class PreparedStatement(object):
                     "Error while determining SQL statement output:")
         # The number of output fields the statement produces.
         self.n_output_params = self._out_sqlda.sqld
+        self.__out_sqlda_ptr = ctypes.cast(ctypes.pointer(self._out_sqlda),
+                                           XSQLDA_PTR)
         self.__coerce_XSQLDA(self._out_sqlda)
+        self.__build_fetch_plan()
+        self.__columnar_plan = None
+        self.__text_plan = None
+        self.__lazy_plan = None
+        self.__field_index = None
         self.__prepared = True
         self._name = None
     def __cursor_deleted(self,obj):
         self.cursor = None
+    def _bind_cursor(self, cursor):
+        "Binds internally created statement to (another) Cursor instance."
+        self.cursor = weakref.proxy(cursor, _weakref_callback(self.__cursor_deleted))
     def __get_name(self):
         return self._name
     def __set_name(self,name):
@@ -2196,7 +2701,20 @@ class PreparedStatement(object):
         if not self.__description:
             desc = []
             if self.__prepared and (self._out_sqlda.sqld > 0):
-                for sqlvar in self._out_sqlda.sqlvar[:self._out_sqlda.sqld]:
+                sqlvars = self._out_sqlda.sqlvar[:self._out_sqlda.sqld]
+                # Precision of all fixed-point columns is determined at once
+                fixed = []
+                for i, sqlvar in enumerate(sqlvars):
+                    vartype = sqlvar.sqltype & ~1
+                    if (((vartype in [SQL_SHORT, SQL_LONG, SQL_INT64])
+                         and (sqlvar.sqlsubtype or sqlvar.sqlscale))
+                        or ((vartype in [SQL_FLOAT, SQL_DOUBLE, SQL_D_FLOAT])
+                            and (self.__sql_dialect < 3) and sqlvar.sqlscale)):
+                        fixed.append(i)
+                connection = self.cursor._connection
+                precisions = dict(zip(fixed, connection._determine_fields_precision(
+                    [sqlvars[i] for i in fixed])))
+                for i, sqlvar in enumerate(sqlvars):
                     # Field name (or alias)
                     sqlname = p3fix(sqlvar.sqlname[:sqlvar.sqlname_length],
                                     self.__python_charset)
@@ -2216,7 +2734,7 @@ class PreparedStatement(object):
                                       SQL_INT64]
                           and (sqlvar.sqlsubtype or scale)):
                         vtype = decimal.Decimal
-                        precision = (self.cursor._connection._determine_field_precision(sqlvar))
+                        precision = precisions[i]
                         dispsize = 20
                     elif vartype == SQL_SHORT:
                         vtype = IntType
@@ -2236,7 +2754,7 @@ class PreparedStatement(object):
                         # could be Fixed point
                         if (self.__sql_dialect < 3) and scale:
                             vtype = decimal.Decimal
-                            precision = (self.cursor._connection._determine_field_precision(sqlvar))
+                            precision = precisions[i]
                         else:
                             vtype = FloatType
                         dispsize = 17
@@ -2378,275 +2896,446 @@ class PreparedStatement(object):
             raise ProgrammingError(msg, -802)
     def __coerce_XSQLDA(self, xsqlda):
         """Allocate space for SQLVAR data.
+
+        With contiguous row buffer, data of all columns followed by all NULL
+        indicators are placed into single buffer, each at offset aligned
+        according to its data type.
         """
-        for sqlvar in xsqlda.sqlvar[:self._out_sqlda.sqld]:
-            if sqlvar.sqltype & 1:
-                sqlvar.sqlind = ctypes.pointer(ISC_SHORT(0))
-            vartype = sqlvar.sqltype & ~1
-            if vartype in [SQL_TEXT, SQL_VARYING]:
-                sqlvar.sqldata = ctypes.create_string_buffer(sqlvar.sqllen + 2)
-            elif vartype == SQL_SHORT:
-                sqlvar.sqldata = ctypes.cast(ctypes.create_string_buffer(
-                    sqlvar.sqllen),buf_pointer)
-            elif vartype == SQL_LONG:
-                sqlvar.sqldata = ctypes.cast(ctypes.create_string_buffer(
-                    sqlvar.sqllen),buf_pointer)
-            elif vartype == SQL_BOOLEAN:
-                sqlvar.sqldata = ctypes.cast(ctypes.create_string_buffer(
-                    sqlvar.sqllen),buf_pointer)
-            elif vartype == SQL_INT64:
-                sqlvar.sqldata = ctypes.cast(ctypes.create_string_buffer(
-                    sqlvar.sqllen),buf_pointer)
-            elif vartype == SQL_FLOAT:
-                sqlvar.sqldata = ctypes.cast(ctypes.create_string_buffer(
-                    sqlvar.sqllen),buf_pointer)
-            elif vartype == SQL_DOUBLE:
-                sqlvar.sqldata = ctypes.cast(ctypes.create_string_buffer(
-                    sqlvar.sqllen),buf_pointer)
-            elif vartype == SQL_D_FLOAT:
-                sqlvar.sqldata = ctypes.cast(ctypes.create_string_buffer(
-                    sqlvar.sqllen),buf_pointer)
-            elif vartype == SQL_BLOB:
-                sqlvar.sqldata = ctypes.cast(ctypes.create_string_buffer(
-                    sqlvar.sqllen),buf_pointer)
-            elif vartype == SQL_TIMESTAMP:
-                sqlvar.sqldata = ctypes.cast(ctypes.create_string_buffer(
-                    sqlvar.sqllen),buf_pointer)
-            elif vartype == SQL_TYPE_DATE:
-                sqlvar.sqldata = ctypes.cast(ctypes.create_string_buffer(
-                    sqlvar.sqllen),buf_pointer)
-            elif vartype == SQL_TYPE_TIME:
-                sqlvar.sqldata = ctypes.cast(ctypes.create_string_buffer(
-                    sqlvar.sqllen),buf_pointer)
-            elif vartype == SQL_ARRAY:
-                sqlvar.sqldata = ctypes.cast(ctypes.create_string_buffer(
-                    sqlvar.sqllen),buf_pointer)
+        self.__out_buffers = []
+        self.__out_indicators = []
+        self.__row_buffer = None
+        sqlvars = xsqlda.sqlvar[:self._out_sqlda.sqld]
+        if self.__contiguous and sqlvars:
+            offset = 0
+            data_offsets = []
+            for sqlvar in sqlvars:
+                vartype = sqlvar.sqltype & ~1
+                align = _DATA_ALIGNMENT.get(vartype, 1)
+                offset += -offset % align
+                data_offsets.append(offset)
+                if vartype in [SQL_TEXT, SQL_VARYING]:
+                    offset += sqlvar.sqllen + 2
+                else:
+                    offset += sqlvar.sqllen
+            ind_offsets = []
+            for sqlvar in sqlvars:
+                if sqlvar.sqltype & 1:
+                    offset += offset % 2
+                    ind_offsets.append(offset)
+                    offset += 2
+                else:
+                    ind_offsets.append(None)
+            buf = ctypes.create_string_buffer(offset)
+            address = ctypes.addressof(buf)
+            for sqlvar, data_offset, ind_offset in zip(sqlvars, data_offsets,
+                                                       ind_offsets):
+                if ind_offset is None:
+                    ind = None
+                else:
+                    ind = ISC_SHORT.from_buffer(buf, ind_offset)
+                    sqlvar.sqlind = ctypes.pointer(ind)
+                sqlvar.sqldata = ctypes.cast(address + data_offset, buf_pointer)
+                self.__out_buffers.append((buf, data_offset))
+                self.__out_indicators.append((ind, ind_offset))
+            self.__row_buffer = buf
+        else:
+            for sqlvar in sqlvars:
+                if sqlvar.sqltype & 1:
+                    ind = ISC_SHORT(0)
+                    sqlvar.sqlind = ctypes.pointer(ind)
+                else:
+                    ind = None
+                vartype = sqlvar.sqltype & ~1
+                if vartype in [SQL_TEXT, SQL_VARYING]:
+                    buf = ctypes.create_string_buffer(sqlvar.sqllen + 2)
+                else:
+                    buf = ctypes.create_string_buffer(sqlvar.sqllen)
+                sqlvar.sqldata = ctypes.cast(buf, buf_pointer)
+                self.__out_buffers.append((buf, 0))
+                self.__out_indicators.append((ind, None))
+    def __get_column_decoder(self, sqlvar):
+        """Returns (struct format, converter) pair for output column.
+
+        Converter is called with values unpacked from column data buffer using
+        the format. None converter means that the first unpacked value is used
+        as is.
+        """
+        vartype = sqlvar.sqltype & ~1
+        scale = sqlvar.sqlscale
+        subtype = sqlvar.sqlsubtype
+        sqllen = sqlvar.sqllen
+        charset = self.__python_charset
+        decode = ((self.__charset or PYTHON_MAJOR_VER == 3)
+                  and subtype != 1)   # non OCTETS
+        if vartype == SQL_TEXT:
+            # CHAR with multibyte encoding requires special handling
+            if subtype in (ibase.CHARSET_UTF_8, None):
+                reallength = sqllen // 4
+            elif subtype == ibase.CHARSET_UNICODE_FSS:
+                reallength = sqllen // 3
+            elif subtype in (
+                ibase.CHARSET_BIG_5,
+                ibase.CHARSET_EUCJ_0208,
+                ibase.CHARSET_GB_2312,
+                ibase.CHARSET_KSC_5601,
+                ibase.CHARSET_SJIS_0208,
+                ibase.CHARSET_UNICODE_BE,
+                ibase.CHARSET_UNICODE_LE
+            ):
+                reallength = sqllen // 2
             else:
-                pass
+                reallength = sqllen
+            if decode:
+                def convert(value):
+                    return value.decode(charset)[:reallength]
+            elif reallength < sqllen:
+                def convert(value):
+                    return value[:reallength]
+            else:
+                convert = None
+            return ('%ds' % sqllen, convert)
+        elif vartype == SQL_VARYING:
+            if decode:
+                def convert(size, value):
+                    return value[:size].decode(charset)
+            else:
+                def convert(size, value):
+                    return value[:size]
+            return ('<H%ds' % sqllen, convert)
+        elif vartype in [SQL_SHORT, SQL_LONG, SQL_INT64]:
+            fmt = {2: '<h', 4: '<l', 8: '<q'}[sqllen]
+            # It's scalled integer?
+            if (subtype or scale):
+                divisor = _tenTo[abs(scale)]
+                def convert(value):
+                    return decimal.Decimal(value) / divisor
+                return (fmt, convert)
+            return (fmt, None)
+        elif vartype == SQL_BOOLEAN:
+            return ('<h', bool)
+        elif vartype == SQL_TYPE_DATE:
+            def convert(value):
+                return _date_fromordinal(value + _IB_DATE_ORDINAL)
+            return ('<l', convert)
+        elif vartype == SQL_TYPE_TIME:
+            def convert(value):
+                s = value // 10000
+                m = s // 60
+                return datetime.time(m // 60, m % 60, s % 60,
+                                     (value % 10000) * 100)
+            return ('<l', convert)
+        elif vartype == SQL_TIMESTAMP:
+            def convert(days, ticks):
+                return _IB_TIMESTAMP_BASE + datetime.timedelta(days, 0,
+                                                               ticks * 100)
+            return ('<ll', convert)
+        elif vartype == SQL_FLOAT:
+            return ('f', None)
+        elif vartype == SQL_DOUBLE:
+            return ('d', None)
+        elif vartype in [SQL_BLOB, SQL_ARRAY]:
+            # Converter must not hold strong reference to the statement
+            ps = weakref.proxy(self)
+            if vartype == SQL_BLOB:
+                name = p3fix(sqlvar.aliasname[:sqlvar.aliasname_length],
+                             self.__python_charset)
+                def convert(high, low):
+                    return ps.__read_blob(ISC_QUAD(high, low), subtype, name)
+            else:
+                relname = sqlvar.relname
+                sqlname = sqlvar.sqlname
+                name = p3fix(sqlvar.aliasname[:sqlvar.aliasname_length],
+                             self.__python_charset)
+                def convert(high, low):
+                    return ps.__read_array(ISC_QUAD(high, low), relname,
+                                           sqlname, name)
+            return ('<LL', convert)
+        else:
+            def convert():
+                return '<NOT_IMPLEMENTED>'
+            return ('', convert)
+    def __build_fetch_plan(self):
+        """Prepares (data buffer, offset, indicator, unpack, converter) tuple
+        for each output column, used to move data from output XSQLDA to result
+        tuple.
+
+        For contiguous row buffer it also prepares single `struct.Struct` that
+        unpacks whole row (data followed by NULL indicators), and (start, end,
+        converter, indicator position) tuple for each column that describes
+        its part of unpacked row.
+        """
+        plan = []
+        row_plan = []
+        row_fmt = ['<']
+        pos = 0
+        nvalues = 0
+        for i in xrange(self._out_sqlda.sqld):
+            fmt, convert = self.__get_column_decoder(self._out_sqlda.sqlvar[i])
+            column_struct = struct.Struct(fmt)
+            buf, offset = self.__out_buffers[i]
+            plan.append((buf, offset, self.__out_indicators[i][0],
+                         column_struct.unpack_from, convert))
+            if self.__row_buffer is not None:
+                count = len(column_struct.unpack(bytes(column_struct.size)))
+                row_fmt.append('%dx%s' % (offset - pos, fmt.lstrip('<')))
+                pos = offset + column_struct.size
+                row_plan.append([nvalues, nvalues + count, convert, None])
+                nvalues += count
+        self.__fetch_plan = plan
+        self.__row_plan = None
+        self.__row_unpack = None
+        if self.__row_buffer is not None:
+            for i in xrange(len(plan)):
+                ind_offset = self.__out_indicators[i][1]
+                if ind_offset is not None:
+                    row_fmt.append('%dxh' % (ind_offset - pos))
+                    pos = ind_offset + 2
+                    row_plan[i][3] = nvalues
+                    nvalues += 1
+            self.__row_plan = [tuple(item) for item in row_plan]
+            self.__row_unpack = struct.Struct(''.join(row_fmt)).unpack_from
     def __XSQLDA2Tuple(self, xsqlda):
         """Move data from output XSQLDA to result tuple.
         """
         values = []
-        for sqlvar in xsqlda.sqlvar[:xsqlda.sqld]:
-            value = '<NOT_IMPLEMENTED>'
-            vartype = sqlvar.sqltype & ~1
-            scale = sqlvar.sqlscale
-            # NULL handling
-            if ((sqlvar.sqltype & 1) != 0) and (bool(sqlvar.sqlind)
-                                                and sqlvar.sqlind.contents.value < 0):
-                value = None
-            elif vartype == SQL_TEXT:
-                value = ctypes.string_at(sqlvar.sqldata,sqlvar.sqllen)
-                #value = sqlvar.sqldata[:sqlvar.sqllen]
-                ### Todo: verify handling of P version differences
-                if ((self.__charset or PYTHON_MAJOR_VER == 3)
-                    and sqlvar.sqlsubtype != 1):   # non OCTETS
-                    value = b2u(value,self.__python_charset)
-                # CHAR with multibyte encoding requires special handling
-                if sqlvar.sqlsubtype in (ibase.CHARSET_UTF_8, None):
-                    reallength = sqlvar.sqllen // 4
-                elif sqlvar.sqlsubtype == ibase.CHARSET_UNICODE_FSS:
-                    reallength = sqlvar.sqllen // 3
-                elif sqlvar.sqlsubtype in (
-                    ibase.CHARSET_BIG_5,
-                    ibase.CHARSET_EUCJ_0208,
-                    ibase.CHARSET_GB_2312,
-                    ibase.CHARSET_KSC_5601,
-                    ibase.CHARSET_SJIS_0208,
-                    ibase.CHARSET_UNICODE_BE,
-                    ibase.CHARSET_UNICODE_LE
-                ):
-                    reallength = sqlvar.sqllen // 2
+        append = values.append
+        if self.__row_plan is not None:
+            row = self.__row_unpack(self.__row_buffer)
+            for start, end, convert, ind_pos in self.__row_plan:
+                if ind_pos is None:
+                    flag = 0
                 else:
-                    reallength = sqlvar.sqllen
-                value = value[:reallength]
-            elif vartype == SQL_VARYING:
-                size = bytes_to_uint(sqlvar.sqldata[:2])
-                #value = ctypes.string_at(sqlvar.sqldata[2],2+size)
-                ### Todo: verify handling of P version differences
-                if PYTHON_MAJOR_VER == 3:
-                    value = bytes(sqlvar.sqldata[2:2 + size])
+                    flag = row[ind_pos]
+                    # NULL handling
+                    if flag < 0:
+                        append(None)
+                        continue
+                if convert is None:
+                    value = row[start]
                 else:
-                    value = str(sqlvar.sqldata[2:2 + size])
-                if ((self.__charset or PYTHON_MAJOR_VER == 3)
-                    and sqlvar.sqlsubtype != 1):   # non OCTETS
-                    value = b2u(value,self.__python_charset)
-            elif vartype in [SQL_SHORT, SQL_LONG, SQL_INT64]:
-                value = bytes_to_int(sqlvar.sqldata[:sqlvar.sqllen])
-                # It's scalled integer?
-                if (sqlvar.sqlsubtype or scale):
-                    value = decimal.Decimal(value) / _tenTo[abs(scale)]
-            elif vartype == SQL_BOOLEAN:
-                value = bool(bytes_to_bool(sqlvar.sqldata[:sqlvar.sqllen]))
-            elif vartype == SQL_TYPE_DATE:
-                yyyy, mm, dd = self._parse_date(sqlvar.sqldata[:sqlvar.sqllen])
-                value = datetime.date(yyyy, mm, dd)
-            elif vartype == SQL_TYPE_TIME:
-                h, m, s, ms = self._parse_time(sqlvar.sqldata[:sqlvar.sqllen])
-                value = datetime.time(h, m, s, ms)
-            elif vartype == SQL_TIMESTAMP:
-                yyyy, mm, dd = self._parse_date(sqlvar.sqldata[:4])
-                h, m, s, ms = self._parse_time(sqlvar.sqldata[4:sqlvar.sqllen])
-                value = datetime.datetime(yyyy, mm, dd, h, m, s, ms)
-            elif vartype == SQL_FLOAT:
-                value = struct.unpack('f', sqlvar.sqldata[:sqlvar.sqllen])[0]
-            elif vartype == SQL_DOUBLE:
-                value = struct.unpack('d', sqlvar.sqldata[:sqlvar.sqllen])[0]
-            elif vartype == SQL_BLOB:
-                val = sqlvar.sqldata[:sqlvar.sqllen]
-                blobid = ISC_QUAD(bytes_to_uint(val[:4]),
-                                        bytes_to_uint(val[4:sqlvar.sqllen]))
-                # Check if stream BLOB is requested instead materialized one
-                use_stream = False
-                if self.__streamed_blobs:
-                    # Get the BLOB name
-                    sqlname = p3fix(sqlvar.sqlname[:sqlvar.sqlname_length],
-                                    self.__python_charset)
-                    alias = p3fix(sqlvar.aliasname[:sqlvar.aliasname_length],
-                                  self.__python_charset)
-                    if alias != sqlname:
-                        sqlname = alias
-                    if sqlname in self.__streamed_blobs:
-                        use_stream = True
-                if use_stream:
-                    # Stream BLOB
-                    value = BlobReader(blobid,self.cursor._connection._db_handle,
-                                       self.cursor._transaction._tr_handle,
-                                       sqlvar.sqlsubtype == 1,
-                                       self.__charset)
-                    self.__blob_readers.append(value)
-                else:
-                    # Materialized BLOB
-                    blob_handle = isc_blob_handle()
-                    api.isc_open_blob2(self._isc_status,
-                                         self.cursor._connection._db_handle,
-                                         self.cursor._transaction._tr_handle,
-                                         blob_handle, blobid, 0, None)
-                    if db_api_error(self._isc_status):
-                        raise exception_from_status(DatabaseError,
-                                                    self._isc_status,
-                                                    "Cursor.read_output_blob/isc_open_blob2:")
-                    # Get BLOB total length and max. size of segment
-                    result = ctypes.cast(ctypes.create_string_buffer(20),
-                                         buf_pointer)
-                    api.isc_blob_info(self._isc_status, blob_handle, 2,
-                                        bs([isc_info_blob_total_length,
-                                            isc_info_blob_max_segment]),
-                                        20, result)
-                    if db_api_error(self._isc_status):
-                        raise exception_from_status(DatabaseError,
-                                                    self._isc_status,
-                                                    "Cursor.read_output_blob/isc_blob_info:")
-                    offset = 0
-                    while bytes_to_uint(result[offset]) != isc_info_end:
-                        code = bytes_to_uint(result[offset])
-                        offset += 1
-                        if code == isc_info_blob_total_length:
-                            length = bytes_to_uint(result[offset:offset + 2])
-                            blob_length = bytes_to_uint(result[
-                                offset + 2:offset + 2 + length])
-                            offset += length + 2
-                        elif code == isc_info_blob_max_segment:
-                            length = bytes_to_uint(result[offset:offset + 2])
-                            segment_size = bytes_to_uint(result[
-                                offset + 2:offset + 2 + length])
-                            offset += length + 2
-                    # Load BLOB
-                    allow_incomplete_segment_read = False
-                    status = ISC_STATUS(0)
-                    blob = ctypes.create_string_buffer(blob_length)
-                    bytes_read = 0
-                    bytes_actually_read = ctypes.c_ushort(0)
-                    while bytes_read < blob_length:
-                        status = api.isc_get_segment(self._isc_status,
-                                                       blob_handle,
-                                                       bytes_actually_read,
-                                                       min(segment_size,
-                                                           blob_length - bytes_read),
-                                                       ctypes.byref(
-                                                           blob, bytes_read))
-                        if status != 0:
-                            if ((status == isc_segment)
-                                and allow_incomplete_segment_read):
-                                bytes_read += bytes_actually_read.value
-                            else:
-                                raise exception_from_status(DatabaseError,
-                                                            self._isc_status,
-                                                            "Cursor.read_output_blob/isc_get_segment:")
-                        else:
-                            bytes_read += bytes_actually_read.value
-                    # Finish
-                    api.isc_close_blob(self._isc_status, blob_handle)
-                    if db_api_error(self._isc_status):
-                        raise exception_from_status(DatabaseError,
-                                                    self._isc_status,
-                                                    "Cursor.read_otput_blob/isc_close_blob:")
-                    value = blob.raw
-                    if ((self.__charset or PYTHON_MAJOR_VER == 3)
-                        and sqlvar.sqlsubtype == 1):
-                        value = b2u(value,self.__python_charset)
-            elif vartype == SQL_ARRAY:
-                value = []
-                val = sqlvar.sqldata[:sqlvar.sqllen]
-                arrayid = ISC_QUAD(bytes_to_uint(val[:4]),
-                                        bytes_to_uint(val[4:sqlvar.sqllen]))
-                arraydesc = ISC_ARRAY_DESC_V2(0)
-                sqlsubtype = self.cursor._connection._get_array_sqlsubtype(sqlvar.relname,
-                                                                           sqlvar.sqlname)
-                api.isc_array_lookup_bounds2(self._isc_status,
-                                              self.cursor._connection._db_handle,
-                                              self.cursor._transaction._tr_handle,
-                                              sqlvar.relname,
-                                              sqlvar.sqlname,
-                                              arraydesc)
-                if db_api_error(self._isc_status):
-                    raise exception_from_status(DatabaseError,
-                                                self._isc_status,
-                                                "Cursor.read_otput_array/isc_array_lookup_bounds2:")
-                value_type = arraydesc.array_desc_dtype
-                value_scale = int.from_bytes(arraydesc.array_desc_scale, byteorder="big")
-                value_size = arraydesc.array_desc_length
-                if value_type in (blr_varying,blr_varying2):
-                    value_size += 2
-                dimensions = []
-                total_num_elements = 1
-                for dimension in xrange(arraydesc.array_desc_dimensions):
-                    bounds = arraydesc.array_desc_bounds[dimension]
-                    dimensions.append((bounds.array_bound_upper+1)-bounds.array_bound_lower)
-                    total_num_elements *= dimensions[dimension]
-                total_size = total_num_elements * value_size
-                buf = ctypes.create_string_buffer(total_size)
-                value_buffer = ctypes.cast(buf,
-                                           buf_pointer)
-                tsize = ISC_LONG(total_size)
-                api.isc_array_get_slice2(self._isc_status,
-                                          self.cursor._connection._db_handle,
-                                          self.cursor._transaction._tr_handle,
-                                          arrayid, arraydesc,
-                                          value_buffer, tsize)
-                if db_api_error(self._isc_status):
-                    raise exception_from_status(DatabaseError,
-                                                self._isc_status,
-                                                "Cursor.read_otput_array/isc_array_get_slice2:")
-
-                (value,bufpos) = self.__extract_db_array_to_list(value_size,
-                                                                 value_type,
-                                                                 sqlsubtype,
-                                                                 value_scale,
-                                                                 0, dimensions,
-                                                                 value_buffer,0)
-
+                    value = convert(*row[start:end])
+                # Change view. If subscription is active, all changed records
+                # will be returned with the appropriate sqlind variable
+                if flag & _SQLIND_CHANGES:
+                    value = [value, flag]
+                append(value)
+            return tuple(values)
+        for buf, offset, ind, unpack, convert in self.__fetch_plan:
+            if ind is None:
+                flag = 0
+            else:
+                flag = ind.value
+                # NULL handling
+                if flag < 0:
+                    append(None)
+                    continue
+            if convert is None:
+                value = unpack(buf, offset)[0]
+            else:
+                value = convert(*unpack(buf, offset))
             # Change view. If subscription is active, all changed records
             # will be returned with the appropriate sqlind variable
-            if ((sqlvar.sqltype & 1) != 0) and (bool(sqlvar.sqlind)
-                                                and sqlvar.sqlind.contents.value >= 0):
-                sqlind = sqlvar.sqlind.contents.value & ~SQLIND_NULL
-                if sqlind & SQLIND_UPDATE or sqlind & SQLIND_INSERT or sqlind & SQLIND_DELETE:
-                    value = [value, sqlind]
-
-            values.append(value)
-
+            if flag & _SQLIND_CHANGES:
+                value = [value, flag]
+            append(value)
         return tuple(values)
+    def _get_field_index(self):
+        "Returns :class:`_FieldIndex` for current :attr:`description`."
+        description = self.description
+        if (self.__field_index is None
+            or self.__field_index.description is not description):
+            self.__field_index = _FieldIndex(description)
+        return self.__field_index
+    def __get_lazy_plan(self):
+        """Returns :class:`_LazyRowPlan` that describes position of each output
+        column in row snapshot taken by :meth:`_fetchone_lazy`.
+        """
+        if self.__lazy_plan is None:
+            columns = []
+            if self.__row_buffer is not None:
+                # Snapshot is a copy of contiguous row buffer
+                for (buf, offset, ind, unpack, convert), (ind, ind_offset) in zip(self.__fetch_plan,
+                                                                                 self.__out_indicators):
+                    columns.append((offset, unpack, convert, ind_offset))
+            else:
+                # Snapshot is concatenation of data buffers followed by
+                # NULL indicators
+                pos = 0
+                for buf, offset, ind, unpack, convert in self.__fetch_plan:
+                    columns.append([pos, unpack, convert, None])
+                    pos += ctypes.sizeof(buf)
+                for column, (ind, ind_offset) in zip(columns, self.__out_indicators):
+                    if ind is not None:
+                        column[3] = pos
+                        pos += ctypes.sizeof(ind)
+                columns = [tuple(column) for column in columns]
+            self.__lazy_plan = _LazyRowPlan(columns, self._get_field_index())
+        return self.__lazy_plan
+    def __get_blob_reader(self, blobid, subtype):
+        value = BlobReader(blobid,self.cursor._connection._db_handle,
+                           self.cursor._transaction._tr_handle,
+                           subtype == 1,
+                           self.__charset)
+        self.__blob_readers.append(value)
+        return value
+    def __read_blob(self, blobid, subtype, name):
+        """Returns value of BLOB column, either materialized or as
+        :class:`BlobReader` when stream BLOB is requested or BLOB is larger
+        than `blob_stream_threshold`.
+        """
+        # Check if stream BLOB is requested instead materialized one
+        if name in self.__streamed_blobs:
+            # Stream BLOB
+            return self.__get_blob_reader(blobid, subtype)
+        threshold = self.cursor.blob_stream_threshold
+        if threshold is None:
+            threshold = self.cursor._connection.blob_stream_threshold
+        # Materialized BLOB
+        blob_handle = isc_blob_handle()
+        api.isc_open_blob2(self._isc_status,
+                             self.cursor._connection._db_handle,
+                             self.cursor._transaction._tr_handle,
+                             blob_handle, blobid, 0, None)
+        if db_api_error(self._isc_status):
+            raise exception_from_status(DatabaseError,
+                                        self._isc_status,
+                                        "Cursor.read_output_blob/isc_open_blob2:")
+        # Get BLOB total length and max. size of segment
+        result = ctypes.cast(ctypes.create_string_buffer(20),
+                             buf_pointer)
+        api.isc_blob_info(self._isc_status, blob_handle, 2,
+                            bs([isc_info_blob_total_length,
+                                isc_info_blob_max_segment]),
+                            20, result)
+        if db_api_error(self._isc_status):
+            raise exception_from_status(DatabaseError,
+                                        self._isc_status,
+                                        "Cursor.read_output_blob/isc_blob_info:")
+        offset = 0
+        while bytes_to_uint(result[offset]) != isc_info_end:
+            code = bytes_to_uint(result[offset])
+            offset += 1
+            if code == isc_info_blob_total_length:
+                length = bytes_to_uint(result[offset:offset + 2])
+                blob_length = bytes_to_uint(result[
+                    offset + 2:offset + 2 + length])
+                offset += length + 2
+            elif code == isc_info_blob_max_segment:
+                length = bytes_to_uint(result[offset:offset + 2])
+                segment_size = bytes_to_uint(result[
+                    offset + 2:offset + 2 + length])
+                offset += length + 2
+        if threshold is not None and blob_length > threshold:
+            # Too big, return BlobReader instead
+            api.isc_close_blob(self._isc_status, blob_handle)
+            if db_api_error(self._isc_status):
+                raise exception_from_status(DatabaseError,
+                                            self._isc_status,
+                                            "Cursor.read_otput_blob/isc_close_blob:")
+            return self.__get_blob_reader(blobid, subtype)
+        # Load BLOB
+        allow_incomplete_segment_read = False
+        status = ISC_STATUS(0)
+        blob = ctypes.create_string_buffer(blob_length)
+        bytes_read = 0
+        bytes_actually_read = ctypes.c_ushort(0)
+        while bytes_read < blob_length:
+            status = api.isc_get_segment(self._isc_status,
+                                           blob_handle,
+                                           bytes_actually_read,
+                                           min(segment_size,
+                                               blob_length - bytes_read),
+                                           ctypes.byref(
+                                               blob, bytes_read))
+            if status != 0:
+                if ((status == isc_segment)
+                    and allow_incomplete_segment_read):
+                    bytes_read += bytes_actually_read.value
+                else:
+                    raise exception_from_status(DatabaseError,
+                                                self._isc_status,
+                                                "Cursor.read_output_blob/isc_get_segment:")
+            else:
+                bytes_read += bytes_actually_read.value
+        # Finish
+        api.isc_close_blob(self._isc_status, blob_handle)
+        if db_api_error(self._isc_status):
+            raise exception_from_status(DatabaseError,
+                                        self._isc_status,
+                                        "Cursor.read_otput_blob/isc_close_blob:")
+        value = blob.raw
+        if ((self.__charset or PYTHON_MAJOR_VER == 3)
+            and subtype == 1):
+            value = b2u(value,self.__python_charset)
+        return value
+    def __read_array(self, arrayid, relname, sqlname, name):
+        """Returns value of ARRAY column (or its slice requested by
+        :meth:`set_array_slice`) as (nested) list or `numpy.ndarray`.
+        """
+        if self._raw_arrays:
+            return arrayid
+        desc = self.cursor._connection._get_array_descriptor(relname, sqlname,
+                                                             self.cursor._transaction._tr_handle)
+        if name in self.__array_slices:
+            bounds, cached = self.__array_slices[name]
+            if cached is None or cached[0] is not desc:
+                cached = (desc, desc.get_slice(bounds))
+                self.__array_slices[name] = (bounds, cached)
+            desc = cached[1]
+        arraydesc = desc.desc
+        sqlsubtype = desc.sqlsubtype
+        value_type = desc.value_type
+        value_scale = desc.value_scale
+        value_size = desc.value_size
+        dimensions = desc.dimensions
+        total_size = desc.total_size
+        as_ndarray = self.cursor.arrays_as_ndarray
+        if as_ndarray is None:
+            as_ndarray = self.cursor._connection.arrays_as_ndarray
+        if as_ndarray and desc.ndarray_dtype:
+            numpy = _import_numpy("arrays_as_ndarray")
+            value = numpy.empty(dimensions, dtype=desc.ndarray_dtype)
+            self.__get_array_slice(arrayid, arraydesc, value.ctypes.data,
+                                   total_size)
+            if desc.ndarray_factor:
+                value = value / desc.ndarray_factor
+            return value
+        buf = ctypes.create_string_buffer(total_size)
+        value_buffer = ctypes.cast(buf,
+                                   buf_pointer)
+        self.__get_array_slice(arrayid, arraydesc, value_buffer, total_size)
+        (value,bufpos) = self.__extract_db_array_to_list(value_size,
+                                                         value_type,
+                                                         sqlsubtype,
+                                                         value_scale,
+                                                         0, dimensions,
+                                                         value_buffer,0)
+        return value
+    def __get_array_slice(self, arrayid, arraydesc, buffer, size):
+        """Reads ARRAY data described by `arraydesc` into `buffer`.
+        """
+        api.isc_array_get_slice2(self._isc_status,
+                                  self.cursor._connection._db_handle,
+                                  self.cursor._transaction._tr_handle,
+                                  arrayid, arraydesc,
+                                  buffer, ISC_LONG(size))
+        if db_api_error(self._isc_status):
+            raise exception_from_status(DatabaseError,
+                                        self._isc_status,
+                                        "Cursor.read_otput_array/isc_array_get_slice2:")
+    def __put_array_slice(self, arrayid, arraydesc, buffer, size):
+        """Writes ARRAY data described by `arraydesc` from `buffer`.
+        """
+        api.isc_array_put_slice2(self._isc_status,
+                                  self.cursor._connection._db_handle,
+                                  self.cursor._transaction._tr_handle,
+                                  ctypes.pointer(arrayid), arraydesc,
+                                  buffer,
+                                  ISC_LONG(size))
+        if db_api_error(self._isc_status):
+            raise exception_from_status(DatabaseError,
+                                        self._isc_status,
+                                        "Cursor.read_otput_array/isc_array_put_slice2:")
     def __extract_db_array_to_list(self,esize,dtype,subtype,scale,dim,dimensions,
                                    buf,bufpos):
         """Extracts ARRRAY column data from buffer to Python list(s).
@@ -2851,229 +3540,279 @@ class PreparedStatement(object):
             if not ok:
                 return False
         return ok
+    def __get_parameter_encoder(self, sqlvar, vartype, sqllen):
+        """Returns function that writes non-string value of input parameter
+        into preallocated data buffer.
+        """
+        scale = sqlvar.sqlscale
+        subtype = sqlvar.sqlsubtype
+        if vartype in [SQL_SHORT, SQL_LONG, SQL_INT64]:
+            pack_into = struct.Struct({2: '<h', 4: '<l', 8: '<q'}[sqllen]).pack_into
+            vmin, vmax = {SQL_SHORT: (SHRT_MIN, SHRT_MAX),
+                          SQL_LONG: (INT_MIN, INT_MAX),
+                          SQL_INT64: (LONG_MIN, LONG_MAX)}[vartype]
+            dialect = self.__sql_dialect
+            ps = weakref.proxy(self)
+            # It's scalled integer?
+            scaled = bool(subtype or scale)
+            factor = _tenTo[abs(scale)]
+            def encode(value, buf):
+                if scaled:
+                    if isinstance(value, decimal.Decimal):
+                        value = int((value * factor).to_integral())
+                    elif isinstance(value, (int, mylong, float,)):
+                        value = int(value * factor)
+                    else:
+                        raise TypeError('Objects of type %s are not '
+                                        ' acceptable input for'
+                                        ' a fixed-point column.' % str(type(value)))
+                if (value < vmin) or (value > vmax):
+                    ps._check_integer_range(value, dialect, vartype,
+                                            subtype, scale)
+                pack_into(buf, 0, value)
+        elif vartype == SQL_BOOLEAN:
+            pack_into = struct.Struct('<h').pack_into
+            def encode(value, buf):
+                pack_into(buf, 0, 1 if value else 0)
+        elif vartype == SQL_TYPE_DATE:
+            pack_into = struct.Struct('<l').pack_into
+            def encode(value, buf):
+                pack_into(buf, 0, value.toordinal() - _IB_DATE_ORDINAL)
+        elif vartype == SQL_TYPE_TIME:
+            pack_into = struct.Struct('<l').pack_into
+            def encode(value, buf):
+                pack_into(buf, 0, _ib_time(value))
+        elif vartype == SQL_TIMESTAMP:
+            pack_into = struct.Struct('<ll').pack_into
+            def encode(value, buf):
+                if isinstance(value, datetime.datetime):
+                    pack_into(buf, 0, value.toordinal() - _IB_DATE_ORDINAL,
+                              _ib_time(value))
+                elif isinstance(value, datetime.date):
+                    pack_into(buf, 0, value.toordinal() - _IB_DATE_ORDINAL, 0)
+                else:
+                    raise ValueError("datetime.datetime or datetime.date expected")
+        elif vartype == SQL_FLOAT:
+            pack_into = struct.Struct('f').pack_into
+            def encode(value, buf):
+                pack_into(buf, 0, value)
+        elif vartype == SQL_DOUBLE:
+            pack_into = struct.Struct('d').pack_into
+            def encode(value, buf):
+                pack_into(buf, 0, value)
+        elif vartype in [SQL_BLOB, SQL_ARRAY]:
+            # Encoder must not hold strong reference to the statement
+            ps = weakref.proxy(self)
+            if vartype == SQL_BLOB:
+                def encode(value, buf):
+                    ps.__write_blob(value, subtype, buf)
+            else:
+                relname = sqlvar.relname
+                sqlname = sqlvar.sqlname
+                def encode(value, buf):
+                    ps.__write_array(value, relname, sqlname, buf)
+        else:
+            def encode(value, buf):
+                pass
+        return encode
+    def __build_input_plan(self):
+        """Prepares :class:`_ParameterBuffer` for each input parameter, so
+        values are written in place on each execution.
+        """
+        plan = []
+        for i in xrange(self.n_input_params):
+            sqlvar = self._in_sqlda.sqlvar[i]
+            sqltype, sqllen = self._in_sqlda_save[i]
+            vartype = sqltype & ~1
+            if vartype in [SQL_BLOB, SQL_ARRAY]:
+                buf = ISC_QUAD(0, 0)
+            else:
+                buf = ctypes.create_string_buffer(sqllen)
+            param = _ParameterBuffer(sqlvar, sqltype, sqllen, buf,
+                                     self.__get_parameter_encoder(sqlvar,
+                                                                  vartype,
+                                                                  sqllen))
+            if vartype in [SQL_TEXT, SQL_VARYING]:
+                # Strings longer than declared length are rejected, so
+                # declared length is enough
+                param.text_buf = ctypes.create_string_buffer(sqllen)
+                param.text_data = ctypes.cast(param.text_buf, buf_pointer)
+            plan.append(param)
+        self.__input_plan = plan
     def __Tuple2XSQLDA(self, xsqlda, parameters):
         """Move data from parameters to input XSQLDA.
         """
-        for i in xrange(xsqlda.sqld):
-            sqlvar = xsqlda.sqlvar[i]
+        i = 0
+        for param in self.__input_plan:
             value = parameters[i]
-            vartype = sqlvar.sqltype & ~1
-            scale = sqlvar.sqlscale
             # NULL handling
-            if value == None:
+            if value is None:
                 # Set the null flag whether sqlvar definition allows it or not,
                 # to give BEFORE triggers to act on value without
-                # our interference.
-                if (sqlvar.sqltype & 1) == 0:
-                    # NULLs were not allowed, so set it allowed or IB will complain
-                    sqlvar.sqltype += 1
-                sqlvar.sqlind = ctypes.pointer(ISC_SHORT(-1))
-                sqlvar.sqldata = None
+                # our interference. All parameters are declared as nullable.
+                param.ind.value = -1
+            elif ((param.vartype != SQL_BLOB and
+                   isinstance(value, (StringType, UnicodeType)))
+                  or param.is_string):
+                # Place for Implicit Conversion of Input Parameters
+                # to Strings
+                if not isinstance(value, (UnicodeType,StringType,ibase.mybytes)):
+                    value = str(value)
+                # Place for Implicit Conversion of Input Parameters
+                # from Strings
+                if isinstance(value, UnicodeType):
+                    value = value.encode(self.__python_charset)
+                size = len(value)
+                if param.is_string and size > param.sqllen:
+                    raise ValueError("Value of parameter (%i) is too long,"
+                                     " expected %i, found %i" % (i, param.sqllen, size))
+                param.ind.value = 0
+                param.set_text(value, size)
             else:
-                # if sqlvar allows null, allocate the null flag
-                # I don't know whether it's necessary,
-                # but we'll do it anyway for safety
-                if ((sqlvar.sqltype & 1) != 0):
-                    sqlvar.sqlind = ctypes.pointer(ISC_SHORT(0))
-                # Fill in value by type
-                if ((vartype != SQL_BLOB and
-                     isinstance(value, (StringType, UnicodeType)))
-                    or vartype in [SQL_TEXT, SQL_VARYING]):
-                    # Place for Implicit Conversion of Input Parameters
-                    # to Strings
-                    if not isinstance(value, (UnicodeType,StringType,ibase.mybytes)):
-                        value = str(value)
-                    # Place for Implicit Conversion of Input Parameters
-                    # from Strings
-                    if isinstance(value, UnicodeType):
-                        value = value.encode(self.__python_charset)
-                    if vartype in [SQL_TEXT, SQL_VARYING] and len(value) > sqlvar.sqllen:
-                        raise ValueError("Value of parameter (%i) is too long,"
-                                         " expected %i, found %i" % (i, sqlvar.sqllen, len(value)))
-                    sqlvar.sqltype = SQL_TEXT | (sqlvar.sqltype & 1)
-                    sqlvar.sqllen = ctypes.c_short(len(value))
-                    sqlvar.sqldata = ctypes.cast(ctypes.pointer(
-                        ctypes.create_string_buffer(value)), buf_pointer)
-                elif vartype in [SQL_SHORT, SQL_LONG,
-                                 SQL_INT64]:
-                    # It's scalled integer?
-                    if (sqlvar.sqlsubtype or scale):
-                        if isinstance(value, decimal.Decimal):
-                            value = int(
-                                (value * _tenTo[abs(scale)]).to_integral())
-                        elif isinstance(value, (int, mylong, float,)):
-                            value = int(value * _tenTo[abs(scale)])
-                        else:
-                            raise TypeError('Objects of type %s are not '
-                                            ' acceptable input for'
-                                            ' a fixed-point column.' % str(type(value)))
-                    self._check_integer_range(value,
-                                              self.__sql_dialect,
-                                              vartype, sqlvar.sqlsubtype,
-                                              sqlvar.sqlscale)
-                    sqlvar.sqldata = ctypes.cast(ctypes.pointer(
-                        ctypes.create_string_buffer(
-                            int_to_bytes(value, sqlvar.sqllen))), buf_pointer)
-                elif vartype == SQL_BOOLEAN:
-                    sqlvar.sqldata = ctypes.cast(ctypes.pointer(
-                        ctypes.create_string_buffer(
-                            bool_to_bytes(value, sqlvar.sqllen))), buf_pointer)
-                elif vartype == SQL_TYPE_DATE:
-                    sqlvar.sqldata = ctypes.cast(ctypes.pointer(
-                        ctypes.create_string_buffer(
-                            self._convert_date(value))), buf_pointer)
-                elif vartype == SQL_TYPE_TIME:
-                    sqlvar.sqldata = ctypes.cast(ctypes.pointer(
-                        ctypes.create_string_buffer(
-                            self._convert_time(value))), buf_pointer)
-                elif vartype == SQL_TIMESTAMP:
-                    sqlvar.sqldata = ctypes.cast(ctypes.pointer(
-                        ctypes.create_string_buffer(
-                            self._convert_timestamp(value))), buf_pointer)
-                elif vartype == SQL_FLOAT:
-                    sqlvar.sqldata = ctypes.cast(
-                        ctypes.pointer(ctypes.create_string_buffer(
-                            struct.pack('f', value))), buf_pointer)
-                elif vartype == SQL_DOUBLE:
-                    sqlvar.sqldata = ctypes.cast(
-                        ctypes.pointer(ctypes.create_string_buffer(
-                            struct.pack('d', value))), buf_pointer)
-                elif vartype == SQL_BLOB:
-                    blobid = ISC_QUAD(0, 0)
-                    blob_handle = isc_blob_handle()
-                    if hasattr(value,'read'):
-                        # It seems we've got file-like object, use stream BLOB
-                        api.isc_create_blob2(self._isc_status,
-                                               self.cursor._connection._db_handle,
-                                               self.cursor._transaction._tr_handle,
-                                               blob_handle, blobid, 4,
-                                               bs([ibase.isc_bpb_version1,
-                                                   ibase.isc_bpb_type,1,
-                                                   ibase.isc_bpb_type_stream]))
-                        if db_api_error(self._isc_status):
-                            raise exception_from_status(DatabaseError,
-                                                        self._isc_status,
-                                                        "Cursor.write_input_blob/isc_create_blob2:")
-                        sqlvar.sqldata = ctypes.cast(ctypes.pointer(blobid),
-                                                     buf_pointer)
-                        blob = ctypes.create_string_buffer(MAX_BLOB_SEGMENT_SIZE)
-                        value_chunk = value.read(MAX_BLOB_SEGMENT_SIZE)
-                        blob.raw = ibase.b(value_chunk)
-                        while len(value_chunk) > 0:
-                            api.isc_put_segment(self._isc_status, blob_handle,
-                                                  len(value_chunk),
-                                                  ctypes.byref(blob)
-                                                  )
-                            if db_api_error(self._isc_status):
-                                raise exception_from_status(DatabaseError,
-                                                            self._isc_status,
-                                                            "Cursor.write_input_blob/isc_put_segment:")
-                            ctypes.memset(blob,0,MAX_BLOB_SEGMENT_SIZE)
-                            value_chunk = value.read(MAX_BLOB_SEGMENT_SIZE)
-                            blob.raw = ibase.b(value_chunk)
-                        api.isc_close_blob(self._isc_status, blob_handle)
-                        if db_api_error(self._isc_status):
-                            raise exception_from_status(DatabaseError,
-                                                        self._isc_status,
-                                                        "Cursor.write_input_blob/isc_close_blob:")
-                    else:
-                        # Non-stream BLOB
-                        if isinstance(value, myunicode):
-                            if sqlvar.sqlsubtype == 1:
-                                value = value.encode(self.__python_charset)
-                            else:
-                                raise TypeError('Unicode strings are not'
-                                                ' acceptable input for'
-                                                ' a non-textual BLOB column.')
-                        blob = ctypes.create_string_buffer(value)
-                        api.isc_create_blob2(self._isc_status,
-                                               self.cursor._connection._db_handle,
-                                               self.cursor._transaction._tr_handle,
-                                               blob_handle, blobid, 0, None)
-                        if db_api_error(self._isc_status):
-                            raise exception_from_status(DatabaseError,
-                                                        self._isc_status,
-                                                        "Cursor.write_input_blob/isc_create_blob2:")
-                        sqlvar.sqldata = ctypes.cast(ctypes.pointer(blobid),
-                                                     buf_pointer)
-                        total_size = len(value)
-                        bytes_written_so_far = 0
-                        bytes_to_write_this_time = MAX_BLOB_SEGMENT_SIZE
-                        while (bytes_written_so_far < total_size):
-                            if (
-                                (total_size - bytes_written_so_far) <
-                                MAX_BLOB_SEGMENT_SIZE
-                                ):
-                                bytes_to_write_this_time = (total_size -
-                                                            bytes_written_so_far)
-                            api.isc_put_segment(self._isc_status, blob_handle,
-                                                  bytes_to_write_this_time,
-                                                  ctypes.byref(blob,
-                                                               bytes_written_so_far
-                                                               )
-                                                  )
-                            if db_api_error(self._isc_status):
-                                raise exception_from_status(DatabaseError,
-                                                            self._isc_status,
-                                                            "Cursor.write_input_blob/isc_put_segment:")
-                            bytes_written_so_far += bytes_to_write_this_time
-                        api.isc_close_blob(self._isc_status, blob_handle)
-                        if db_api_error(self._isc_status):
-                            raise exception_from_status(DatabaseError,
-                                                        self._isc_status,
-                                                        "Cursor.write_input_blob/isc_close_blob:")
-                elif vartype == SQL_ARRAY:
-                    arrayid = ISC_QUAD(0,0)
-                    arrayid_ptr = ctypes.pointer(arrayid)
-                    arraydesc = ISC_ARRAY_DESC_V2(0)
-                    sqlvar.sqldata = ctypes.cast(ctypes.pointer(arrayid),
-                                                 buf_pointer)
-                    sqlsubtype = self.cursor._connection._get_array_sqlsubtype(sqlvar.relname,
-                                                                               sqlvar.sqlname)
-                    api.isc_array_lookup_bounds2(self._isc_status,
-                                                  self.cursor._connection._db_handle,
-                                                  self.cursor._transaction._tr_handle,
-                                                  sqlvar.relname,
-                                                  sqlvar.sqlname,
-                                                  arraydesc)
-                    if db_api_error(self._isc_status):
-                        raise exception_from_status(DatabaseError,
-                                                    self._isc_status,
-                                                    "Cursor.write_otput_array/isc_array_lookup_bounds2:")
-                    value_type = arraydesc.array_desc_dtype
-                    value_scale = int.from_bytes(arraydesc.array_desc_scale, byteorder="big")
-                    value_size = arraydesc.array_desc_length
-                    if value_type in (blr_varying,blr_varying2):
-                        value_size += 2
-                    dimensions = []
-                    total_num_elements = 1
-                    for dimension in xrange(arraydesc.array_desc_dimensions):
-                        bounds = arraydesc.array_desc_bounds[dimension]
-                        dimensions.append((bounds.array_bound_upper+1)-bounds.array_bound_lower)
-                        total_num_elements *= dimensions[dimension]
-                    total_size = total_num_elements * value_size
-                    # Validate value to make sure it matches the array structure
-                    if not self.__validate_array_value(0,dimensions,value_type,
-                                                       sqlsubtype,
-                                                       value_scale,value):
-                        raise ValueError("Incorrect ARRAY field value.")
-                    value_buffer = ctypes.create_string_buffer(total_size)
-                    tsize = ISC_LONG(total_size)
-                    self.__copy_list_to_db_array(value_size,value_type,
-                                                 sqlsubtype,value_scale,
-                                                 0, dimensions,
-                                                 value,value_buffer,0)
-                    api.isc_array_put_slice2(self._isc_status,
-                                              self.cursor._connection._db_handle,
-                                              self.cursor._transaction._tr_handle,
-                                              arrayid_ptr, arraydesc,
-                                              value_buffer,
-                                              tsize)
-                    if db_api_error(self._isc_status):
-                        raise exception_from_status(DatabaseError,
-                                                    self._isc_status,
-                                                    "Cursor.read_otput_array/isc_array_put_slice2:")
-                    sqlvar.sqldata = ctypes.cast(arrayid_ptr,buf_pointer)
+                param.ind.value = 0
+                param.encode(value, param.buf)
+                if param.text_mode:
+                    param.set_native()
+            i += 1
+    def __write_blob(self, value, subtype, blobid):
+        """Writes value of input parameter into new BLOB, and stores its ID
+        into `blobid` :class:`ISC_QUAD`.
+        """
+        blob_handle = isc_blob_handle()
+        blobid.gds_quad_high = 0
+        blobid.gds_quad_low = 0
+        if hasattr(value,'read'):
+            # It seems we've got file-like object, use stream BLOB
+            api.isc_create_blob2(self._isc_status,
+                                   self.cursor._connection._db_handle,
+                                   self.cursor._transaction._tr_handle,
+                                   blob_handle, blobid, 4,
+                                   bs([ibase.isc_bpb_version1,
+                                       ibase.isc_bpb_type,1,
+                                       ibase.isc_bpb_type_stream]))
+            if db_api_error(self._isc_status):
+                raise exception_from_status(DatabaseError,
+                                            self._isc_status,
+                                            "Cursor.write_input_blob/isc_create_blob2:")
+            blob = ctypes.create_string_buffer(MAX_BLOB_SEGMENT_SIZE)
+            value_chunk = value.read(MAX_BLOB_SEGMENT_SIZE)
+            blob.raw = ibase.b(value_chunk)
+            while len(value_chunk) > 0:
+                api.isc_put_segment(self._isc_status, blob_handle,
+                                      len(value_chunk),
+                                      ctypes.byref(blob)
+                                      )
+                if db_api_error(self._isc_status):
+                    raise exception_from_status(DatabaseError,
+                                                self._isc_status,
+                                                "Cursor.write_input_blob/isc_put_segment:")
+                ctypes.memset(blob,0,MAX_BLOB_SEGMENT_SIZE)
+                value_chunk = value.read(MAX_BLOB_SEGMENT_SIZE)
+                blob.raw = ibase.b(value_chunk)
+            api.isc_close_blob(self._isc_status, blob_handle)
+            if db_api_error(self._isc_status):
+                raise exception_from_status(DatabaseError,
+                                            self._isc_status,
+                                            "Cursor.write_input_blob/isc_close_blob:")
+        else:
+            # Non-stream BLOB
+            if isinstance(value, myunicode):
+                if subtype == 1:
+                    value = value.encode(self.__python_charset)
+                else:
+                    raise TypeError('Unicode strings are not'
+                                    ' acceptable input for'
+                                    ' a non-textual BLOB column.')
+            blob = ctypes.create_string_buffer(value)
+            api.isc_create_blob2(self._isc_status,
+                                   self.cursor._connection._db_handle,
+                                   self.cursor._transaction._tr_handle,
+                                   blob_handle, blobid, 0, None)
+            if db_api_error(self._isc_status):
+                raise exception_from_status(DatabaseError,
+                                            self._isc_status,
+                                            "Cursor.write_input_blob/isc_create_blob2:")
+            total_size = len(value)
+            bytes_written_so_far = 0
+            bytes_to_write_this_time = MAX_BLOB_SEGMENT_SIZE
+            while (bytes_written_so_far < total_size):
+                if (
+                    (total_size - bytes_written_so_far) <
+                    MAX_BLOB_SEGMENT_SIZE
+                    ):
+                    bytes_to_write_this_time = (total_size -
+                                                bytes_written_so_far)
+                api.isc_put_segment(self._isc_status, blob_handle,
+                                      bytes_to_write_this_time,
+                                      ctypes.byref(blob,
+                                                   bytes_written_so_far
+                                                   )
+                                      )
+                if db_api_error(self._isc_status):
+                    raise exception_from_status(DatabaseError,
+                                                self._isc_status,
+                                                "Cursor.write_input_blob/isc_put_segment:")
+                bytes_written_so_far += bytes_to_write_this_time
+            api.isc_close_blob(self._isc_status, blob_handle)
+            if db_api_error(self._isc_status):
+                raise exception_from_status(DatabaseError,
+                                            self._isc_status,
+                                            "Cursor.write_input_blob/isc_close_blob:")
+    def __write_array(self, value, relname, sqlname, arrayid):
+        """Writes value of input parameter into new ARRAY, and stores its ID
+        into `arrayid` :class:`ISC_QUAD`.
+        """
+        if isinstance(value, ISC_QUAD):
+            # ID of already stored ARRAY
+            arrayid.gds_quad_high = value.gds_quad_high
+            arrayid.gds_quad_low = value.gds_quad_low
+            return
+        arrayid.gds_quad_high = 0
+        arrayid.gds_quad_low = 0
+        desc = self.cursor._connection._get_array_descriptor(relname, sqlname,
+                                                             self.cursor._transaction._tr_handle)
+        self.__put_array_value(value, desc, arrayid)
+    def _write_array_slice(self, value, relname, sqlname, bounds, arrayid):
+        """Writes `value` into part of ARRAY delimited by `bounds`. When
+        `arrayid` :class:`ISC_QUAD` refers to existing ARRAY, other elements
+        are preserved. On return, `arrayid` contains ID of new ARRAY.
+        """
+        desc = self.cursor._connection._get_array_descriptor(relname, sqlname,
+                                                             self.cursor._transaction._tr_handle)
+        self.__put_array_value(value, desc.get_slice(bounds), arrayid)
+    def __put_array_value(self, value, desc, arrayid):
+        arraydesc = desc.desc
+        sqlsubtype = desc.sqlsubtype
+        value_type = desc.value_type
+        value_scale = desc.value_scale
+        value_size = desc.value_size
+        dimensions = desc.dimensions
+        total_size = desc.total_size
+        if _is_ndarray(value):
+            if not desc.ndarray_dtype:
+                value = value.tolist()
+            else:
+                # NumPy array is written with single copy at most
+                if list(value.shape) != dimensions:
+                    raise ValueError("Incorrect ARRAY field value.")
+                numpy = sys.modules['numpy']
+                if desc.ndarray_factor:
+                    value = numpy.rint(value * desc.ndarray_factor)
+                value = numpy.ascontiguousarray(value, dtype=desc.ndarray_dtype)
+                self.__put_array_slice(arrayid, arraydesc, value.ctypes.data,
+                                       total_size)
+                return
+        # Validate value to make sure it matches the array structure
+        if not self.__validate_array_value(0,dimensions,value_type,
+                                           sqlsubtype,
+                                           value_scale,value):
+            raise ValueError("Incorrect ARRAY field value.")
+        value_buffer = ctypes.create_string_buffer(total_size)
+        self.__copy_list_to_db_array(value_size,value_type,
+                                     sqlsubtype,value_scale,
+                                     0, dimensions,
+                                     value,value_buffer,0)
+        self.__put_array_slice(arrayid, arraydesc, value_buffer, total_size)
     def _free_handle(self):
         if self._stmt_handle != None and not self.__closed:
             self.__executed = False
@@ -3082,13 +3821,21 @@ class PreparedStatement(object):
             self._name = None
             while len(self.__blob_readers) > 0:
                 self.__blob_readers.pop().close()
-            if self.statement_type == isc_info_sql_stmt_select:
+            if is_dead_proxy(self.cursor):
+                self.cursor = None
+            connection = self.cursor._connection if self.cursor else None
+            if (self.statement_type == isc_info_sql_stmt_select
+                and not (connection and connection.closed)
+                and self.__generation == _fork_generation):
                 api.isc_dsql_free_statement(self._isc_status,
                                               self._stmt_handle,
                                               ibase.DSQL_close)
                 if db_api_error(self._isc_status):
                     raise exception_from_status(DatabaseError, self._isc_status,
                                   "Error while releasing SQL statement handle:")
+    def _is_current(self):
+        # False for statement prepared in parent process before fork()
+        return self.__generation == _fork_generation
     def _close(self):
         if self._stmt_handle != None:
             while len(self.__blob_readers) > 0:
@@ -3104,7 +3851,9 @@ class PreparedStatement(object):
             if is_dead_proxy(self.cursor):
                 self.cursor = None
             connection = self.cursor._connection if self.cursor else None
-            if (not connection) or (connection and not connection.closed):
+            # Handle prepared before fork() belongs to the parent process
+            if (((not connection) or (connection and not connection.closed))
+                and self.__generation == _fork_generation):
                 api.isc_dsql_free_statement(self._isc_status, stmt_handle, ibase.DSQL_drop)
                 if (db_api_error(self._isc_status)
                     and (self._isc_status[1] not in [335544528,335544485])):
@@ -3119,11 +3868,6 @@ class PreparedStatement(object):
                 raise ProgrammingError("Statement parameter sequence contains"
                                        " %d parameters, but only %d are allowed" %
                                        (len(parameters), self._in_sqlda.sqln))
-            # Restore original type and size information for input parameters
-            i = 0
-            for sqlvar in self._in_sqlda.sqlvar[:self.n_input_params]:
-                sqlvar.sqltype, sqlvar.sqllen = self._in_sqlda_save[i]
-                i += 1
             self.__Tuple2XSQLDA(self._in_sqlda, parameters)
             xsqlda_in = ctypes.cast(ctypes.pointer(self._in_sqlda), XSQLDA_PTR)
         else:
@@ -3162,18 +3906,22 @@ class PreparedStatement(object):
         self.__executed = True
         self.__closed = False
         self._last_fetch_status = ISC_STATUS(self.NO_FETCH_ATTEMPTED_YET)
-    def _fetchone(self):
+    def _fetch_raw(self):
+        """Moves next row of result set to output XSQLDA buffers.
+
+        :returns: True if row was fetched, False when there are no more rows.
+        """
         if (self._last_fetch_status == self.RESULT_SET_EXHAUSTED
             and not self.__output_cache):
-            return None
+            return False
         if self.__executed:
             if self.__output_cache:
                 if self._last_fetch_status == self.RESULT_SET_EXHAUSTED:
                     self._free_handle()
-                    return None
+                    return False
                 else:
                     self._last_fetch_status = self.RESULT_SET_EXHAUSTED
-                    return self.__output_cache
+                    return True
             else:
                 if self.n_output_params == 0:
                     raise DatabaseError("Attempt to fetch row of results after statement that does not produce result set.")
@@ -3181,22 +3929,227 @@ class PreparedStatement(object):
                     self._isc_status,
                     self._stmt_handle,
                     self.__sql_dialect,
-                    ctypes.cast(ctypes.pointer(self._out_sqlda), XSQLDA_PTR))
+                    self.__out_sqlda_ptr)
                 if self._last_fetch_status == 0:
-                    return self.__XSQLDA2Tuple(self._out_sqlda)
+                    return True
                 elif self._last_fetch_status == self.RESULT_SET_EXHAUSTED:
                     self._free_handle()
-                    return None
+                    return False
                 else:
                     if db_api_error(self._isc_status):
                         raise exception_from_status(DatabaseError,
                             self._isc_status,
                             "Cursor.fetchone:")
+                    return False
         elif self.__closed:
             raise ProgrammingError("Cannot fetch from closed cursor.")
         else:
             raise ProgrammingError("Cannot fetch from this cursor because"
                                    " it has not executed a statement.")
+    def _fetchone(self):
+        if self._fetch_raw():
+            if self.__output_cache:
+                return self.__output_cache
+            return self.__XSQLDA2Tuple(self._out_sqlda)
+        return None
+    def _fetchone_lazy(self):
+        """Like :meth:`_fetchone`, but returns :class:`_LazyRow` over snapshot
+        of raw row data instead of tuple.
+        """
+        if self._fetch_raw():
+            if self.__output_cache:
+                return self.__output_cache
+            if self.__row_buffer is not None:
+                raw = self.__row_buffer.raw
+            else:
+                raw = b''.join([buf.raw for buf, offset in self.__out_buffers] +
+                               [bytes(ind) for ind, ind_offset in self.__out_indicators
+                                if ind is not None])
+            return _LazyRow(self.__get_lazy_plan(), raw)
+        return None
+    def __get_columnar_plan(self):
+        """Returns (array typecode, extractor, NumPy dtype) tuple for each output
+        column, used by :meth:`_fetch_columns`. Columns that don't have array
+        representation have None typecode and collect Python values.
+        """
+        if self.__columnar_plan is None:
+            plan = []
+            for i in xrange(self._out_sqlda.sqld):
+                sqlvar = self._out_sqlda.sqlvar[i]
+                vartype = sqlvar.sqltype & ~1
+                scale = sqlvar.sqlscale
+                if vartype in [SQL_SHORT, SQL_LONG, SQL_INT64]:
+                    if (sqlvar.sqlsubtype or scale):
+                        divisor = float(_tenTo[abs(scale)])
+                        def extract(value, divisor=divisor):
+                            return value / divisor
+                        item = ('d', extract, 'float64')
+                    else:
+                        item = {SQL_SHORT: ('h', None, 'int16'),
+                                SQL_LONG: ('i', None, 'int32'),
+                                SQL_INT64: ('q', None, 'int64')}[vartype]
+                elif vartype == SQL_FLOAT:
+                    item = ('f', None, 'float32')
+                elif vartype == SQL_DOUBLE:
+                    item = ('d', None, 'float64')
+                elif vartype == SQL_BOOLEAN:
+                    item = ('B', bool, 'bool')
+                elif vartype == SQL_TYPE_DATE:
+                    def extract(days):
+                        return days - _IB_UNIX_EPOCH_DAYS
+                    item = ('i', extract, 'datetime64[D]')
+                elif vartype == SQL_TIMESTAMP:
+                    def extract(days, ticks):
+                        return (days - _IB_UNIX_EPOCH_DAYS) * 86400000000 + ticks * 100
+                    item = ('q', extract, 'datetime64[us]')
+                elif vartype == SQL_TYPE_TIME:
+                    def extract(ticks):
+                        return ticks * 100
+                    item = ('q', extract, 'timedelta64[us]')
+                else:
+                    item = (None, self.__fetch_plan[i][4], None)
+                plan.append(item)
+            self.__columnar_plan = plan
+        return self.__columnar_plan
+    def _fetch_columns(self, size=None):
+        """Fetches (next) rows of result set column-wise.
+
+        :param integer size: Max. number of rows to fetch. All remaining rows
+                             are fetched when it's None.
+        :returns: Tuple (columns, nulls), where `columns` is a list with one
+                  `array.array` (or list) per output column, and `nulls` is
+                  a list with one `array.array('B')` per column, where 1
+                  marks NULL value.
+        """
+        columnar_plan = self.__get_columnar_plan()
+        columns = []
+        nulls = []
+        readers = []
+        for (buf, offset, ind, unpack, convert), (typecode, extract, dtype) in zip(
+                self.__fetch_plan, columnar_plan):
+            column = array.array(typecode) if typecode else []
+            mask = array.array('B')
+            columns.append(column)
+            nulls.append(mask)
+            readers.append((buf, offset, ind, unpack, extract,
+                            0 if typecode else None,
+                            column.append, mask.append))
+        count = 0
+        while (size is None or count < size) and self._fetch_raw():
+            for (buf, offset, ind, unpack, extract, empty, append,
+                 append_null) in readers:
+                if ind is not None and ind.value < 0:
+                    append(empty)
+                    append_null(1)
+                else:
+                    if extract is None:
+                        append(unpack(buf, offset)[0])
+                    else:
+                        append(extract(*unpack(buf, offset)))
+                    append_null(0)
+            count += 1
+        return (columns, nulls)
+    def _get_column_dtypes(self):
+        "Returns list of NumPy dtype names (None for object) for output columns."
+        return [item[2] for item in self.__get_columnar_plan()]
+    def __get_text_plan(self):
+        """Returns (formatter, quoted) pair for each output column, used by
+        :meth:`_fetch_text`.
+
+        Formatter is called with values unpacked from column data buffer and
+        returns text of the value, formatted like `str()` of value returned by
+        :meth:`_fetchone` but without intermediate `datetime` or `Decimal`
+        objects. NUMERIC and DECIMAL values keep all digits of their scale.
+        `quoted` is False for numbers and booleans, True for other text values,
+        and None for columns (BLOB, ARRAY) whose formatter returns value like
+        :meth:`_fetchone`.
+        """
+        if self.__text_plan is None:
+            plan = []
+            # DATE text is cached, as the same dates tend to repeat
+            dates = {}
+            def format_date(days):
+                text = dates.get(days)
+                if text is None:
+                    if len(dates) > 65536:
+                        dates.clear()
+                    text = _date_fromordinal(days + _IB_DATE_ORDINAL).isoformat()
+                    dates[days] = text
+                return text
+            for i in xrange(self._out_sqlda.sqld):
+                sqlvar = self._out_sqlda.sqlvar[i]
+                vartype = sqlvar.sqltype & ~1
+                scale = sqlvar.sqlscale
+                if vartype in [SQL_SHORT, SQL_LONG, SQL_INT64]:
+                    if scale:
+                        divisor = _tenTo[abs(scale)]
+                        fmt = '%%s%%d.%%0%dd' % abs(scale)
+                        def formatter(value, divisor=divisor, fmt=fmt):
+                            if value < 0:
+                                return fmt % (('-',) + divmod(-value, divisor))
+                            return fmt % (('',) + divmod(value, divisor))
+                    else:
+                        formatter = str
+                    item = (formatter, False)
+                elif vartype in [SQL_FLOAT, SQL_DOUBLE]:
+                    item = (repr, False)
+                elif vartype == SQL_BOOLEAN:
+                    item = (lambda value: 'true' if value else 'false', False)
+                elif vartype == SQL_TYPE_DATE:
+                    item = (format_date, True)
+                elif vartype == SQL_TIMESTAMP:
+                    def formatter(days, ticks):
+                        return format_date(days) + ' ' + _format_time_ticks(ticks)
+                    item = (formatter, True)
+                elif vartype == SQL_TYPE_TIME:
+                    item = (_format_time_ticks, True)
+                else:
+                    convert = self.__fetch_plan[i][4]
+                    if convert is None:
+                        convert = lambda value: value
+                    # OCTETS are not decoded to text
+                    item = (convert, True if vartype in [SQL_TEXT, SQL_VARYING]
+                            and sqlvar.sqlsubtype != 1 else None)
+                plan.append(item)
+            self.__text_plan = plan
+        return self.__text_plan
+    def _get_text_kinds(self):
+        """Returns list with `quoted` flag of each output column. See
+        :meth:`_fetch_text`.
+        """
+        return [quoted for formatter, quoted in self.__get_text_plan()]
+    def _fetch_text(self, size):
+        """Fetches (next) rows of result set with values formatted as text
+        straight from output buffers.
+
+        :param integer size: Max. number of rows to fetch.
+        :returns: List of rows, where each row is a list with text of each
+                  column (None for NULL). Values of columns with None `quoted`
+                  flag (see :meth:`_get_text_kinds`) are returned as is.
+        """
+        text_plan = self.__get_text_plan()
+        rows = []
+        append = rows.append
+        if self.__row_plan is not None:
+            unpack_row = self.__row_unpack
+            buffer = self.__row_buffer
+            columns = [(start, end, formatter, ind_pos)
+                       for (start, end, convert, ind_pos), (formatter, quoted)
+                       in zip(self.__row_plan, text_plan)]
+            while len(rows) < size and self._fetch_raw():
+                row = unpack_row(buffer)
+                append([None if ind_pos is not None and row[ind_pos] < 0
+                        else formatter(*row[start:end])
+                        for start, end, formatter, ind_pos in columns])
+        else:
+            columns = [(buf, offset, ind, unpack, formatter)
+                       for (buf, offset, ind, unpack, convert), (formatter, quoted)
+                       in zip(self.__fetch_plan, text_plan)]
+            while len(rows) < size and self._fetch_raw():
+                append([None if ind is not None and ind.value < 0
+                        else formatter(*unpack(buf, offset))
+                        for buf, offset, ind, unpack, formatter in columns])
+        return rows
     def _set_cursor_name(self, name):
         api.isc_dsql_set_cursor_name(self._isc_status,
                                        self._stmt_handle, b(name), 0)
@@ -3204,6 +4157,8 @@ class PreparedStatement(object):
             raise exception_from_status(OperationalError, self._isc_status,
                                         "Could not set cursor name:")
         self._name = name
+        # Named cursor couldn't be safely reused by other Cursor
+        self._cacheable = False
     def set_stream_blob(self,blob_name):
         """Specify a BLOB column(s) to work in `stream` mode instead classic,
         materialized mode.
@@ -3224,6 +4179,30 @@ class PreparedStatement(object):
             self.__streamed_blobs.append(blob_name)
         else:
             self.__streamed_blobs.extend(blob_name)
+        # Setting must not leak to other executions via statement cache
+        self._cacheable = False
+    def set_array_slice(self, name, bounds):
+        """Specify that only part of ARRAY column is fetched.
+
+        :param string name: Name of ARRAY column. Name must be in format as
+                            it's stored in database (refer to
+                            :attr:`description` for real value).
+        :param bounds: Sequence of (lower, upper) pairs (inclusive) for each
+                       dimension of the array, or None to fetch whole
+                       ARRAY values again.
+
+        Values of this column are then returned as (nested) lists (or
+        `numpy.ndarray`) with shape of the slice. Bounds are validated on
+        first fetch against declared array bounds, and :exc:`ValueError`
+        is raised when they are outside of them.
+        """
+        if bounds is None:
+            self.__array_slices.pop(name, None)
+        else:
+            self.__array_slices[name] = (tuple((lower, upper) for lower, upper
+                                               in bounds), None)
+        # Setting must not leak to other executions via statement cache
+        self._cacheable = False
     def __del__(self):
         if self._stmt_handle != None:
             self._close()
@@ -3286,6 +4265,15 @@ class Cursor(object):
     #: efficiency because the database engine only supports fetching a single row
     #: at a time.
 
+    #: (Read/Write) (integer) Size limit (in bytes) for materialized BLOB
+    #: values. Larger BLOBs are returned as :class:`BlobReader` instances. None
+    #: means that :attr:`Connection.blob_stream_threshold` applies.
+    blob_stream_threshold = None
+    #: (Read/Write) (boolean) When True, numeric ARRAY values are returned as
+    #: `numpy.ndarray` instead of (nested) lists. None means that
+    #: :attr:`Connection.arrays_as_ndarray` applies.
+    arrays_as_ndarray = None
+
     def __init__(self, connection, transaction):
         """
         .. important::
@@ -3301,6 +4289,7 @@ class Cursor(object):
         self._transaction = transaction
         self._ps = None  # current prepared statement
         self.arraysize = 1
+        self.__executemany_stats = None
     def next(self):
         """Return the next item from the container. Part of *iterator protocol*.
 
@@ -3350,6 +4339,8 @@ class Cursor(object):
         return self._connection
     def __get_transaction(self):
         return self._transaction
+    def __get_executemany_stats(self):
+        return self.__executemany_stats
     def __connection_deleted(self,obj):
         self._connection = None
     def __ps_deleted(self,obj):
@@ -3403,7 +4394,43 @@ class Cursor(object):
             self._ps = None
         if self._ps != None:
             self._ps.close()
-            self._ps = None
+            self.__release_statement()
+    def __release_statement(self):
+        # Hands internally created PreparedStatement back to connection's
+        # statement cache.
+        ps = self._ps
+        self._ps = None
+        if ps is None or is_dead_proxy(ps) or not ps._cacheable:
+            return
+        if not ps._is_current():
+            # Inherited from parent process, handle is dropped without release
+            ps._close()
+            return
+        try:
+            closed = self._connection.closed
+        except (ReferenceError, AttributeError):
+            # Connection is gone, statement would be dropped by its destructor
+            return
+        if closed:
+            ps._close()
+        else:
+            self._connection.statement_cache._put(ps,
+                                                  self._connection._metadata_epoch)
+    def __get_statement(self, operation):
+        # Returns PreparedStatement for SQL command, either from connection's
+        # statement cache or newly prepared.
+        ps = self._connection.statement_cache._get(operation)
+        if ps is not None and not ps._is_current():
+            ps._close()
+            ps = None
+        if ps is None:
+            ps = PreparedStatement(operation, self, True)
+        else:
+            ps._bind_cursor(self)
+        if ps.statement_type == isc_info_sql_stmt_ddl:
+            self._connection._metadata_changed()
+            self._transaction._set_metadata_changed()
+        return ps
     def execute(self, operation, parameters=None):
         """Prepare and execute a database operation (query or command).
 
@@ -3412,7 +4439,8 @@ class Cursor(object):
            Execution is handled by :class:`PreparedStatement` that is either
            supplied as `operation` parameter, or created internally when
            `operation` is a string. Internally created PreparedStatements are
-           stored in cache for later reuse, when the same `operation` string is
+           stored in :attr:`Connection.statement_cache` for later reuse (by any
+           cursor of the same connection), when the same `operation` string is
            used again.
 
         :returns: self, so call to execute could be used as iterator.
@@ -3427,6 +4455,14 @@ class Cursor(object):
         :raises ProgrammingError: When more parameters than expected are supplied.
         :raises DatabaseError: When error is returned by server.
         """
+        self.__set_operation(operation)
+        self._ps._execute(parameters)
+        # return self so `execute` call could be used as iterable
+        return self
+    def __set_operation(self, operation):
+        # Makes PreparedStatement for operation current for this cursor.
+        if is_dead_proxy(self._ps):
+            self._ps = None
         if self._ps != None:
             self._ps.close()
         if not self._transaction.active:
@@ -3434,12 +4470,11 @@ class Cursor(object):
         if isinstance(operation, PreparedStatement):
             if operation.cursor is not self:
                 raise ValueError("PreparedStatement was created by different Cursor.")
+            self.__release_statement()
             self._ps = weakref.proxy(operation, _weakref_callback(self.__ps_deleted))
         else:
-            self._ps = PreparedStatement(operation, self, True)
-        self._ps._execute(parameters)
-        # return self so `execute` call could be used as iterable
-        return self
+            self.__release_statement()
+            self._ps = self.__get_statement(operation)
     def prep(self, operation):
         """Create prepared statement for repeated execution.
 
@@ -3457,36 +4492,90 @@ class Cursor(object):
         if not self._transaction.active:
             self._transaction.begin()
         return PreparedStatement(operation, self, False)
-    def executemany(self, operation, seq_of_parameters):
+    def executemany(self, operation, seq_of_parameters, batch_size=1000,
+                    count_rows=False):
         """Prepare a database operation (query or command) and then execute it
         against all parameter sequences or mappings found in the sequence
         `seq_of_parameters`.
 
         .. note::
 
-           This function simply calls :meth:`execute` in a loop, feeding it with
-           parameters from `seq_of_parameters`. Because `execute` caches
-           `PreparedStatements`, calling `executemany` is equally efective as
-           direct use of prepared statement and calling `execute` in a loop
-           directly in application.
+           The operation is prepared only once, and the same
+           :class:`PreparedStatement` (and its input XSQLDA) is then executed
+           for each parameter sequence. `seq_of_parameters` is consumed lazily,
+           so it could be a generator that produces rows on demand.
+
+           Number of executions and timing of each batch of `batch_size`
+           executions are available in :attr:`executemany_stats` afterwards
+           (also when execution fails). Numbers of affected rows are collected
+           only when `count_rows` is True, as it takes extra round trip to
+           server for each execution.
 
         :returns: self, so call to executemany could be used as iterator.
         :param operation: SQL command specification.
         :type operation: string or :class:`PreparedStatement` instance
-        :param seq_of_parameters: Sequence of sequences of parameters. Must contain
+        :param seq_of_parameters: Iterable of sequences of parameters. Must contain
                                   one sequence of parameters for each execution
                                   that has one entry for each argument that the
                                   operation expects.
-        :type seq_of_parameters: List or Tuple
+        :type seq_of_parameters: Iterable of Lists or Tuples
+        :param integer batch_size: Number of executions that are reported as
+                                   single batch in :attr:`executemany_stats`.
+        :param bool count_rows: When True, numbers of rows affected by DML
+                                statement are reported in
+                                :attr:`executemany_stats`.
         :raises ValueError: When operation PreparedStatement belongs to different
                             Cursor instance.
-        :raises TypeError: When seq_of_parameters is not List or Tuple.
+        :raises TypeError: When parameters is not List or Tuple.
         :raises ProgrammingError: When there are more parameters in any sequence
-                                  than expected.
+                                  than expected, or `batch_size` is not positive.
         :raises DatabaseError: When error is returned by server.
         """
-        for parameters in seq_of_parameters:
-            self.execute(operation, parameters)
+        if batch_size < 1:
+            raise ProgrammingError("Batch size must be positive integer.")
+        self.__set_operation(operation)
+        ps = self._ps
+        count_rows = count_rows and ps.statement_type in (isc_info_sql_stmt_insert,
+                                                          isc_info_sql_stmt_update,
+                                                          isc_info_sql_stmt_delete)
+        # Result set of previous execution must be closed before next one
+        reopen = ps.statement_type == isc_info_sql_stmt_select
+        executed = False
+        stats = {'executions': 0, 'rowcount': 0 if count_rows else -1,
+                 'elapsed': 0.0, 'batches': []}
+        self.__executemany_stats = stats
+        batch_executions = 0
+        batch_rowcount = 0 if count_rows else -1
+        start = batch_start = time.perf_counter()
+        try:
+            for parameters in seq_of_parameters:
+                if reopen and executed:
+                    ps._free_handle()
+                ps._execute(parameters)
+                executed = True
+                batch_executions += 1
+                if count_rows:
+                    batch_rowcount += ps.rowcount
+                if batch_executions == batch_size:
+                    now = time.perf_counter()
+                    stats['batches'].append((batch_executions, batch_rowcount,
+                                             now - batch_start))
+                    stats['executions'] += batch_executions
+                    if count_rows:
+                        stats['rowcount'] += batch_rowcount
+                    batch_executions = 0
+                    if count_rows:
+                        batch_rowcount = 0
+                    batch_start = now
+        finally:
+            now = time.perf_counter()
+            if batch_executions:
+                stats['batches'].append((batch_executions, batch_rowcount,
+                                         now - batch_start))
+                stats['executions'] += batch_executions
+                if count_rows:
+                    stats['rowcount'] += batch_rowcount
+            stats['elapsed'] = now - start
         return self
     def fetchone(self):
         """Fetch the next row of a query result set.
@@ -3555,7 +4644,7 @@ class Cursor(object):
         """
         row = self.fetchone()
         if row:
-            row = _RowMapping(self.description, row)
+            row = _RowMapping(self._ps._get_field_index(), row)
         return row
     def fetchmanymap(self, size=None):
         """Fetch the next set of rows of a query result, like :meth:`fetchmany`,
@@ -3610,6 +4699,170 @@ class Cursor(object):
                   like :meth:`fetchonemap`.
         """
         return utils.Iterator(self.fetchonemap, None)
+    def fetchonelazy(self):
+        """Fetch the next row of a query result set like :meth:`fetchone`,
+        except that column values are decoded only when they are accessed by
+        position or field name.
+
+        :returns: Sequence of returned values, or None when no more data is
+                  available.
+        :raises DatabaseError: When error is returned by server.
+        :raises ProgrammingError: When underlying :class:`PreparedStatement` is
+                                  closed, statement was not yet executed, or
+                                  unknown status is returned by fetch operation.
+
+        .. note::
+
+           Returned row holds copy of raw row data. BLOB and ARRAY values are
+           read from database only when accessed, so it must be done while the
+           transaction is active.
+        """
+        if self._ps:
+            return self._ps._fetchone_lazy()
+        else:
+            raise ProgrammingError("Cannot fetch from this cursor because"
+                                   " it has not executed a statement.")
+    def iterlazy(self):
+        """Equivalent to the :meth:`iter`, except that it yields rows that
+        decode column values only when they are accessed, like
+        :meth:`fetchonelazy`.
+
+        :returns: Iterator that yields rows like :meth:`fetchonelazy`.
+        """
+        return utils.Iterator(self.fetchonelazy, None)
+    def iter_prefetch(self, depth=100):
+        """Equivalent to the :meth:`iter`, except that rows are fetched and
+        decoded by background thread, up to `depth` rows ahead of the consumer.
+        Network latency of fetch operations thus overlaps with processing of
+        already returned rows.
+
+        Rows are returned in the same order as by :meth:`fetchone`. If fetch
+        fails, the error is raised by the iterator after all rows fetched before
+        the failure were returned.
+
+        :param integer depth: Max. number of rows fetched ahead.
+        :returns: Iterator that yields tuple of values like :meth:`fetchone`.
+        :raises ProgrammingError: When statement was not yet executed, or
+                                  depth is not positive.
+
+        .. important::
+
+           The cursor MUST NOT be used for anything else until the iterator is
+           exhausted or closed. Background thread is stopped when iterator is
+           closed (or garbage collected), but only after it finishes fetch
+           operation in progress.
+        """
+        if not self._ps:
+            raise ProgrammingError("Cannot fetch from this cursor because"
+                                   " it has not executed a statement.")
+        if depth < 1:
+            raise ProgrammingError("Prefetch depth must be positive.")
+        return self.__prefetch(self._ps._fetchone, depth)
+    def __prefetch(self, fetch, depth):
+        rows = queue.Queue(depth)
+        stop = threading.Event()
+        def put(item):
+            while not stop.is_set():
+                try:
+                    rows.put(item, timeout=0.1)
+                    return
+                except queue.Full:
+                    pass
+        def worker():
+            try:
+                while not stop.is_set():
+                    row = fetch()
+                    put((row, None))
+                    if row is None:
+                        return
+            except Exception as e:
+                put((None, e))
+        thread = threading.Thread(target=worker, name='interbase-prefetch')
+        thread.daemon = True
+        thread.start()
+        try:
+            while True:
+                row, error = rows.get()
+                if error is not None:
+                    raise error
+                if row is None:
+                    return
+                yield row
+        finally:
+            stop.set()
+            thread.join()
+    def fetch_columns(self, size=None):
+        """Fetch the next set of rows of a query result column-wise, rather than
+        as a list of tuples.
+
+        Numeric, date and time columns are returned as typed `array.array`
+        instances without creating Python objects for individual values:
+
+        * SMALLINT, INTEGER and BIGINT as 'h', 'i' and 'q' arrays,
+        * FLOAT and DOUBLE PRECISION as 'f' and 'd' arrays,
+        * NUMERIC and DECIMAL as 'd' array (scaled to float),
+        * BOOLEAN as 'B' array,
+        * DATE as 'i' array of days since 1.1.1970,
+        * TIMESTAMP as 'q' array of microseconds since 1.1.1970,
+        * TIME as 'q' array of microseconds since midnight.
+
+        Other columns are returned as lists of values like :meth:`fetchone`.
+        NULL values are stored as zero (None in lists) and flagged in
+        separate null mask.
+
+        :param integer size: Max. number of rows to fetch. If not specified,
+                             all remaining rows are fetched.
+        :returns: Tuple (columns, nulls), where `columns` is a list with one
+                  array (or list) per result column, and `nulls` is a list
+                  with one `array.array('B')` per result column, with 1 for
+                  NULL value.
+        :raises DatabaseError: When error is returned by server.
+        :raises ProgrammingError: When underlying :class:`PreparedStatement` is
+                                  closed, statement was not yet executed, or
+                                  unknown status is returned by fetch operation.
+
+        .. note::
+
+           Change flags of rows returned for active change view subscription
+           are not reported by this method.
+        """
+        if self._ps:
+            return self._ps._fetch_columns(size)
+        else:
+            raise ProgrammingError("Cannot fetch from this cursor because"
+                                   " it has not executed a statement.")
+    def fetch_columns_numpy(self, size=None):
+        """Equivalent to :meth:`fetch_columns`, except that it returns NumPy
+        arrays. DATE, TIMESTAMP and TIME columns are returned as `datetime64[D]`,
+        `datetime64[us]` and `timedelta64[us]` arrays, columns without numeric
+        representation as arrays of objects, and null masks as boolean arrays.
+
+        :param integer size: Max. number of rows to fetch. If not specified,
+                             all remaining rows are fetched.
+        :returns: Tuple (columns, nulls) of lists of `numpy.ndarray`.
+        :raises NotSupportedError: When NumPy is not installed.
+        :raises DatabaseError: When error is returned by server.
+        :raises ProgrammingError: When underlying :class:`PreparedStatement` is
+                                  closed, statement was not yet executed, or
+                                  unknown status is returned by fetch operation.
+        """
+        numpy = _import_numpy("fetch_columns_numpy()")
+        columns, nulls = self.fetch_columns(size)
+        result = []
+        for column, dtype in zip(columns, self._ps._get_column_dtypes()):
+            if dtype is None:
+                values = numpy.empty(len(column), dtype=object)
+                values[:] = column
+            elif len(column) == 0:
+                values = numpy.empty(0, dtype=dtype)
+            else:
+                values = numpy.frombuffer(column, dtype=column.typecode)
+                if values.dtype.itemsize == numpy.dtype(dtype).itemsize:
+                    values = values.view(dtype)
+                else:
+                    values = values.astype(dtype)
+            result.append(values)
+        return (result, [numpy.array(mask, dtype=numpy.bool_) for mask in nulls])
     def setinputsizes(self, sizes):
         """Required by Python DB API 2.0, but pointless for InterBase, so it
         does nothing."""
@@ -3631,8 +4884,8 @@ class Cursor(object):
 
            BLOB name is **permanently** added to the list of BLOBs handled
            as `stream` BLOBs by current :class:`PreparedStatement` instance.
-           If instance is stored in internal cache of prepared statements,
-           the same command executed repeatedly will retain this setting.
+           Such instance is not stored in :attr:`Connection.statement_cache`,
+           so the same command executed again gets materialized BLOBs.
 
         :param string blob_name: Name of BLOB column.
         :raises ProgrammingError:
@@ -3641,6 +4894,87 @@ class Cursor(object):
             self._ps.set_stream_blob(blob_name)
         else:
             raise ProgrammingError
+    def set_array_slice(self, name, bounds):
+        """Specify that only part of ARRAY column is fetched by already
+        executed statement. See :meth:`PreparedStatement.set_array_slice`
+        for details. Statement with this setting is not stored in
+        :attr:`Connection.statement_cache`, so the same command executed
+        again returns whole ARRAY values.
+
+        :param string name: Name of ARRAY column.
+        :param bounds: Sequence of (lower, upper) pairs for each dimension.
+        :raises ProgrammingError:
+        """
+        if self._ps:
+            self._ps.set_array_slice(name, bounds)
+        else:
+            raise ProgrammingError
+    def __array_slice_query(self, relation, column, where, extra=''):
+        sql = "SELECT %s%s FROM %s" % (column, extra, relation)
+        if where:
+            sql += " WHERE %s" % where
+        return sql
+    def read_array_slice(self, relation, column, bounds, where=None,
+                         parameters=None):
+        """Reads part of ARRAY column values. Only requested elements are
+        transferred from server.
+
+        :param string relation: Table name.
+        :param string column: ARRAY column name.
+        :param bounds: Sequence of (lower, upper) pairs (inclusive) for each
+                       dimension of the array.
+        :param string where: (Optional) Search condition for rows.
+        :param parameters: (Optional) Parameters for `where` condition.
+        :returns: List of array slices, one for each selected row (None for
+                  NULL values).
+        :raises ValueError: When bounds are outside of declared array bounds.
+        """
+        ps = self.prep(self.__array_slice_query(relation, column, where))
+        try:
+            ps.set_array_slice(ps.description[0][DESCRIPTION_NAME], bounds)
+            self.execute(ps, parameters or ())
+            return [row[0] for row in self.fetchall()]
+        finally:
+            ps.close()
+    def write_array_slice(self, relation, column, bounds, value, where=None,
+                          parameters=None):
+        """Updates part of ARRAY column values. Only new values of elements
+        within `bounds` are transferred to server, other elements are
+        preserved.
+
+        :param string relation: Table name.
+        :param string column: ARRAY column name.
+        :param bounds: Sequence of (lower, upper) pairs (inclusive) for each
+                       dimension of the array.
+        :param value: New value of the slice, (nested) sequence or
+                      `numpy.ndarray` with shape of the slice.
+        :param string where: (Optional) Search condition for updated rows.
+        :param parameters: (Optional) Parameters for `where` condition.
+        :returns: Number of updated rows.
+        :raises ValueError: When bounds are outside of declared array bounds,
+                            or value doesn't match them.
+        """
+        ps = self.prep(self.__array_slice_query(relation, column, where,
+                                                ", RDB$DB_KEY"))
+        try:
+            ps._raw_arrays = True
+            self.execute(ps, parameters or ())
+            rows = self.fetchall()
+        finally:
+            ps.close()
+        relname = ps._out_sqlda.sqlvar[0].relname
+        sqlname = ps._out_sqlda.sqlvar[0].sqlname
+        update = self.prep("UPDATE %s SET %s = ? WHERE RDB$DB_KEY = ?"
+                           % (relation, column))
+        try:
+            for arrayid, db_key in rows:
+                if arrayid is None:
+                    arrayid = ISC_QUAD(0, 0)
+                ps._write_array_slice(value, relname, sqlname, bounds, arrayid)
+                self.execute(update, (arrayid, db_key))
+        finally:
+            update.close()
+        return len(rows)
     def __del__(self):
         self.close()
     #: (Read Only) Sequence of 7-item sequences.
@@ -3684,6 +5018,13 @@ class Cursor(object):
     #: (Read Only) (:class:`Transaction`)
     #: Reference to the :class:`Transaction` object on which the cursor was created.
     transaction = property(__get_transaction)
+    #: (Read Only) (dict) Statistics of last :meth:`executemany` call, or None.
+    #: Keys are `executions` (number of parameter sets executed), `rowcount`
+    #: (total number of affected rows, -1 for other than DML statements or
+    #: when it was not requested by `count_rows`),
+    #: `elapsed` (seconds) and `batches` (list of (executions, rowcount, seconds)
+    #: tuples, one for each batch of executions).
+    executemany_stats = property(__get_executemany_stats)
 
 
 class Transaction(object):
@@ -3731,6 +5072,7 @@ class Transaction(object):
         self._isc_status = ISC_STATUS_ARRAY()
         self._tr_handle = None
         self.__closed = False
+        self.__metadata_changed = False
     def __remove_cursor(self, cursor_ref):
         self._cursors.remove(cursor_ref)
     def __get_closed(self):
@@ -3748,6 +5090,18 @@ class Transaction(object):
             c = cursor()
             if c:
                 c.close()
+    def __notify_metadata_change(self):
+        # Metadata changed by this transaction are now visible (or discarded),
+        # so statements prepared meanwhile are not valid anymore.
+        if self.__metadata_changed:
+            self.__metadata_changed = False
+            for connection in self._connections:
+                con = connection()
+                if con and not con.closed:
+                    con._metadata_changed()
+    def _set_metadata_changed(self):
+        # Marks transaction as the one that executed DDL statement.
+        self.__metadata_changed = True
     def __con_in_list(self,connection):
         for con in self._connections:
             if con() == connection:
@@ -3784,6 +5138,12 @@ class Transaction(object):
         """
         if not self.active:
             self.begin()
+        if _is_ddl_statement(sql):
+            self._set_metadata_changed()
+            for connection in self._connections:
+                con = connection()
+                if con and not con.closed:
+                    con._metadata_changed()
         for connection in self._connections:
             con = connection()
             sql = b(sql, con._python_charset)
@@ -3829,6 +5189,11 @@ class Transaction(object):
         """
         if self.__closed:
             raise ProgrammingError("Transaction is permanently closed.")
+        for connection in self._connections:
+            con = connection()
+            if con:
+                # Connection inherited from parent process is used first time
+                con._ensure_attached()
         self._finish()  # Make sure that previous transaction (if any) is ended
         self._tr_handle = isc_tr_handle(0)
         _tpb = tpb if tpb else self.default_tpb
@@ -3894,6 +5259,7 @@ class Transaction(object):
                                         "Error while commiting transaction:")
         if not retaining:
             self._tr_handle = None
+        self.__notify_metadata_change()
     def rollback(self, retaining=False, savepoint=None):
         """Rollback any pending transaction to the database.
 
@@ -3937,6 +5303,7 @@ class Transaction(object):
                                             "Error while rolling back transaction:")
             if not retaining:
                 self._tr_handle = None
+            self.__notify_metadata_change()
     def close(self):
         """Permanently closes the Transaction object and severs its associations
         with other objects (:class:`Cursor` and :class:`Connection` instances).
@@ -4158,6 +5525,128 @@ class Transaction(object):
     #: **Default is 'commit'**.
     default_action = property(__get_default_action,__set_default_action)
 
+class _ParallelTransaction(object):
+    """Distributed transaction composed from separate :class:`Transaction`
+    for each database server, so both phases of two-phase commit are performed
+    by all servers concurrently.
+
+    Used by :class:`ConnectionGroup` when its
+    :attr:`~ConnectionGroup.parallel_commit` is True.
+    """
+    def __init__(self, connections, default_tpb=None):
+        sites = collections.OrderedDict()
+        for con in connections:
+            sites.setdefault(con._get_db_identity()[1], []).append(con)
+        self._participants = [(site, Transaction(cons, default_tpb=default_tpb))
+                              for site, cons in sites.items()]
+        self.__transactions = {}
+        for site, transaction in self._participants:
+            for con in sites[site]:
+                self.__transactions[id(con)] = transaction
+        self.__prepared = False
+        self.__timings = []
+    def __run(self, phase, action, reset=True):
+        # Calls action(transaction) concurrently for all active participants
+        participants = [(site, transaction) for site, transaction
+                        in self._participants if transaction.active]
+        if reset:
+            self.__timings = [{'site': site} for site, transaction in participants]
+        timings = dict((timing['site'], timing) for timing in self.__timings)
+        errors = []
+        def run(site, transaction):
+            start = time.perf_counter()
+            try:
+                action(transaction)
+            except Exception as e:
+                errors.append(e)
+            timings.setdefault(site, {'site': site})[phase] = (time.perf_counter()
+                                                               - start)
+        if len(participants) == 1:
+            run(*participants[0])
+        else:
+            threads = [threading.Thread(target=run, args=participant,
+                                        name='interbase-2pc')
+                       for participant in participants]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        if errors:
+            raise errors[0]
+    def __get_active(self):
+        return any(transaction.active for site, transaction in self._participants)
+    def __get_timings(self):
+        return [timing.copy() for timing in self.__timings]
+    def __get_default_action(self):
+        return self._participants[0][1].default_action
+    def __set_default_action(self, action):
+        for site, transaction in self._participants:
+            transaction.default_action = action
+    def cursor(self, connection):
+        transaction = self.__transactions.get(id(connection))
+        if transaction is None:
+            raise ProgrammingError("Connection is not a member of this group.")
+        return transaction.cursor(connection)
+    def begin(self, tpb=None):
+        self.__prepared = False
+        started = []
+        try:
+            for site, transaction in self._participants:
+                transaction.begin(tpb)
+                started.append(transaction)
+        except:
+            for transaction in started:
+                transaction.rollback()
+            raise
+    def execute_immediate(self, sql):
+        if not self.active:
+            self.begin()
+        for site, transaction in self._participants:
+            transaction.execute_immediate(sql)
+    def create_savepoint(self, name):
+        for site, transaction in self._participants:
+            transaction.create_savepoint(name)
+    def release_savepoint(self, name):
+        for site, transaction in self._participants:
+            transaction.release_savepoint(name)
+    def prepare(self):
+        try:
+            self.__run('prepare', lambda transaction: transaction.prepare())
+        except:
+            # Participants prepared so far must be rolled back
+            self.__run('rollback', lambda transaction: transaction.rollback(),
+                       False)
+            raise
+        self.__prepared = True
+    def commit(self, retaining=False):
+        if not self.active:
+            return
+        if len(self._participants) > 1 and not self.__prepared:
+            self.prepare()
+        try:
+            self.__run('commit', lambda transaction: transaction.commit(retaining),
+                       not self.__prepared)
+        finally:
+            self.__prepared = False
+    def rollback(self, retaining=False, savepoint=None):
+        if savepoint is None:
+            self.__prepared = False
+        self.__run('rollback', lambda transaction: transaction.rollback(retaining,
+                                                                        savepoint))
+    def close(self):
+        exc = None
+        for site, transaction in self._participants:
+            try:
+                transaction.close()
+            except Exception as e:
+                exc = exc or e
+        if exc:
+            raise exc
+
+    active = property(__get_active)
+    timings = property(__get_timings)
+    default_action = property(__get_default_action, __set_default_action)
+
 class ConnectionGroup(object):
     """Manager for distributed transactions, i.e. transactions that span multiple
     databases.
@@ -4177,6 +5666,12 @@ class ConnectionGroup(object):
     # aliases, IP host name aliases, remote-vs-local protocols, etc.
     # Therefore, a warning must be added to the docs.
 
+    #: (boolean) When True, distributed transaction consists of separate
+    #: transaction for each database server, and both phases of two-phase
+    #: commit are performed by all servers concurrently. Must be set before
+    #: the transaction is started.
+    parallel_commit = False
+
     def __init__(self, connections=()):
         """
         :param iterable connections: Sequence of :class:`Connection` instances.
@@ -4194,6 +5689,10 @@ class ConnectionGroup(object):
         return self._default_tpb
     def __set_default_tpb(self, value):
         self._default_tpb = _validateTPB(value)
+    def __get_timings(self):
+        if isinstance(self._transaction, _ParallelTransaction):
+            return self._transaction.timings
+        return []
     def disband(self):
         """Forcefully deletes all connections from connection group.
 
@@ -4301,9 +5800,7 @@ class ConnectionGroup(object):
         :raises ProgrammingError: When group is empty or specified `connection`
                                   doesn't belong to this group.
         """
-        if not self._transaction:
-            self.__require_non_empty_group('start')
-            self._transaction = Transaction(self._cons)
+        self.__ensure_transaction()
         return self._transaction.cursor(connection)
     def members(self):
         "Returns list of connection objects that belong to this group."
@@ -4338,8 +5835,12 @@ class ConnectionGroup(object):
     def __ensure_transaction(self):
         if not self._transaction:
             self.__require_non_empty_group('start')
-            self._transaction = Transaction(self._cons,
-                                            default_tpb=self.default_tpb)
+            if self.parallel_commit:
+                self._transaction = _ParallelTransaction(self._cons,
+                                                         default_tpb=self.default_tpb)
+            else:
+                self._transaction = Transaction(self._cons,
+                                                default_tpb=self.default_tpb)
     # Transactional methods:
     def execute_immediate(self, sql):
         """Executes a statement on all member connections without caching its
@@ -4451,6 +5952,14 @@ class ConnectionGroup(object):
 
     #: (Read/Write) Default Transaction Parameter Block used for transactions.
     default_tpb = property(__get_default_tpb, __set_default_tpb)
+    #: (Read Only) List of dictionaries with times (in seconds) spent by each
+    #: database server in phases of the last transaction when
+    #: :attr:`parallel_commit` is True. Each dictionary has `site` (server
+    #: name) key, and 'prepare', 'commit' and 'rollback' keys for
+    #: performed phases ('prepare' is missing when transaction on single
+    #: server was committed in one phase). Empty list when
+    #: :attr:`parallel_commit` is False.
+    timings = property(__get_timings)
 
 
 class BlobReader(object):
@@ -4481,8 +5990,16 @@ class BlobReader(object):
         self.__python_charset = charset_map.get(charset,charset)
         self.__blobid = blobid
         self.__opened = False
+        self.__generation = _fork_generation
         self._blob_handle = isc_blob_handle()
         self._isc_status = ISC_STATUS_ARRAY()
+        if ((self.__charset or PYTHON_MAJOR_VER == 3) and self.__is_text
+            and self.__python_charset):
+            # Incremental decoder keeps incomplete multi-byte characters
+            # between reads
+            self.__decoder = codecs.getincrementaldecoder(self.__python_charset)()
+        else:
+            self.__decoder = None
     def __ensure_open(self):
         if self.closed:
             raise ProgrammingError("BlobReader is closed.")
@@ -4526,38 +6043,42 @@ class BlobReader(object):
                     offset + 2:offset + 2 + length])
                 offset += length + 2
         # Create internal buffer
-        self.__buf = ctypes.create_string_buffer(self._segment_size)
+        self.__buf = bytearray(self._segment_size)
+        self.__cbuf = (ctypes.c_char * self._segment_size).from_buffer(self.__buf)
         self.__buf_pos = 0
         self.__buf_data = 0
         self.__opened = True
     def __reset_buffer(self):
-        ctypes.memset(self.__buf,0,self._segment_size)
         self.__buf_pos = 0
         self.__buf_data = 0
-    def __BLOB_get(self):
-        self.__reset_buffer()
-        # Load BLOB
-        allow_incomplete_segment_read = False
-        status = ISC_STATUS(0)
-        bytes_read = 0
+    def __get_segment(self, target, size):
+        """Reads at most `size` bytes from BLOB into ctypes `target` and
+        returns number of bytes actually read (0 on BLOB EOF).
+        """
         bytes_actually_read = ctypes.c_ushort(0)
         status = api.isc_get_segment(self._isc_status,
                                        self._blob_handle,
                                        bytes_actually_read,
-                                       self._segment_size,
-                                       ctypes.byref(self.__buf))
+                                       min(size, MAX_BLOB_SEGMENT_SIZE),
+                                       ctypes.byref(target))
         if status != 0:
             if status == ibase.isc_segstr_eof:
-                self.__buf_data = 0
-            elif ((status == isc_segment)
-                and allow_incomplete_segment_read):
-                self.__buf_data = bytes_actually_read.value
-            else:
+                return 0
+            elif status != isc_segment:
                 raise exception_from_status(DatabaseError,
                                             self._isc_status,
                                             "BlobReader.__BLOB_get/isc_get_segment:")
-        else:
-            self.__buf_data = bytes_actually_read.value
+            # isc_segment: segment didn't fit, the rest is returned by
+            # next call
+        return bytes_actually_read.value
+    def __BLOB_get(self):
+        self.__reset_buffer()
+        self.__buf_data = self.__get_segment(self.__cbuf, self._segment_size)
+    def __decode(self, data):
+        # Converts raw BLOB data to unicode for TEXT BLOBs
+        if self.__decoder is None:
+            return bytes(data)
+        return self.__decoder.decode(data, self.__pos >= self._blob_length)
     def close(self):
         """Closes the Reader. Like :meth:`file.close`.
 
@@ -4565,6 +6086,9 @@ class BlobReader(object):
         """
         if self.__opened and not self.closed:
             self.__closed = True
+            if self.__generation != _fork_generation:
+                # BLOB was opened by parent process
+                return
             api.isc_close_blob(self._isc_status, self._blob_handle)
             if db_api_error(self._isc_status):
                 raise exception_from_status(DatabaseError,
@@ -4601,33 +6125,69 @@ class BlobReader(object):
            Performs automatic conversion to `unicode` for TEXT BLOBs, if used
            Python is v3 or `connection charset` is defined.
         """
+        result = self.read_view(size)
+        if self.__decoder is None:
+            return result.tobytes()
+        return self.__decode(result)
+    def readinto(self, buffer):
+        """Read up to `len(buffer)` bytes into `buffer` and return the
+        number of bytes read (0 on EOF). Like :meth:`io.RawIOBase.readinto`.
+
+        Whole segments are read directly into `buffer`, without copying
+        through internal buffer.
+
+        :param buffer: Writable object supporting buffer protocol, for example
+           `bytearray`, `mmap` or writable `memoryview`.
+
+        :raises ProgrammingError: When reader is closed.
+
+        .. note::
+
+           Data are NOT converted to `unicode` even for TEXT BLOBs.
+        """
         self.__ensure_open()
-        if size >= 0:
-            to_read = min(size,self._blob_length - self.__pos)
-        else:
-            to_read = self._blob_length - self.__pos
-        return_size = to_read
-        result = ctypes.create_string_buffer(return_size)
-        pos = 0
+        view = memoryview(buffer).cast('B')
+        to_read = min(len(view), self._blob_length - self.__pos)
+        done = 0
         while to_read > 0:
             to_copy = min(to_read, self.__buf_data - self.__buf_pos)
-            if to_copy == 0:
+            if to_copy > 0:
+                # Data left in internal buffer after readline()
+                view[done:done + to_copy] = self.__buf[self.__buf_pos:
+                                                       self.__buf_pos + to_copy]
+                self.__buf_pos += to_copy
+            elif to_read >= self._segment_size:
+                to_copy = self.__get_segment((ctypes.c_char * to_read).from_buffer(view, done),
+                                             to_read)
+            else:
                 self.__BLOB_get()
-                to_copy = min(to_read, self.__buf_data - self.__buf_pos)
-                if to_copy == 0:
-                    # BLOB EOF
-                    break
-            ctypes.memmove(ctypes.byref(result,pos),
-                           ctypes.byref(self.__buf,self.__buf_pos),
-                           to_copy)
-            pos += to_copy
+                continue
+            if to_copy == 0:
+                # BLOB EOF
+                break
+            done += to_copy
             self.__pos += to_copy
-            self.__buf_pos += to_copy
             to_read -= to_copy
-        result = result.raw[:return_size]
-        if (self.__charset or PYTHON_MAJOR_VER == 3) and self.__is_text:
-            result = b2u(result,self.__python_charset)
-        return result
+        return done
+    def read_view(self, size = -1):
+        """Read at most size bytes (all data until EOF if size is negative or
+        omitted) and return them as :class:`memoryview` over new
+        `bytearray`. Empty view is returned when EOF is encountered
+        immediately.
+
+        :raises ProgrammingError: When reader is closed.
+
+        .. note::
+
+           Data are NOT converted to `unicode` even for TEXT BLOBs.
+        """
+        self.__ensure_open()
+        if size >= 0:
+            to_read = min(size,self._blob_length - self.__pos)
+        else:
+            to_read = self._blob_length - self.__pos
+        result = bytearray(to_read)
+        return memoryview(result)[:self.readinto(result)]
     def readline(self):
         """Read one entire line from the file. A trailing newline character is
         kept in the string (but may be absent when a file ends with an incomplete
@@ -4642,11 +6202,9 @@ class BlobReader(object):
            Python is v3 or `connection charset` is defined.
         """
         self.__ensure_open()
-        line = []
+        line = bytearray()
         to_read = self._blob_length - self.__pos
-        to_copy = 0
-        found = False
-        while to_read > 0 and not found:
+        while to_read > 0:
             to_scan = min(to_read, self.__buf_data - self.__buf_pos)
             if to_scan == 0:
                 self.__BLOB_get()
@@ -4654,22 +6212,16 @@ class BlobReader(object):
                 if to_scan == 0:
                     # BLOB EOF
                     break
-            pos = 0
-            result = ''
-            while pos < to_scan:
-                if self.__buf[self.__buf_pos+pos] == ibase.b('\n'):
-                    found = True
-                    pos += 1
-                    break
-                pos += 1
-            result = ctypes.string_at(ctypes.byref(self.__buf,self.__buf_pos), pos)
-            if (self.__charset or PYTHON_MAJOR_VER == 3)  and self.__is_text:
-                result = b2u(result,self.__python_charset)
-            line.append(result)
-            self.__buf_pos += pos
-            self.__pos += pos
-            to_read -= pos
-        return ''.join(line)
+            end = self.__buf.find(b'\n', self.__buf_pos, self.__buf_pos + to_scan)
+            if end >= 0:
+                to_scan = end + 1 - self.__buf_pos
+            line += self.__buf[self.__buf_pos:self.__buf_pos + to_scan]
+            self.__buf_pos += to_scan
+            self.__pos += to_scan
+            to_read -= to_scan
+            if end >= 0:
+                break
+        return self.__decode(line)
     def readlines(self, sizehint = None):
         """Read until EOF using :meth:`readline` and return a list containing
         the lines thus read. The optional sizehint argument (if present) is ignored.
@@ -4712,6 +6264,8 @@ class BlobReader(object):
                                         "BlobReader.seek/isc_blob_info:")
         self.__pos = pos.value
         self.__reset_buffer()
+        if self.__decoder is not None:
+            self.__decoder.reset()
     def tell(self):
         """Return current position in BLOB, like stdio‘s `ftell()`
         and :meth:`file.tell`."""
@@ -4730,7 +6284,8 @@ class BlobReader(object):
 
 class _RowMapping(object):
     """An internal dictionary-like class that wraps a row of results in order to
-    map field name to field value.
+    map field name to field value. Field name to position map
+    (:class:`_FieldIndex`) is shared by all rows of the same statement.
 
     .. warning::
 
@@ -4743,35 +6298,17 @@ class _RowMapping(object):
        Therefore, client programmers should NOT rely on the return value being
        an instance of a particular class or type.
     """
-    def __init__(self, description, row):
-        self._description = description
-        fields = self._fields = {}
-        pos = 0
-        for fieldSpec in description:
-            # It's possible for a result set from the database engine to return
-            # multiple fields with the same name, but interbase's key-based
-            # row interface only honors the first (thus setdefault, which won't
-            # store the position if it's already present in self._fields).
-            fields.setdefault(fieldSpec[DESCRIPTION_NAME], row[pos])
-            pos += 1
+    __slots__ = ('_index', '_row')
+    def __init__(self, index, row):
+        if not isinstance(index, _FieldIndex):
+            # Description
+            index = _FieldIndex(index)
+        self._index = index
+        self._row = row
     def __len__(self):
-        return len(self._fields)
+        return len(self._index.positions)
     def __getitem__(self, fieldName):
-        fields = self._fields
-        # Straightforward, unnormalized lookup will work if the fieldName is
-        # already uppercase and/or if it refers to a database field whose
-        # name is case-sensitive.
-        if fieldName in fields:
-            return fields[fieldName]
-        else:
-            fieldNameNormalized = _normalizeDatabaseIdentifier(fieldName)
-            try:
-                return fields[fieldNameNormalized]
-            except KeyError:
-                raise KeyError('Result set has no field named "%s".  The field'
-                               ' name must be one of: (%s)'
-                               % (fieldName, ', '.join(fields.keys()))
-                               )
+        return self._row[self._index.index(fieldName)]
     def get(self, fieldName, defaultValue=None):
         try:
             return self[fieldName]
@@ -4779,7 +6316,7 @@ class _RowMapping(object):
             return defaultValue
     def __contains__(self, fieldName):
         try:
-            self[fieldName]
+            self._index.index(fieldName)
         except KeyError:
             return False
         else:
@@ -4789,19 +6326,18 @@ class _RowMapping(object):
         # corresponding values.
         return '<result set row with %s>' % ', '.join([
             '%s = %s' % (fieldName, self[fieldName])
-            for fieldName in self._fields.keys()
+            for fieldName in self._index.positions.keys()
         ])
     def keys(self):
         # Note that this is an *ordered* list of keys.
-        return [fieldSpec[DESCRIPTION_NAME] for fieldSpec in self._description]
+        return list(self._index.names)
     def values(self):
         # Note that this is an *ordered* list of values.
         return [self[fieldName] for fieldName in self.keys()]
     def items(self):
         return [(fieldName, self[fieldName]) for fieldName in self.keys()]
     def iterkeys(self):
-        for fieldDesc in self._description:
-            yield fieldDesc[DESCRIPTION_NAME]
+        return iter(self._index.names)
     __iter__ = iterkeys
     def itervalues(self):
         for fieldName in self:
@@ -4811,6 +6347,117 @@ class _RowMapping(object):
             yield fieldName, self[fieldName]
 
 
+class _FieldIndex(object):
+    """Maps field names of result set to positions in rows. It's computed
+    once per statement, and shared by all rows returned by it.
+    """
+    __slots__ = ('description', 'names', 'positions')
+    def __init__(self, description):
+        self.description = description
+        #: Ordered list of field names
+        self.names = [fieldSpec[DESCRIPTION_NAME] for fieldSpec in description]
+        self.positions = {}
+        for i, name in enumerate(self.names):
+            # It's possible for a result set from the database engine to return
+            # multiple fields with the same name, but interbase's key-based
+            # row interface only honors the first (thus setdefault, which won't
+            # store the position if it's already present).
+            self.positions.setdefault(name, i)
+    def index(self, fieldName):
+        "Returns position of field in row."
+        positions = self.positions
+        # Straightforward, unnormalized lookup will work if the fieldName is
+        # already uppercase and/or if it refers to a database field whose
+        # name is case-sensitive.
+        if fieldName in positions:
+            return positions[fieldName]
+        try:
+            return positions[_normalizeDatabaseIdentifier(fieldName)]
+        except KeyError:
+            raise KeyError('Result set has no field named "%s".  The field'
+                           ' name must be one of: (%s)'
+                           % (fieldName, ', '.join(positions.keys())))
+
+class _LazyRowPlan(object):
+    """Description of columns in raw row snapshot, shared by all
+    :class:`_LazyRow` instances returned by single statement.
+    """
+    __slots__ = ('columns', 'fields')
+    def __init__(self, columns, fields):
+        #: Sequence of (data offset, unpack, converter, NULL indicator offset)
+        self.columns = columns
+        #: :class:`_FieldIndex` of the statement
+        self.fields = fields
+
+_NOT_DECODED = object()
+
+class _LazyRow(object):
+    """An internal sequence-like class that holds snapshot of raw row data, and
+    decodes column values only when they are accessed (by position or field
+    name). Decoded values are cached.
+
+    .. warning::
+
+       BLOB and ARRAY values are read from database when accessed, so they
+       must be accessed while the transaction is active.
+    """
+    __slots__ = ('_plan', '_raw', '_values')
+    def __init__(self, plan, raw):
+        self._plan = plan
+        self._raw = raw
+        self._values = [_NOT_DECODED] * len(plan.columns)
+    def __decode(self, i):
+        value = self._values[i]
+        if value is _NOT_DECODED:
+            offset, unpack, convert, ind_offset = self._plan.columns[i]
+            raw = self._raw
+            flag = 0 if ind_offset is None else _unpack_short(raw, ind_offset)[0]
+            # NULL handling
+            if flag < 0:
+                value = None
+            else:
+                if convert is None:
+                    value = unpack(raw, offset)[0]
+                else:
+                    value = convert(*unpack(raw, offset))
+                # Change view
+                if flag & _SQLIND_CHANGES:
+                    value = [value, flag]
+            self._values[i] = value
+        return value
+    def __len__(self):
+        return len(self._values)
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            return tuple([self.__decode(i) for i in xrange(len(self._values))[key]])
+        if isinstance(key, (int, mylong)):
+            if key < 0:
+                key += len(self._values)
+            if not 0 <= key < len(self._values):
+                raise IndexError("row index out of range")
+            return self.__decode(key)
+        return self.__decode(self._plan.fields.index(key))
+    def __iter__(self):
+        for i in xrange(len(self._values)):
+            yield self.__decode(i)
+    def __eq__(self, other):
+        if isinstance(other, _LazyRow):
+            other = tuple(other)
+        return tuple(self) == other
+    def __ne__(self, other):
+        return not self == other
+    __hash__ = None
+    def __repr__(self):
+        return repr(tuple(self))
+    def get(self, fieldName, defaultValue=None):
+        try:
+            return self[self._plan.fields.index(fieldName)]
+        except KeyError:
+            return defaultValue
+    def keys(self):
+        return list(self._plan.fields.names)
+
+
 class _RequestBufferBuilder(object):
     def __init__(self, clusterIdentifier=None):
         self.clear()
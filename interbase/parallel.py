@@ -0,0 +1,425 @@
+#coding:utf-8
+#
+#   PROGRAM/MODULE: interbase
+#   FILE:           parallel.py
+#   DESCRIPTION:    Parallel query execution for InterBase driver
+#   CREATED:        18.10.2026
+#
+#  Software distributed under the License is distributed AS IS,
+#  WITHOUT WARRANTY OF ANY KIND, either express or implied.
+#  See the License for the specific language governing rights
+#  and limitations under the License.
+#
+#  Portions created by Embarcadero Technologies to support
+#  InterBase are Copyright (c) 2023 by Embarcadero Technologies, Inc.
+#
+#  See LICENSE.TXT for details.
+
+"""Parallel query execution over multiple database attachments.
+
+The InterBase client library is called through :mod:`ctypes`, which releases
+the GIL for the duration of each call, so several attachments could fetch
+rows at the same time from separate threads.
+"""
+
+import heapq
+import queue
+import threading
+
+import interbase
+
+__all__ = ['scan', 'fanout', 'fanout_aggregate']
+
+# Functions that combine partial aggregates computed by individual databases
+_AGGREGATE_COMBINERS = {
+    'count': lambda x, y: x + y,
+    'sum': lambda x, y: x + y,
+    'min': min,
+    'max': max,
+}
+
+
+def _put(items, item, stop):
+    # Puts item to bounded queue unless consumer stopped in the meantime
+    while not stop.is_set():
+        try:
+            items.put(item, timeout=0.1)
+            return True
+        except queue.Full:
+            pass
+    return False
+
+# Marks the end of items passed by worker
+_DONE = object()
+
+def _start_workers(workers, queues, stop):
+    """Runs each callable from `workers` in its own thread. Items passed by
+    worker to its `put` argument are put to corresponding queue from `queues`
+    as (item, None) pairs, followed by (_DONE, None) pair, or by (None, error)
+    pair when worker fails.
+
+    Each worker is called as `worker(put, stop)`, where `stop` is
+    :class:`threading.Event` set when consumer stops reading the queues.
+    """
+    def run(worker, items):
+        try:
+            worker(lambda item: _put(items, (item, None), stop), stop)
+            _put(items, (_DONE, None), stop)
+        except Exception as e:
+            _put(items, (None, e), stop)
+    threads = [threading.Thread(target=run, args=(worker, items),
+                                name='interbase-parallel')
+               for worker, items in zip(workers, queues)]
+    for thread in threads:
+        thread.daemon = True
+        thread.start()
+    return threads
+
+def _stop_workers(threads, stop):
+    stop.set()
+    for thread in threads:
+        thread.join()
+
+def _run_parallel(workers, depth):
+    """Runs workers (see :func:`_start_workers`) and yields items they pass,
+    in order of arrival. Error raised by any worker stops all workers and is
+    re-raised by the iterator.
+    """
+    items = queue.Queue(depth)
+    stop = threading.Event()
+    threads = _start_workers(workers, [items] * len(workers), stop)
+    try:
+        running = len(threads)
+        while running:
+            item, error = items.get()
+            if error is not None:
+                raise error
+            if item is _DONE:
+                running -= 1
+            else:
+                yield item
+    finally:
+        _stop_workers(threads, stop)
+
+def _key_ranges(low, high, partitions):
+    # Splits closed interval <low, high> of integers into half-open ranges
+    step = -(-(high - low + 1) // partitions)
+    return [(start, min(start + step, high + 1))
+            for start in range(low, high + 1, step)]
+
+def _scan_iter(connect_args, table, key, partitions, columns, where,
+               parameters, ranges, batch_size):
+    con = interbase.connect(**connect_args)
+    try:
+        if ranges is None:
+            cur = con.query_transaction.cursor()
+            cur.execute('SELECT MIN(%s), MAX(%s) FROM %s%s'
+                        % (key, key, table,
+                           ' WHERE %s' % where if where else ''),
+                        parameters)
+            low, high = cur.fetchone()
+            con.query_transaction.commit()
+            if low is None:
+                # Empty table
+                con.close()
+                return
+            if not (isinstance(low, int) and isinstance(high, int)):
+                raise interbase.ProgrammingError("Key ranges could be computed"
+                                                 " only for integer key,"
+                                                 " use 'ranges' parameter.")
+            ranges = _key_ranges(low, high, partitions)
+        else:
+            ranges = list(ranges)
+    except:
+        con.close()
+        raise
+    pending = queue.Queue()
+    for bounds in ranges:
+        pending.put(bounds)
+    sql = 'SELECT %s FROM %s' % (', '.join(columns) if columns else '*', table)
+    connections = [con]
+    def worker(put, stop):
+        # Attachment used to compute ranges is reused by one of workers
+        try:
+            connection = connections.pop()
+        except IndexError:
+            connection = interbase.connect(**connect_args)
+        try:
+            cur = connection.query_transaction.cursor()
+            while not stop.is_set():
+                try:
+                    low, high = pending.get_nowait()
+                except queue.Empty:
+                    return
+                conditions = []
+                params = []
+                if low is not None:
+                    conditions.append('%s >= ?' % key)
+                    params.append(low)
+                if high is not None:
+                    conditions.append('%s < ?' % key)
+                    params.append(high)
+                if where:
+                    conditions.append('(%s)' % where)
+                    params.extend(parameters)
+                cur.execute(sql + (' WHERE ' + ' AND '.join(conditions)
+                                   if conditions else ''), params)
+                while not stop.is_set():
+                    rows = cur.fetchmany(batch_size)
+                    if not rows:
+                        break
+                    put(rows)
+        finally:
+            connection.close()
+    workers = [worker for i in range(min(partitions, len(ranges)))]
+    try:
+        for batch in _run_parallel(workers, partitions * 2):
+            yield batch
+    finally:
+        while connections:
+            connections.pop().close()
+
+def scan(dsn, table, key, partitions=4, columns=None, where=None,
+         parameters=None, ranges=None, batch_size=1000, callback=None,
+         **kwargs):
+    """Reads all rows of a table through several database attachments in
+    parallel.
+
+    Table is split into ranges of `key` column values, and each range is
+    read by separate query. By default, `partitions` ranges of the same width
+    are computed from MIN and MAX value of `key` (that should be indexed
+    integer column). Each of `partitions` attachments (and threads) reads
+    ranges until all of them are read.
+
+    Rows are returned in batches (lists of tuples like
+    :meth:`~interbase.Cursor.fetchmany`) in order of arrival, so rows from
+    different ranges are interleaved.
+
+    :param string dsn: Connection string, see :func:`interbase.connect`.
+    :param string table: Table (or view) name.
+    :param string key: Name of column used to split the table.
+    :param integer partitions: Number of attachments used in parallel.
+    :param columns: Sequence of names of returned columns. All columns are
+                    returned by default.
+    :param string where: Additional search condition for rows.
+    :param parameters: Sequence of parameters for `where` condition.
+    :param ranges: Iterable of (low, high) pairs with key ranges to read,
+                   used instead of computed ones. Each range includes `low`
+                   and excludes `high` value; `None` means unbounded.
+    :param integer batch_size: Max. number of rows in single batch.
+    :param callback: Callable called with each batch. Called in the thread
+                     that called this function.
+    :param kwargs: Other parameters for :func:`interbase.connect`.
+    :returns: Iterator of row batches, or total number of rows when
+              `callback` is specified.
+
+    :raises ProgrammingError: For bad parameter values, or when ranges are
+       not specified and `key` is not an integer column.
+
+    .. important::
+
+       Each attachment reads its ranges in its own transaction, so the result
+       is not a consistent snapshot of the table when it's modified
+       concurrently.
+
+    Example:
+
+    .. code-block:: python
+
+       import interbase.parallel
+
+       for batch in interbase.parallel.scan('localhost:employee', 'SALES',
+                                            'PO_NUMBER', partitions=4,
+                                            ranges=[(None, 'V92E'),
+                                                    ('V92E', None)],
+                                            user='sysdba',
+                                            password='masterkey'):
+           process(batch)
+    """
+    if partitions < 1:
+        raise interbase.ProgrammingError("Number of partitions must be positive.")
+    if batch_size < 1:
+        raise interbase.ProgrammingError("Batch size must be positive.")
+    if dsn:
+        kwargs['dsn'] = dsn
+    batches = _scan_iter(kwargs, table, key, partitions, columns, where,
+                         tuple(parameters or ()), ranges, batch_size)
+    if callback is None:
+        return batches
+    count = 0
+    for batch in batches:
+        callback(batch)
+        count += len(batch)
+    return count
+
+def _connection_list(connections):
+    if isinstance(connections, interbase.ConnectionGroup):
+        connections = connections.members()
+    else:
+        connections = list(connections)
+    if not connections:
+        raise interbase.ProgrammingError("At least one connection is required.")
+    return connections
+
+def _query_worker(connection, sql, parameters, batch_size):
+    # Returns worker for _run_parallel that passes row batches of the query
+    def worker(put, stop):
+        cur = connection.query_transaction.cursor()
+        try:
+            cur.execute(sql, parameters)
+            while not stop.is_set():
+                rows = cur.fetchmany(batch_size)
+                if not rows:
+                    return
+                put(rows)
+        finally:
+            cur.close()
+    return worker
+
+def _fanout_unordered(connections, sql, parameters, batch_size):
+    for batch in _run_parallel([_query_worker(con, sql, parameters, batch_size)
+                                for con in connections], len(connections) * 2):
+        for row in batch:
+            yield row
+
+def _nulls_key(key, nulls_first):
+    # Wraps sort key, so NULL (None) values are ordered before or after
+    # all other values instead of raising TypeError
+    def wrap(value):
+        return (value is None) != nulls_first, value
+    def nulls_key(row):
+        value = row if key is None else key(row)
+        if isinstance(value, tuple):
+            return tuple([wrap(item) for item in value])
+        return wrap(value)
+    return nulls_key
+
+def _fanout_merged(connections, sql, parameters, key, nulls_first, batch_size):
+    stop = threading.Event()
+    streams = [queue.Queue(2) for con in connections]
+    def rows(stream):
+        while True:
+            batch, error = stream.get()
+            if error is not None:
+                raise error
+            if batch is _DONE:
+                return
+            for row in batch:
+                yield row
+    threads = _start_workers([_query_worker(con, sql, parameters, batch_size)
+                              for con in connections], streams, stop)
+    try:
+        for row in heapq.merge(*[rows(stream) for stream in streams],
+                               key=_nulls_key(key, nulls_first)):
+            yield row
+    finally:
+        _stop_workers(threads, stop)
+
+def fanout(connections, sql, parameters=None, merge=False, key=None,
+           nulls_first=False, batch_size=1000):
+    """Executes the same query on several databases in parallel, and returns
+    iterator over rows from all of them.
+
+    Each database is queried from its own thread, using the read-only
+    :attr:`~interbase.Connection.query_transaction` of the connection.
+
+    :param connections: :class:`~interbase.ConnectionGroup` or sequence of
+                        :class:`~interbase.Connection` instances. Each
+                        connection must be attached to different database.
+    :param string sql: SELECT statement.
+    :param parameters: Sequence of statement parameters.
+    :param bool merge: When False, rows are returned in order of arrival.
+                       When True, rows are merged into single sorted stream,
+                       so the query must return rows sorted by `key`.
+    :param key: Function that returns sort key of the row (like in
+                :func:`sorted`) for `merge`. Whole row is used by default.
+    :param bool nulls_first: When True, `merge` expects rows with NULL in
+                             the sort key before other rows (NULLS FIRST).
+                             By default they're expected last, as InterBase
+                             sorts them in ascending order.
+    :param integer batch_size: Number of rows fetched at once from each
+                               database.
+    :returns: Iterator of tuples like :meth:`~interbase.Cursor.fetchone`.
+
+    :raises ProgrammingError: When no connection is given.
+
+    Example:
+
+    .. code-block:: python
+
+       for row in interbase.parallel.fanout(shards,
+               'select cust_no, customer from customer order by cust_no',
+               merge=True, key=lambda row: row[0]):
+           print(row)
+    """
+    connections = _connection_list(connections)
+    if batch_size < 1:
+        raise interbase.ProgrammingError("Batch size must be positive.")
+    parameters = tuple(parameters or ())
+    if merge:
+        return _fanout_merged(connections, sql, parameters, key, nulls_first,
+                              batch_size)
+    return _fanout_unordered(connections, sql, parameters, batch_size)
+
+def fanout_aggregate(connections, sql, functions, parameters=None):
+    """Executes the same aggregate query on several databases in parallel
+    (see :func:`fanout`), and combines partial aggregates returned by them.
+
+    The query returns columns of the GROUP BY clause and aggregates computed
+    by individual databases. Rows with the same values in GROUP BY columns
+    are combined into single row using `functions`.
+
+    :param connections: :class:`~interbase.ConnectionGroup` or sequence of
+                        :class:`~interbase.Connection` instances.
+    :param string sql: SELECT statement with aggregate functions.
+    :param functions: Sequence with item for each result column: `None` for
+                      GROUP BY column, otherwise name of function used to
+                      combine partial values: 'count', 'sum', 'min' or 'max'.
+                      NULL values are ignored.
+    :param parameters: Sequence of statement parameters.
+    :returns: List of tuples with combined rows, in order in which groups
+              were first returned.
+
+    :raises ProgrammingError: For unknown function name, or when number of
+       functions doesn't match number of result columns.
+
+    .. note::
+
+       AVG can't be combined from partial averages, use SUM and COUNT and
+       divide the combined values instead.
+
+    Example:
+
+    .. code-block:: python
+
+       rows = interbase.parallel.fanout_aggregate(shards,
+           'select country, count(*), sum(total_value), max(order_date)'
+           ' from sales group by country', [None, 'count', 'sum', 'max'])
+    """
+    functions = list(functions)
+    combiners = []
+    for function in functions:
+        if function is None:
+            combiners.append(None)
+        elif function.lower() in _AGGREGATE_COMBINERS:
+            combiners.append(_AGGREGATE_COMBINERS[function.lower()])
+        else:
+            raise interbase.ProgrammingError("Unknown aggregate function '%s'."
+                                             % function)
+    groups = {}
+    for row in fanout(connections, sql, parameters):
+        if len(row) != len(combiners):
+            raise interbase.ProgrammingError("Query returns %d columns, but %d"
+                                             " functions were specified."
+                                             % (len(row), len(combiners)))
+        group = tuple(value for value, combine in zip(row, combiners)
+                      if combine is None)
+        current = groups.get(group)
+        if current is None:
+            groups[group] = list(row)
+        else:
+            for i, combine in enumerate(combiners):
+                if combine is not None and row[i] is not None:
+                    current[i] = (row[i] if current[i] is None
+                                  else combine(current[i], row[i]))
+    return [tuple(row) for row in groups.values()]
@@ -0,0 +1,345 @@
+#coding:utf-8
+#
+#   PROGRAM/MODULE: interbase
+#   FILE:           pool.py
+#   DESCRIPTION:    Connection pool for InterBase driver
+#   CREATED:        18.10.2026
+#
+#  Software distributed under the License is distributed AS IS,
+#  WITHOUT WARRANTY OF ANY KIND, either express or implied.
+#  See the License for the specific language governing rights
+#  and limitations under the License.
+#
+#  Portions created by Embarcadero Technologies to support
+#  InterBase are Copyright (c) 2023 by Embarcadero Technologies, Inc.
+#
+#  See LICENSE.TXT for details.
+
+"""Thread-safe pool of :class:`~interbase.Connection` instances.
+
+Example:
+
+.. code-block:: python
+
+   import interbase.pool
+
+   pool = interbase.pool.ConnectionPool(dsn='localhost:employee',
+                                        user='sysdba', password='masterkey',
+                                        min_size=2, max_size=10)
+   with pool.connection() as con:
+       cur = con.cursor()
+       cur.execute('select * from country')
+       print(cur.fetchall())
+   pool.close()
+"""
+
+import os
+import time
+import weakref
+import threading
+import contextlib
+from collections import deque
+
+import interbase
+import interbase.ibase as ibase
+
+__all__ = ['ConnectionPool']
+
+# All pools, reset in child process after fork()
+_pools = weakref.WeakSet()
+
+def _after_fork_in_child():
+    for pool in list(_pools):
+        pool._after_fork()
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_after_fork_in_child)
+
+
+class _PoolEntry(object):
+    "Pooled connection with its timestamps."
+    __slots__ = ('connection', 'created', 'released')
+    def __init__(self, connection, now):
+        self.connection = connection
+        self.created = now
+        self.released = now
+
+
+class ConnectionPool(object):
+    """Thread-safe pool of database connections.
+
+    Idle connections are kept in the pool and handed out again by
+    :meth:`acquire`, so the cost of database attachment is paid only once per
+    pooled connection. Connections returned by :meth:`release` are reset
+    (active transactions are rolled back, cursors and event conduits closed)
+    before they're handed out again.
+
+    Pool could be created (and filled) before the process forks, as in
+    pre-fork servers. Child process forgets all connections inherited from
+    the parent (without detaching them), and opens its own connections on
+    demand.
+
+    Supports context manager protocol, that closes the pool on exit.
+    """
+    def __init__(self, min_size=0, max_size=10, timeout=None, max_idle=None,
+                 max_lifetime=None, health_check=True, **kwargs):
+        """
+        :param integer min_size: Number of connections opened in advance and
+                                 kept open even when they are idle.
+        :param integer max_size: Maximum number of connections (idle and in
+                                 use) held by the pool.
+        :param timeout: Default number of seconds :meth:`acquire` waits for a
+                        free connection when pool is exhausted. `None` means
+                        wait forever.
+        :param max_idle: Number of seconds after which idle connection (above
+                         `min_size`) is closed. `None` means never.
+        :param max_lifetime: Number of seconds after which connection is closed
+                             and replaced by new one. `None` means never.
+        :param bool health_check: When True, each idle connection is checked by
+                                  `isc_database_info` call before it's handed
+                                  out, and dead connections are replaced.
+        :param kwargs: Parameters for :func:`interbase.connect`.
+
+        :raises ProgrammingError: For bad parameter values.
+        """
+        if max_size < 1:
+            raise interbase.ProgrammingError("'max_size' must be positive")
+        if min_size < 0 or min_size > max_size:
+            raise interbase.ProgrammingError("'min_size' must be between 0"
+                                             " and 'max_size'")
+        self.min_size = min_size
+        self.max_size = max_size
+        self.timeout = timeout
+        self.max_idle = max_idle
+        self.max_lifetime = max_lifetime
+        self.health_check = health_check
+        self.__connect_args = kwargs
+        self.__lock = threading.Condition()
+        self.__idle = deque()
+        self.__in_use = {}
+        self.__size = 0
+        self.__closed = False
+        self.__stats = {'created': 0, 'closed': 0, 'acquired': 0,
+                        'waits': 0, 'timeouts': 0, 'failed_checks': 0,
+                        'wait_time': 0.0}
+        _pools.add(self)
+        self.fill()
+    def __enter__(self):
+        return self
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+    def _after_fork(self):
+        # Called in child process. Inherited connections belong to the parent
+        # process, and the lock could be held by thread that doesn't exist here.
+        for entry in list(self.__idle) + list(self.__in_use.values()):
+            entry.connection._invalidate()
+        self.__lock = threading.Condition()
+        self.__idle.clear()
+        self.__in_use.clear()
+        self.__size = 0
+    def __check_open(self):
+        if self.__closed:
+            raise interbase.ProgrammingError("Connection pool is closed")
+    def __connect(self):
+        # Slot for new connection must be reserved before this call
+        try:
+            connection = interbase.connect(**self.__connect_args)
+        except:
+            with self.__lock:
+                self.__size -= 1
+                self.__lock.notify()
+            raise
+        with self.__lock:
+            self.__stats['created'] += 1
+        return _PoolEntry(connection, time.time())
+    def __discard(self, entry, free_slot=False):
+        with self.__lock:
+            self.__stats['closed'] += 1
+            if free_slot:
+                self.__size -= 1
+                self.__lock.notify()
+        try:
+            if not entry.connection.closed:
+                entry.connection.close()
+        except interbase.Error:
+            pass
+    def __expired(self, entry, now):
+        return (self.max_lifetime is not None
+                and now - entry.created > self.max_lifetime)
+    def __is_alive(self, connection):
+        try:
+            connection.database_info(ibase.isc_info_attachment_id, 'i')
+        except interbase.Error:
+            return False
+        return True
+    def fill(self):
+        """Opens new connections until the pool holds at least :attr:`min_size`
+        connections.
+        """
+        while True:
+            with self.__lock:
+                self.__check_open()
+                if self.__size >= self.min_size:
+                    return
+                self.__size += 1
+            entry = self.__connect()
+            with self.__lock:
+                self.__idle.append(entry)
+                self.__lock.notify()
+    def prune(self):
+        """Closes idle connections that exceeded :attr:`max_idle` or
+        :attr:`max_lifetime`, while keeping at least :attr:`min_size`
+        connections in the pool.
+
+        :returns: Number of closed connections.
+        """
+        now = time.time()
+        discarded = []
+        with self.__lock:
+            for entry in list(self.__idle):
+                if self.__expired(entry, now) or (
+                    self.max_idle is not None
+                    and now - entry.released > self.max_idle
+                    and self.__size - len(discarded) > self.min_size):
+                    self.__idle.remove(entry)
+                    discarded.append(entry)
+            self.__size -= len(discarded)
+            self.__lock.notify(len(discarded))
+        for entry in discarded:
+            self.__discard(entry)
+        return len(discarded)
+    def acquire(self, timeout=-1):
+        """Returns a connection from the pool. When there is no idle connection
+        and pool has reached :attr:`max_size`, waits until other thread
+        releases one.
+
+        Each acquired connection must be returned by :meth:`release`. Use
+        :meth:`connection` to do that automatically.
+
+        :param timeout: Number of seconds to wait. `None` means wait forever.
+                        When not specified, :attr:`timeout` is used.
+        :returns: :class:`~interbase.Connection` instance.
+
+        :raises OperationalError: When no connection was available before
+           timeout expired.
+        :raises ProgrammingError: When pool is closed.
+        """
+        if timeout == -1:
+            timeout = self.timeout
+        deadline = None if timeout is None else time.time() + timeout
+        self.prune()
+        while True:
+            entry = None
+            with self.__lock:
+                self.__check_open()
+                if not self.__idle and self.__size >= self.max_size:
+                    self.__stats['waits'] += 1
+                    started = time.time()
+                    while not self.__idle and self.__size >= self.max_size:
+                        remaining = None if deadline is None else deadline - time.time()
+                        if remaining is not None and remaining <= 0:
+                            self.__stats['timeouts'] += 1
+                            raise interbase.OperationalError("Timeout while"
+                                                             " waiting for"
+                                                             " pooled connection")
+                        self.__lock.wait(remaining)
+                        self.__check_open()
+                    self.__stats['wait_time'] += time.time() - started
+                if self.__idle:
+                    # Most recently used connections first, so surplus
+                    # connections stay idle and are evicted by prune()
+                    entry = self.__idle.pop()
+                else:
+                    self.__size += 1
+            if entry is None:
+                entry = self.__connect()
+            elif self.__expired(entry, time.time()):
+                self.__discard(entry, True)
+                continue
+            elif self.health_check and not self.__is_alive(entry.connection):
+                with self.__lock:
+                    self.__stats['failed_checks'] += 1
+                self.__discard(entry, True)
+                continue
+            with self.__lock:
+                self.__in_use[id(entry.connection)] = entry
+                self.__stats['acquired'] += 1
+            return entry.connection
+    def release(self, connection):
+        """Returns connection acquired by :meth:`acquire` to the pool.
+
+        Connection is reset (active transactions are rolled back, cursors and
+        event conduits closed). Connections that were closed, can't be reset
+        or exceeded :attr:`max_lifetime` are discarded.
+
+        :param connection: :class:`~interbase.Connection` instance.
+
+        :raises ProgrammingError: When connection wasn't acquired from this pool.
+        """
+        with self.__lock:
+            entry = self.__in_use.pop(id(connection), None)
+        if entry is None or entry.connection is not connection:
+            raise interbase.ProgrammingError("Connection was not acquired"
+                                             " from this pool")
+        keep = not connection.closed and not self.__expired(entry, time.time())
+        if keep:
+            try:
+                connection._reset()
+            except interbase.Error:
+                keep = False
+        with self.__lock:
+            if keep and not self.__closed:
+                entry.released = time.time()
+                self.__idle.append(entry)
+                self.__lock.notify()
+                return
+        self.__discard(entry, True)
+    @contextlib.contextmanager
+    def connection(self, timeout=-1):
+        """Context manager that acquires connection from the pool and releases
+        it on exit.
+
+        :param timeout: See :meth:`acquire`.
+        """
+        connection = self.acquire(timeout)
+        try:
+            yield connection
+        finally:
+            self.release(connection)
+    def close(self):
+        """Closes all idle connections. Connections that are in use are closed
+        when they're released. Pool can't be used anymore.
+        """
+        with self.__lock:
+            self.__closed = True
+            discarded = list(self.__idle)
+            self.__idle.clear()
+            self.__size -= len(discarded)
+            self.__lock.notify_all()
+        for entry in discarded:
+            self.__discard(entry)
+    def __get_closed(self):
+        return self.__closed
+    def __get_size(self):
+        return self.__size
+    def __get_idle(self):
+        return len(self.__idle)
+    def __get_stats(self):
+        with self.__lock:
+            result = self.__stats.copy()
+            result.update(size=self.__size, idle=len(self.__idle),
+                          in_use=len(self.__in_use))
+        return result
+
+    #: (Read Only) True if pool is closed.
+    closed = property(__get_closed)
+    #: (Read Only) Number of connections held by the pool (idle and in use).
+    size = property(__get_size)
+    #: (Read Only) Number of idle connections.
+    idle = property(__get_idle)
+    #: (Read Only) Dictionary with pool statistics: `size`, `idle`, `in_use`,
+    #: `created` and `closed` (number of opened and closed connections),
+    #: `acquired`, `waits` (number of :meth:`acquire` calls that had to wait),
+    #: `timeouts`, `failed_checks` (number of dead connections found by
+    #: health check) and `wait_time` (total number of seconds spent waiting).
+    stats = property(__get_stats)
@@ -0,0 +1,106 @@
+# coding:utf-8
+#
+#   PROGRAM/MODULE: interbase
+#   FILE:           test_aio.py
+#   DESCRIPTION:    Python driver for InterBase
+#   CREATED:        18.10.2026
+#
+#  Software distributed under the License is distributed AS IS,
+#  WITHOUT WARRANTY OF ANY KIND, either express or implied.
+#  See the License for the specific language governing rights
+#  and limitations under the License.
+#
+#  Portions created by Embarcadero Technologies to support
+#  InterBase are Copyright (c) 2023 by Embarcadero Technologies, Inc.
+#
+#  See LICENSE.TXT for details.
+
+import asyncio
+import interbase
+import interbase.aio
+
+from .core import InterBaseTestBase
+from .constants import IBTEST_HOST, IBTEST_USER, IBTEST_PASSWORD, IBTEST_DB_PATH, IBTEST_SQL_DIALECT,\
+    IBTEST_SERVER_PUBLIC_FILE
+
+
+class TestAsyncIO(InterBaseTestBase):
+    def connect(self):
+        return interbase.aio.connect(
+            host=IBTEST_HOST,
+            database=IBTEST_DB_PATH,
+            user=IBTEST_USER,
+            password=IBTEST_PASSWORD,
+            sql_dialect=IBTEST_SQL_DIALECT,
+            ssl=IBTEST_SERVER_PUBLIC_FILE is not None,
+            server_public_file=IBTEST_SERVER_PUBLIC_FILE
+        )
+
+    def test_fetch(self):
+        async def run():
+            async with await self.connect() as con:
+                cur = con.cursor()
+                await cur.execute('select * from country order by country')
+                self.assertEqual(cur.description[0][interbase.DESCRIPTION_NAME], 'COUNTRY')
+                first = await cur.fetchone()
+                rows = [row async for row in cur]
+                await con.commit()
+            self.assertTrue(con.closed)
+            return first, rows
+        first, rows = asyncio.run(run())
+        self.assertTupleEqual(first, ('Australia', 'ADollar'))
+        self.assertEqual(len(rows), 13)
+
+    def test_transaction(self):
+        async def run():
+            async with await self.connect() as con:
+                tr = con.trans()
+                await tr.begin()
+                self.assertTrue(tr.active)
+                cur = tr.cursor()
+                await cur.execute('insert into t (c1) values (?)', (1,))
+                await tr.rollback()
+                self.assertFalse(tr.active)
+                cur = con.cursor()
+                await cur.execute('select count(*) from t where c1 = 1')
+                return (await cur.fetchone())[0]
+        self.assertEqual(asyncio.run(run()), 0)
+
+    def test_savepoint(self):
+        async def run():
+            async with await self.connect() as con:
+                tr = con.trans()
+                await tr.begin()
+                cur = tr.cursor()
+                await cur.execute('insert into t (c1) values (?)', (1,))
+                self.assertEqual(await cur.get_rowcount(), 1)
+                await tr.create_savepoint('SP1')
+                await cur.execute('insert into t (c1) values (?)', (2,))
+                await tr.rollback(savepoint='SP1')
+                await cur.execute('select c1 from t where c1 in (1, 2)')
+                rows = await cur.fetchall()
+                await tr.rollback()
+                await con.begin()
+                await con.create_savepoint('SP2')
+                await con.rollback(savepoint='SP2')
+                await con.commit()
+            return rows
+        self.assertListEqual(asyncio.run(run()), [(1,)])
+
+    def test_close_closed(self):
+        async def run():
+            con = await self.connect()
+            await con.run(con.connection.close)
+            await con.close()
+            return con
+        con = asyncio.run(run())
+        self.assertTrue(con.closed)
+        self.assertTrue(con._executor._shutdown)
+
+    def test_events(self):
+        async def run():
+            async with await self.connect() as con:
+                async with await con.event_conduit(['new_order']) as events:
+                    # No order was inserted, so wait must time out
+                    return await events.wait(0.5)
+        self.assertIsNone(asyncio.run(run()))
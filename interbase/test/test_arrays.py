@@ -27,8 +27,13 @@
 import interbase
 import datetime
 import decimal
+import unittest
 
 from .core import InterBaseTestBase
+try:
+    import numpy
+except ImportError:
+    numpy = None
 from .constants import IBTEST_HOST, IBTEST_USER, IBTEST_PASSWORD, IBTEST_DB_PATH, IBTEST_SQL_DIALECT,\
     IBTEST_SERVER_PUBLIC_FILE
 
@@ -400,3 +405,68 @@ class TestArrays(InterBaseTestBase):
         with self.assertRaises(ValueError) as cm:
             cur.execute("insert into ar (c1,c2) values (102,?)", [self.c2[:-1]])
         self.assertTupleEqual(cm.exception.args, ('Incorrect ARRAY field value.',))
+
+    def test_descriptor_cache(self):
+        cur = self.con.cursor()
+        cur.execute("insert into ar (c1,c2) values (102,?)", [self.c2])
+        cur.execute("insert into ar (c1,c2) values (103,?)", [self.c2])
+        tr_handle = self.con.main_transaction._tr_handle
+        desc = self.con._get_array_descriptor(b'AR', b'C2', tr_handle)
+        self.assertListEqual(desc.dimensions, [4, 4, 2])
+        cur.execute("select c2 from ar where c1 in (102,103)")
+        self.assertListEqual(cur.fetchall(), [(self.c2,), (self.c2,)])
+        # Descriptor is looked up only once per column
+        self.assertIs(self.con._get_array_descriptor(b'AR', b'C2', tr_handle), desc)
+        # and dropped when metadata change
+        self.con._metadata_changed()
+        self.assertIsNot(self.con._get_array_descriptor(b'AR', b'C2', tr_handle), desc)
+
+    @unittest.skipIf(numpy is None, "NumPy is not installed")
+    def test_ndarray(self):
+        cur = self.con.cursor()
+        cur.execute("insert into ar (c1,c2) values (102,?)",
+                    [numpy.array(self.c2, dtype=numpy.int64)])
+        cur.execute("insert into ar (c1,c2) values (103,?)", [self.c2])
+        cur.arrays_as_ndarray = True
+        cur.execute("select c2 from ar where c1 in (102,103) order by c1")
+        rows = cur.fetchall()
+        for row in rows:
+            self.assertIsInstance(row[0], numpy.ndarray)
+            self.assertEqual(row[0].shape, (4, 4, 2))
+            self.assertListEqual(row[0].tolist(), self.c2)
+        with self.assertRaises(ValueError):
+            cur.execute("insert into ar (c1,c2) values (104,?)",
+                        [numpy.zeros((2, 2), dtype=numpy.int32)])
+        cur.arrays_as_ndarray = False
+        cur.execute("select c2 from ar where c1 = 102")
+        self.assertListEqual(cur.fetchone()[0], self.c2)
+
+    def test_slice(self):
+        cur = self.con.cursor()
+        cur.execute("insert into ar (c1,c2) values (102,?)", [self.c2])
+        # C2 INTEGER[1:4, 0:3, 1:2]
+        bounds = [(2, 3), (1, 2), (1, 2)]
+        expected = [[row[1:3] for row in plane] for plane in self.c2[1:3]]
+        self.assertListEqual(cur.read_array_slice('AR', 'C2', bounds, 'c1 = ?', [102]),
+                             [expected])
+        p = cur.prep("select c2 from ar where c1 = 102")
+        p.set_array_slice('C2', [(4, 4), (3, 3), (1, 2)])
+        cur.execute(p)
+        self.assertListEqual(cur.fetchone()[0], [[[16, 16]]])
+        self.assertEqual(cur.write_array_slice('AR', 'C2', [(1, 1), (0, 0), (1, 2)],
+                                               [[[100, 200]]], 'c1 = 102'), 1)
+        cur.execute("select c2 from ar where c1 = 102")
+        value = cur.fetchone()[0]
+        self.assertListEqual(value[0][0], [100, 200])
+        self.assertListEqual(value[1:], self.c2[1:])
+        with self.assertRaises(ValueError):
+            cur.read_array_slice('AR', 'C2', [(0, 1), (0, 0), (1, 2)], 'c1 = 102')
+        # Slice set on cached statement does not apply to other cursors
+        cmd = "select c2 from ar where c1 = 102"
+        cur.execute(cmd)
+        cur.set_array_slice('C2', [(4, 4), (3, 3), (1, 2)])
+        self.assertListEqual(cur.fetchone()[0], [[[16, 16]]])
+        cur.close()
+        cur2 = self.con.cursor()
+        cur2.execute(cmd)
+        self.assertListEqual(cur2.fetchone()[0][1:], self.c2[1:])
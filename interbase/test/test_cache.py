@@ -0,0 +1,96 @@
+# coding:utf-8
+#
+#   PROGRAM/MODULE: interbase
+#   FILE:           test_cache.py
+#   DESCRIPTION:    Python driver for InterBase
+#   CREATED:        18.10.2026
+#
+#  Software distributed under the License is distributed AS IS,
+#  WITHOUT WARRANTY OF ANY KIND, either express or implied.
+#  See the License for the specific language governing rights
+#  and limitations under the License.
+#
+#  Portions created by Embarcadero Technologies to support
+#  InterBase are Copyright (c) 2023 by Embarcadero Technologies, Inc.
+#
+#  See LICENSE.TXT for details.
+
+import os
+import time
+import interbase
+import interbase.cache
+
+from .core import InterBaseTestBase
+from .constants import IBTEST_DB_DIR_PATH, IBTEST_HOST, IBTEST_USER, IBTEST_PASSWORD, IBTEST_SQL_DIALECT,\
+    IBTEST_SERVER_PUBLIC_FILE
+
+
+class TestResultCache(InterBaseTestBase):
+    def setUp(self):
+        self.dbfile = os.path.join(IBTEST_DB_DIR_PATH, 'ibcache.ib')
+        if os.path.exists(self.dbfile):
+            os.remove(self.dbfile)
+        self.con = interbase.create_database(
+            host=IBTEST_HOST,
+            database=self.dbfile,
+            user=IBTEST_USER,
+            password=IBTEST_PASSWORD,
+            sql_dialect=IBTEST_SQL_DIALECT,
+            ssl=IBTEST_SERVER_PUBLIC_FILE is not None,
+            server_public_file=IBTEST_SERVER_PUBLIC_FILE
+        )
+        c = self.con.cursor()
+        c.execute("CREATE TABLE T (PK Integer, C1 Integer)")
+        c.execute("""CREATE TRIGGER T_AI FOR T ACTIVE
+AFTER INSERT POSITION 0
+AS
+BEGIN
+    post_event 't_changed' ;
+END""")
+        self.con.commit()
+        self.event_con = interbase.connect(
+            host=IBTEST_HOST,
+            database=self.dbfile,
+            user=IBTEST_USER,
+            password=IBTEST_PASSWORD,
+            sql_dialect=IBTEST_SQL_DIALECT,
+            ssl=IBTEST_SERVER_PUBLIC_FILE is not None,
+            server_public_file=IBTEST_SERVER_PUBLIC_FILE
+        )
+        self.cache = interbase.cache.ResultCache(maxsize=2)
+
+    def tearDown(self):
+        self.cache.close()
+        self.event_con.close()
+        self.con.drop_database()
+        self.con.close()
+
+    def test_lru(self):
+        cur = self.con.cursor()
+        self.assertListEqual(self.cache.fetchall(cur, 'select count(*) from t'), [(0,)])
+        self.con.execute_immediate('insert into t (pk, c1) values (1, 1)')
+        # Served from cache
+        self.assertListEqual(self.cache.fetchall(cur, 'select count(*) from t'), [(0,)])
+        self.cache.fetchall(cur, 'select pk from t where c1 = ?', [1])
+        self.cache.fetchall(cur, 'select pk from t where c1 = ?', [2])
+        self.assertEqual(len(self.cache), 2)
+        self.assertListEqual(self.cache.fetchall(cur, 'select count(*) from t'), [(1,)])
+        stats = self.cache.stats
+        self.assertEqual(stats['hits'], 1)
+        self.assertEqual(stats['misses'], 4)
+        self.assertEqual(stats['evictions'], 2)
+
+    def test_event_invalidation(self):
+        self.cache.subscribe(self.event_con, ['t_changed'])
+        cur = self.con.cursor()
+        sql = 'select count(*) from t'
+        self.assertListEqual(self.cache.fetchall(cur, sql, depends_on=['t_changed']), [(0,)])
+        self.con.commit()
+        self.con.execute_immediate('insert into t (pk, c1) values (1, 1)')
+        self.con.commit()
+        deadline = time.time() + 5
+        while len(self.cache) and time.time() < deadline:
+            time.sleep(0.1)
+        self.assertEqual(len(self.cache), 0)
+        self.assertListEqual(self.cache.fetchall(cur, sql, depends_on=['t_changed']), [(1,)])
+        self.assertEqual(self.cache.invalidate(['t_changed']), 1)
@@ -26,6 +26,7 @@
 
 import os
 import interbase
+import interbase.changes
 import time
 
 from .core import InterBaseTestBase
@@ -114,6 +115,56 @@ class TestChangeView(InterBaseTestBase):
         assert deleted_record[1][1] & interbase.SQLIND_DELETE
         assert len(changed_records) == 3
 
+    def test_change_reader(self):
+        cur = self.con.cursor()
+        cur.execute(
+            "CREATE TABLE CUSTOMER2 ("
+            "CUST_NO INTEGER NOT NULL,"
+            "CUSTOMER VARCHAR(25),"
+            "CONSTRAINT RDB$PRIMARY2503 PRIMARY KEY(CUST_NO))"
+        )
+        self.con.commit()
+        cur.execute("INSERT INTO CUSTOMER2 (CUST_NO, CUSTOMER) VALUES (1, 'first')")
+        cur.execute("INSERT INTO CUSTOMER2 (CUST_NO, CUSTOMER) VALUES (2, 'second')")
+        self.con.commit()
+        cur.execute(
+            "CREATE SUBSCRIPTION SUB_CUSTOMER2_CHANGE ON CUSTOMER2 (CUST_NO, CUSTOMER)"
+            "FOR ROW (INSERT, UPDATE, DELETE)"
+        )
+        cur.execute(
+            f"GRANT SUBSCRIBE ON SUBSCRIPTION SUB_CUSTOMER2_CHANGE to {IBTEST_USER}"
+        )
+        self.con.commit()
+
+        reader = interbase.changes.ChangeReader(self.con, 'SUB_CUSTOMER2_CHANGE',
+                                                'CUSTOMER2', 'CUST_NO',
+                                                batch_size=2)
+        reader.poll_interval = 0.1
+        # First poll establishes the subscription checkpoint
+        self.assertEqual(list(reader.batches(timeout=0)), [])
+
+        self.con.execute_immediate("INSERT INTO CUSTOMER2 (CUST_NO, CUSTOMER) VALUES (3, 'third')")
+        self.con.execute_immediate("UPDATE CUSTOMER2 SET CUSTOMER='new' WHERE CUST_NO=2")
+        self.con.execute_immediate("DELETE FROM CUSTOMER2 WHERE CUST_NO=1")
+        self.con.commit()
+        time.sleep(1)
+
+        batches = list(reader.batches(timeout=0.5))
+        self.assertEqual([len(batch) for batch in batches], [2, 1])
+        changes = dict((c.key, c) for batch in batches for c in batch)
+        self.assertEqual(changes[1].operation, 'DELETE')
+        self.assertEqual(changes[2].operation, 'UPDATE')
+        self.assertEqual(changes[2].changed, ('CUSTOMER',))
+        self.assertEqual(changes[2].values['CUSTOMER'], 'new')
+        self.assertEqual(changes[3].operation, 'INSERT')
+        self.assertEqual(changes[3].values, {'CUST_NO': 3, 'CUSTOMER': 'third'})
+        # Changes were consumed
+        self.assertEqual(list(reader.batches(timeout=0)), [])
+        self.assertEqual(reader.stats['changes'], 3)
+        reader.close()
+        self.assertTrue(reader.closed)
+        self.con.close()
+
     def tearDown(self):
         self.con = interbase.connect(
             host=IBTEST_HOST,
@@ -171,6 +171,42 @@ class TestConnection(InterBaseTestBase):
             con.execute_immediate("drop table tmp")
             con.commit()
 
+    @skipUnless(hasattr(os, 'fork'), "requires os.fork()")
+    def test_fork(self):
+        with closing(
+                interbase.connect(host=IBTEST_HOST,
+                                  database=IBTEST_DB_PATH,
+                                  user=IBTEST_USER,
+                                  password=IBTEST_PASSWORD,
+                                  sql_dialect=IBTEST_SQL_DIALECT,
+                                  ssl=IBTEST_SERVER_PUBLIC_FILE is not None,
+                                  server_public_file=IBTEST_SERVER_PUBLIC_FILE)
+        ) as con:
+            cur = con.cursor()
+            cur.execute('select count(*) from country')
+            self.assertEqual(cur.fetchone()[0], 14)
+            pid = os.fork()
+            if pid == 0:
+                status = 1
+                try:
+                    # Inherited connection is attached again on first use
+                    if con.closed:
+                        counts = []
+                        # Inherited cursor must not reuse parent's statement
+                        for c in (cur, cur, con.cursor()):
+                            c.execute('select count(*) from country')
+                            counts.append(c.fetchone()[0])
+                        if counts == [14, 14, 14] and not con.closed:
+                            status = 0
+                        con.close()
+                finally:
+                    os._exit(status)
+            _, status = os.waitpid(pid, 0)
+            self.assertEqual(status, 0)
+            # Parent's attachment is still usable
+            cur.execute('select count(*) from country')
+            self.assertEqual(cur.fetchone()[0], 14)
+
     def test_database_info(self):
         with closing(
                 interbase.connect(#dsn=IBTEST_HOST + ":" + IBTEST_DB_PATH if IBTEST_HOST else IBTEST_DB_PATH,
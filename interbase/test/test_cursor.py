@@ -224,6 +224,10 @@ class TestCursor(InterBaseTestBase):
         cur.execute('select * from country')
         row = cur.fetchonemap()
         self.assertListEqual(row.items(), [('COUNTRY', 'USA'), ('CURRENCY', 'Dollar')])
+        self.assertEqual(row['country'], 'USA')
+        self.assertEqual(len(row), 2)
+        # Field index is shared by all rows of the statement
+        self.assertIs(cur.fetchonemap()._index, row._index)
 
     def test_fetchallmap(self):
         cur = self.con.cursor()
@@ -310,3 +314,179 @@ class TestCursor(InterBaseTestBase):
         cur.execute(cmd)
         row = cur.fetchone()
         self.assertTupleEqual(row, ('USA', 'Dollar'))
+
+    def test_statement_cache(self):
+        cache = self.con.statement_cache
+        cache.clear()
+        cmd = 'select * from country'
+        cur = self.con.cursor()
+        cur.execute(cmd)
+        ps = cur._ps
+        cur.execute('select * from project')
+        self.assertIn(cmd, cache)
+        cur2 = self.con.cursor()
+        cur2.execute(cmd)
+        self.assertIs(cur2._ps, ps)
+        self.assertNotIn(cmd, cache)
+        self.assertTupleEqual(cur2.fetchone(), ('USA', 'Dollar'))
+        misses = cache.misses
+        cur2.execute(cmd)
+        self.assertIs(cur2._ps, ps)
+        self.assertEqual(cache.misses, misses)
+        # Cache is dropped by DDL
+        cur2.close()
+        self.assertIn(cmd, cache)
+        self.con.execute_immediate('create table cache_test (c integer)')
+        self.assertEqual(len(cache), 0)
+        self.con.commit()
+        self.con.execute_immediate('drop table cache_test')
+        self.con.commit()
+        # LRU eviction
+        cache.maxsize = 1
+        cur.execute(cmd)
+        cur.execute('select * from project')
+        cur.execute('select * from t')
+        self.assertEqual(len(cache), 1)
+        self.assertNotIn(cmd, cache)
+        self.assertGreater(cache.evictions, 0)
+
+    def test_statement_cache_metadata_change(self):
+        self.con.execute_immediate('create table cache_test (c1 integer)')
+        self.con.commit()
+        try:
+            cmd = 'select * from cache_test'
+            cur = self.con.cursor()
+            cur.execute(cmd)
+            self.assertEqual(len(cur.description), 1)
+            ps = cur._ps
+            # Statement is in use by cursor while metadata change is committed
+            self.con.execute_immediate('alter table cache_test add c2 integer')
+            self.con.commit(retaining=True)
+            cur.execute('select * from country')
+            self.assertNotIn(cmd, self.con.statement_cache)
+            cur.execute(cmd)
+            self.assertIsNot(cur._ps, ps)
+            self.assertEqual(len(cur.description), 2)
+            cur.close()
+        finally:
+            self.con.commit()
+            self.con.execute_immediate('drop table cache_test')
+            self.con.commit()
+
+    def test_statement_cache_close(self):
+        con = interbase.connect(
+            host=IBTEST_HOST,
+            database=IBTEST_DB_PATH,
+            user=IBTEST_USER,
+            password=IBTEST_PASSWORD,
+            sql_dialect=IBTEST_SQL_DIALECT,
+            ssl=IBTEST_SERVER_PUBLIC_FILE is not None,
+            server_public_file=IBTEST_SERVER_PUBLIC_FILE
+        )
+        cur = con.cursor()
+        cur.execute('select * from country')
+        con.close()
+        # Statement of cursor closed with its transaction is not cached
+        self.assertEqual(len(con.statement_cache), 0)
+        self.assertIsNone(cur._ps)
+
+    def test_executemany(self):
+        cur = self.con.cursor()
+        misses = self.con.statement_cache.misses
+        cur.executemany('insert into t (c1) values (?)',
+                        ((i,) for i in range(25)), batch_size=10, count_rows=True)
+        self.assertEqual(self.con.statement_cache.misses, misses + 1)
+        stats = cur.executemany_stats
+        self.assertEqual(stats['executions'], 25)
+        self.assertEqual(stats['rowcount'], 25)
+        self.assertListEqual([b[:2] for b in stats['batches']],
+                             [(10, 10), (10, 10), (5, 5)])
+        self.assertGreaterEqual(stats['elapsed'], 0.0)
+        cur.execute('select count(*), sum(c1) from t')
+        self.assertTupleEqual(cur.fetchone(), (25, 300))
+        # Rows are not counted by default
+        cur.executemany('insert into t (c1) values (?)', [(1,), (2,)])
+        stats = cur.executemany_stats
+        self.assertEqual(stats['rowcount'], -1)
+        self.assertListEqual([b[:2] for b in stats['batches']], [(2, -1)])
+
+    def test_fetch_columns(self):
+        cur = self.con.cursor()
+        cur.executemany('insert into t (c1) values (?)', [(1,), (None,), (3,)])
+        cur.execute('select c1, cast(c1 as varchar(5)) from t')
+        columns, nulls = cur.fetch_columns(2)
+        self.assertEqual(columns[0].typecode, 'i')
+        self.assertEqual(len(columns[0]), 2)
+        columns2, nulls2 = cur.fetch_columns()
+        self.assertEqual(len(columns2[0]), 1)
+        values = list(columns[0]) + list(columns2[0])
+        masks = list(nulls[0]) + list(nulls2[0])
+        texts = columns[1] + columns2[1]
+        self.assertListEqual(sorted(zip(masks, values, texts),
+                                    key=lambda x: (x[0], x[1])),
+                             [(0, 1, '1'), (0, 3, '3'), (1, 0, None)])
+
+    def test_contiguous_row_buffer(self):
+        cmd = 'select * from sales'
+        cur = self.con.cursor()
+        self.assertFalse(self.con.contiguous_row_buffer)
+        rows = cur.execute(cmd).fetchall()
+        cur.close()
+        self.con.statement_cache.clear()
+        self.con.contiguous_row_buffer = True
+        self.assertListEqual(cur.execute(cmd).fetchall(), rows)
+
+    def test_resolve_precision(self):
+        cmd = 'select MIN_SALARY, MAX_SALARY from job'
+        cur = self.con.cursor()
+        cur.execute(cmd)
+        precision = 10 if IBTEST_SQL_DIALECT == 3 else None
+        self.assertListEqual([d[interbase.DESCRIPTION_PRECISION] for d in cur.description],
+                             [precision, precision])
+        cur.close()
+        self.con.statement_cache.clear()
+        self.con.resolve_precision = False
+        cur.execute(cmd)
+        self.assertListEqual([d[interbase.DESCRIPTION_PRECISION] for d in cur.description],
+                             [0, 0])
+
+    def test_resolve_precision_statement_cache(self):
+        # Catalog lookups for different number of columns share one statement
+        self.con.statement_cache.clear()
+        cur = self.con.cursor()
+        cur.execute('select MIN_SALARY from job')
+        cur.description
+        cur.execute('select j.MAX_SALARY, e.SALARY from job j, employee e where 1 = 0')
+        cur.description
+        cur.close()
+        self.assertEqual(len(self.con.statement_cache), 3)
+
+    def test_fetchonelazy(self):
+        cmd = 'select * from sales order by PO_NUMBER'
+        cur = self.con.cursor()
+        rows = cur.execute(cmd).fetchall()
+        cur.execute(cmd)
+        row = cur.fetchonelazy()
+        self.assertEqual(len(row), len(rows[0]))
+        self.assertEqual(row['PO_NUMBER'], rows[0][0])
+        self.assertEqual(row['po_number'], rows[0][0])
+        self.assertEqual(row[-1], rows[0][-1])
+        self.assertTupleEqual(row[1:3], rows[0][1:3])
+        self.assertEqual(row, rows[0])
+        with self.assertRaises(KeyError):
+            row['NO_SUCH_FIELD']
+        self.assertListEqual([tuple(r) for r in cur.iterlazy()], rows[1:])
+        self.assertIsNone(cur.fetchonelazy())
+
+    def test_iter_prefetch(self):
+        cmd = 'select * from sales order by PO_NUMBER'
+        cur = self.con.cursor()
+        rows = cur.execute(cmd).fetchall()
+        cur.execute(cmd)
+        self.assertListEqual(list(cur.iter_prefetch(2)), rows)
+        cur.execute(cmd)
+        it = cur.iter_prefetch(1)
+        self.assertTupleEqual(next(it), rows[0])
+        it.close()
+        with self.assertRaises(interbase.ProgrammingError):
+            cur.iter_prefetch(0)
@@ -244,6 +244,68 @@ class TestDistributedTransaction(InterBaseTestBase):
         self.assertIsNone(self.con1.group)
         self.assertIsNone(self.con2.group)
 
+    def test_parallel_commit(self):
+        cg = interbase.ConnectionGroup()
+        cg.parallel_commit = True
+        cg.add(self.con1)
+        cg.add(self.con2)
+        self.assertListEqual(cg.timings, [])
+
+        c1 = cg.cursor(self.con1)
+        c2 = cg.cursor(self.con2)
+        c1.execute('insert into t (pk) values (1)')
+        c2.execute('insert into t (pk) values (1)')
+        cg.commit()
+        # Both databases are served by the same server
+        timings = cg.timings
+        self.assertEqual(len(timings), 1)
+        self.assertIn('commit', timings[0])
+
+        c1.execute('insert into t (pk) values (2)')
+        c2.execute('insert into t (pk) values (2)')
+        cg.rollback()
+        self.assertIn('rollback', cg.timings[0])
+
+        for con in (self.con1, self.con2):
+            cur = con.cursor()
+            cur.execute('select pk from t order by pk')
+            self.assertListEqual(cur.fetchall(), [(1,)])
+            con.commit()
+        cg.disband()
+
+    def test_parallel_commit_sites(self):
+        # Pretend that databases are served by different servers, so each
+        # has its own transaction and both phases run in separate threads
+        self.con2._get_db_identity = lambda: (self.db2, 'other-site')
+        cg = interbase.ConnectionGroup()
+        cg.parallel_commit = True
+        cg.add(self.con1)
+        cg.add(self.con2)
+
+        c1 = cg.cursor(self.con1)
+        c2 = cg.cursor(self.con2)
+        c1.execute('insert into t (pk) values (1)')
+        c2.execute('insert into t (pk) values (1)')
+        cg.commit()
+        timings = cg.timings
+        self.assertEqual(len(timings), 2)
+        for timing in timings:
+            self.assertIn('prepare', timing)
+            self.assertIn('commit', timing)
+
+        c1.execute('insert into t (pk) values (2)')
+        c2.execute('insert into t (pk) values (2)')
+        cg.rollback()
+        self.assertEqual(len(cg.timings), 2)
+        self.assertIn('rollback', cg.timings[1])
+
+        for con in (self.con1, self.con2):
+            cur = con.cursor()
+            cur.execute('select pk from t order by pk')
+            self.assertListEqual(cur.fetchall(), [(1,)])
+            con.commit()
+        cg.disband()
+
     @skip("issue #44: test_limbo_transactions fails with exception: access violation on win x32")
     def test_limbo_transactions(self):
         cg = interbase.ConnectionGroup((self.con1, self.con2))
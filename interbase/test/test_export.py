@@ -0,0 +1,93 @@
+# coding:utf-8
+#
+#   PROGRAM/MODULE: interbase
+#   FILE:           test_export.py
+#   DESCRIPTION:    Python driver for InterBase
+#   CREATED:        18.10.2026
+#
+#  Software distributed under the License is distributed AS IS,
+#  WITHOUT WARRANTY OF ANY KIND, either express or implied.
+#  See the License for the specific language governing rights
+#  and limitations under the License.
+#
+#  Portions created by Embarcadero Technologies to support
+#  InterBase are Copyright (c) 2023 by Embarcadero Technologies, Inc.
+#
+#  See LICENSE.TXT for details.
+
+import io
+import csv
+import json
+import decimal
+import interbase
+import interbase.export
+
+from .core import InterBaseTestBase
+from .constants import IBTEST_HOST, IBTEST_USER, IBTEST_PASSWORD, IBTEST_DB_PATH, IBTEST_SQL_DIALECT,\
+    IBTEST_SERVER_PUBLIC_FILE
+
+
+class TestExport(InterBaseTestBase):
+    def setUp(self):
+        self.con = interbase.connect(
+            host=IBTEST_HOST,
+            database=IBTEST_DB_PATH,
+            user=IBTEST_USER,
+            password=IBTEST_PASSWORD,
+            sql_dialect=IBTEST_SQL_DIALECT,
+            ssl=IBTEST_SERVER_PUBLIC_FILE is not None,
+            server_public_file=IBTEST_SERVER_PUBLIC_FILE
+        )
+
+    def tearDown(self):
+        self.con.close()
+
+    def test_export_csv(self):
+        sql = 'select country, currency from country order by country'
+        cur = self.con.cursor()
+        cur.execute(sql)
+        expected = io.StringIO()
+        writer = csv.writer(expected)
+        writer.writerow(['COUNTRY', 'CURRENCY'])
+        writer.writerows(cur.fetchall())
+        progress = []
+        f = io.StringIO()
+        stats = interbase.export.export_csv(cur, sql, f, batch_size=5, chunk_size=100,
+                                            callback=lambda rows, size: progress.append(rows))
+        self.assertEqual(f.getvalue(), expected.getvalue())
+        self.assertEqual(stats, {'rows': 14, 'bytes': len(expected.getvalue())})
+        self.assertGreater(len(progress), 1)
+        self.assertEqual(progress[-1], 14)
+
+    def test_export_jsonl(self):
+        sql = ('select emp_no, first_name, hire_date, salary from employee'
+               ' order by emp_no')
+        cur = self.con.cursor()
+        cur.execute(sql)
+        expected = cur.fetchall()
+        f = io.BytesIO()
+        stats = interbase.export.export_jsonl(cur, sql, f)
+        data = f.getvalue()
+        lines = data.decode('utf-8').splitlines()
+        self.assertEqual(stats, {'rows': len(expected), 'bytes': len(data)})
+        self.assertEqual(len(lines), len(expected))
+        for line, row in zip(lines, expected):
+            value = json.loads(line, parse_float=decimal.Decimal)
+            self.assertEqual(value, {'EMP_NO': row[0], 'FIRST_NAME': row[1],
+                                     'HIRE_DATE': str(row[2]), 'SALARY': row[3]})
+        # Statement without result set is rejected before execution
+        with self.assertRaises(interbase.ProgrammingError):
+            interbase.export.export_jsonl(cur, "insert into t (c1) values (1)", f)
+        cur.execute('select count(*) from t')
+        self.assertEqual(cur.fetchone()[0], 0)
+        self.con.rollback()
+
+    def test_export_jsonl_float(self):
+        f = io.StringIO()
+        cur = self.con.cursor()
+        interbase.export.export_jsonl(cur, "select cast(1.5 as double precision) as f"
+                                      " from rdb$database", f)
+        self.assertEqual(json.loads(f.getvalue()), {'F': 1.5})
+        # Non-finite values have no JSON representation
+        for value in (float('nan'), float('inf'), float('-inf')):
+            self.assertEqual(interbase.export._float_json(repr(value)), 'null')
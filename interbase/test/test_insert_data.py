@@ -27,6 +27,7 @@
 import interbase
 import decimal
 import datetime
+from unittest import skipUnless
 
 from .core import InterBaseTestBase
 from .constants import IBTEST_USER, IBTEST_HOST, IBTEST_PASSWORD, IBTEST_DB_PATH, IBTEST_SQL_DIALECT,\
@@ -240,3 +241,117 @@ class TestInsertData(InterBaseTestBase):
         cur.execute('select C1, C17 from T2 where C17 = ?', (True,))
         rows = cur.fetchall()
         self.assertListEqual(rows, [(1, True)])
+
+
+@skipUnless(IBTEST_SQL_DIALECT == 3, "requires SQL dialect 3")
+class TestConversionRoundTrip(InterBaseTestBase):
+    def setUp(self):
+        self.con = interbase.connect(
+            host=IBTEST_HOST,
+            database=IBTEST_DB_PATH,
+            user=IBTEST_USER,
+            password=IBTEST_PASSWORD,
+            charset='UTF8',
+            sql_dialect=IBTEST_SQL_DIALECT,
+            ssl=IBTEST_SERVER_PUBLIC_FILE is not None,
+            server_public_file=IBTEST_SERVER_PUBLIC_FILE
+        )
+
+    def tearDown(self):
+        self.con.execute_immediate("delete from t2")
+        self.con.execute_immediate("delete from t3")
+        self.con.commit()
+        self.con.close()
+
+    def fetch_both_layouts(self, cmd):
+        # Rows must be the same with per-column and contiguous row buffers
+        result = []
+        for contiguous in (False, True):
+            self.con.statement_cache.clear()
+            self.con.contiguous_row_buffer = contiguous
+            cur = self.con.cursor()
+            result.append(cur.execute(cmd).fetchall())
+            cur.close()
+        self.assertListEqual(result[0], result[1])
+        return result[0]
+
+    def test_roundtrip_all_types(self):
+        rows = [
+            (-32768, 2147483647, -2147483648, 'AB', 'ABCDEFGHIJ',
+             datetime.date(2011, 11, 13), datetime.time(15, 0, 1, 123400),
+             datetime.datetime(2011, 11, 13, 23, 59, 59, 999900), 'BLOB',
+             decimal.Decimal('-1234567890123456.78'), decimal.Decimal('0.05'),
+             1.5, 1234.5678, decimal.Decimal('-0.0001'),
+             decimal.Decimal('1234.5678'), interbase.bs([0, 1, 255]), True),
+            (0, 0, 0, '', '',
+             datetime.date(1858, 11, 17), datetime.time(0, 0),
+             datetime.datetime(1858, 11, 17), 'x',
+             decimal.Decimal('0.00'), decimal.Decimal('-0.01'),
+             -0.0, -1e300, decimal.Decimal('0.0000'),
+             decimal.Decimal('-9999.9999'), interbase.bs([7]), False),
+            (32767,) + (None,) * 16,
+        ]
+        cur = self.con.cursor()
+        cur.executemany('insert into T2 (C1,C2,C3,C4,C5,C6,C7,C8,C9,C10,C11,'
+                        'C12,C13,C14,C15,C16,C17) values '
+                        '(?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?)', rows)
+        self.con.commit()
+        fetched = self.fetch_both_layouts('select C1,C2,C3,C4,C5,C6,C7,C8,C9,'
+                                          'C10,C11,C12,C13,C14,C15,C16,C17 '
+                                          'from T2 order by C1')
+        # CHAR values are padded to declared length
+        expected = [row[:3] + ((row[3].ljust(5),) if row[3] is not None
+                               else (None,)) + row[4:] for row in rows]
+        self.assertListEqual(fetched, expected)
+        self.assertIsInstance(fetched[0][9], decimal.Decimal)
+        self.assertEqual(fetched[0][9].as_tuple().exponent, -2)
+        self.assertEqual(fetched[0][13].as_tuple().exponent, -4)
+
+    def test_roundtrip_multibyte_char(self):
+        rows = [(1, 'Žluťoučký', '🐍 kůň', 'Příliš žluťoučký kůň 🐍'),
+                (2, 'ab', 'ab', 'ab'),
+                (3, '🐍🐍🐍🐍🐍🐍🐍🐍🐍🐍', '🐍🐍🐍🐍🐍🐍🐍🐍🐍🐍', '🐍'),
+                (4, None, None, None)]
+        cur = self.con.cursor()
+        cur.executemany('insert into T3 (C1,C2,C3,C4) values (?,?,?,?)', rows)
+        self.con.commit()
+        fetched = self.fetch_both_layouts('select C1,C2,C3,C4 from T3 '
+                                          'order by C1')
+        # CHAR(10) is padded to 10 characters, not to 40 bytes
+        expected = [(c1, None if c2 is None else c2.ljust(10), c3, c4)
+                    for c1, c2, c3, c4 in rows]
+        self.assertListEqual(fetched, expected)
+
+    def test_parameter_text_native_switch(self):
+        cur = self.con.cursor()
+        ps = cur.prep('insert into T2 (C1,C2,C8,C10,C17) values (?,?,?,?,?)')
+        # Each parameter switches between native value, text of growing
+        # length and NULL on re-execution of the same statement
+        params = [
+            (1, 1, datetime.datetime(2011, 11, 13, 15, 0, 1, 1200),
+             decimal.Decimal('1.5'), True),
+            (2, '7', '2011-11-13', '1.5', None),
+            (3, '-2147483648', '2011-11-13 15:00:01', '-1234567890123.25', False),
+            (4, None, None, None, True),
+            (5, 2147483647, datetime.date(2011, 11, 13), -0.25, False),
+            (6, '42', '2011-1-2', '0.01', None),
+        ]
+        for row in params:
+            cur.execute(ps, row)
+        self.con.commit()
+        ps.close()
+        rows = self.fetch_both_layouts('select C1,C2,C8,C10,C17 from T2 '
+                                       'order by C1')
+        self.assertListEqual(rows, [
+            (1, 1, datetime.datetime(2011, 11, 13, 15, 0, 1, 1200),
+             decimal.Decimal('1.50'), True),
+            (2, 7, datetime.datetime(2011, 11, 13), decimal.Decimal('1.50'),
+             None),
+            (3, -2147483648, datetime.datetime(2011, 11, 13, 15, 0, 1),
+             decimal.Decimal('-1234567890123.25'), False),
+            (4, None, None, None, True),
+            (5, 2147483647, datetime.datetime(2011, 11, 13),
+             decimal.Decimal('-0.25'), False),
+            (6, 42, datetime.datetime(2011, 1, 2), decimal.Decimal('0.01'),
+             None),
+        ])
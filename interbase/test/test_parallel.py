@@ -0,0 +1,136 @@
+# coding:utf-8
+#
+#   PROGRAM/MODULE: interbase
+#   FILE:           test_parallel.py
+#   DESCRIPTION:    Python driver for InterBase
+#   CREATED:        18.10.2026
+#
+#  Software distributed under the License is distributed AS IS,
+#  WITHOUT WARRANTY OF ANY KIND, either express or implied.
+#  See the License for the specific language governing rights
+#  and limitations under the License.
+#
+#  Portions created by Embarcadero Technologies to support
+#  InterBase are Copyright (c) 2023 by Embarcadero Technologies, Inc.
+#
+#  See LICENSE.TXT for details.
+
+import interbase
+import interbase.parallel
+
+from .core import InterBaseTestBase
+from .constants import IBTEST_HOST, IBTEST_USER, IBTEST_PASSWORD, IBTEST_DB_PATH, IBTEST_SQL_DIALECT,\
+    IBTEST_SERVER_PUBLIC_FILE
+
+
+class TestParallelScan(InterBaseTestBase):
+    def setUp(self):
+        self.connect_args = dict(
+            host=IBTEST_HOST,
+            database=IBTEST_DB_PATH,
+            user=IBTEST_USER,
+            password=IBTEST_PASSWORD,
+            sql_dialect=IBTEST_SQL_DIALECT,
+            ssl=IBTEST_SERVER_PUBLIC_FILE is not None,
+            server_public_file=IBTEST_SERVER_PUBLIC_FILE
+        )
+        self.con = interbase.connect(**self.connect_args)
+
+    def tearDown(self):
+        self.con.close()
+
+    def test_scan(self):
+        cur = self.con.cursor()
+        cur.execute('select emp_no, last_name from employee order by emp_no')
+        expected = cur.fetchall()
+        rows = []
+        for batch in interbase.parallel.scan(None, 'EMPLOYEE', 'EMP_NO', partitions=3,
+                                             columns=['EMP_NO', 'LAST_NAME'],
+                                             batch_size=5, **self.connect_args):
+            self.assertLessEqual(len(batch), 5)
+            rows.extend(batch)
+        self.assertListEqual(sorted(rows), expected)
+
+    def test_scan_callback(self):
+        cur = self.con.cursor()
+        cur.execute("select count(*) from employee where job_code = 'Eng'")
+        expected = cur.fetchone()[0]
+        batches = []
+        count = interbase.parallel.scan(None, 'EMPLOYEE', 'EMP_NO', partitions=2,
+                                        where='JOB_CODE = ?', parameters=['Eng'],
+                                        callback=batches.append, **self.connect_args)
+        self.assertEqual(count, expected)
+        self.assertEqual(sum(len(batch) for batch in batches), expected)
+
+    def test_scan_ranges(self):
+        rows = []
+        for batch in interbase.parallel.scan(None, 'COUNTRY', 'COUNTRY', partitions=2,
+                                             ranges=[(None, 'H'), ('H', None)],
+                                             **self.connect_args):
+            rows.extend(batch)
+        self.assertEqual(len(rows), 14)
+        with self.assertRaises(interbase.ProgrammingError):
+            list(interbase.parallel.scan(None, 'COUNTRY', 'COUNTRY', **self.connect_args))
+
+
+class TestFanout(InterBaseTestBase):
+    def setUp(self):
+        connect_args = dict(
+            host=IBTEST_HOST,
+            database=IBTEST_DB_PATH,
+            user=IBTEST_USER,
+            password=IBTEST_PASSWORD,
+            sql_dialect=IBTEST_SQL_DIALECT,
+            ssl=IBTEST_SERVER_PUBLIC_FILE is not None,
+            server_public_file=IBTEST_SERVER_PUBLIC_FILE
+        )
+        self.shards = [interbase.connect(**connect_args) for i in range(2)]
+
+    def tearDown(self):
+        for con in self.shards:
+            con.close()
+
+    def test_unordered(self):
+        rows = list(interbase.parallel.fanout(self.shards, 'select country from country',
+                                              batch_size=3))
+        self.assertEqual(len(rows), 28)
+
+    def test_merged(self):
+        rows = list(interbase.parallel.fanout(self.shards,
+                                              'select country from country order by country',
+                                              merge=True, batch_size=3))
+        self.assertEqual(len(rows), 28)
+        self.assertListEqual(rows, sorted(rows))
+        self.assertTupleEqual(rows[0], rows[1])
+
+    def test_merged_nulls(self):
+        sql = ('select phone_ext from employee union all'
+               ' select cast(null as varchar(4)) from rdb$database order by 1')
+        cur = self.shards[0].cursor()
+        cur.execute(sql)
+        expected = cur.fetchall()
+        rows = list(interbase.parallel.fanout(self.shards, sql, merge=True,
+                                              nulls_first=expected[0][0] is None,
+                                              batch_size=3))
+        self.assertListEqual(rows[::2], expected)
+        self.assertListEqual(rows[1::2], expected)
+
+    def test_aggregate(self):
+        cur = self.shards[0].cursor()
+        cur.execute('select job_country, count(*), sum(salary), min(salary), max(salary)'
+                    ' from employee group by job_country')
+        expected = dict((row[0], row[1:]) for row in cur.fetchall())
+        rows = interbase.parallel.fanout_aggregate(
+            self.shards,
+            'select job_country, count(*), sum(salary), min(salary), max(salary)'
+            ' from employee group by job_country',
+            [None, 'count', 'sum', 'min', 'max'])
+        self.assertEqual(len(rows), len(expected))
+        for country, count, total, low, high in rows:
+            self.assertEqual(count, expected[country][0] * 2)
+            self.assertEqual(total, expected[country][1] * 2)
+            self.assertEqual(low, expected[country][2])
+            self.assertEqual(high, expected[country][3])
+        with self.assertRaises(interbase.ProgrammingError):
+            interbase.parallel.fanout_aggregate(self.shards, 'select 1 from rdb$database',
+                                                ['avg'])
@@ -0,0 +1,117 @@
+# coding:utf-8
+#
+#   PROGRAM/MODULE: interbase
+#   FILE:           test_pool.py
+#   DESCRIPTION:    Python driver for InterBase
+#   CREATED:        18.10.2026
+#
+#  Software distributed under the License is distributed AS IS,
+#  WITHOUT WARRANTY OF ANY KIND, either express or implied.
+#  See the License for the specific language governing rights
+#  and limitations under the License.
+#
+#  Portions created by Embarcadero Technologies to support
+#  InterBase are Copyright (c) 2023 by Embarcadero Technologies, Inc.
+#
+#  See LICENSE.TXT for details.
+
+import os
+import time
+import unittest
+import interbase
+import interbase.pool
+
+from .core import InterBaseTestBase
+from .constants import IBTEST_HOST, IBTEST_USER, IBTEST_PASSWORD, IBTEST_DB_PATH, IBTEST_SQL_DIALECT,\
+    IBTEST_SERVER_PUBLIC_FILE
+
+
+class TestConnectionPool(InterBaseTestBase):
+    def setUp(self):
+        self.pool = interbase.pool.ConnectionPool(
+            min_size=1,
+            max_size=2,
+            timeout=0.5,
+            host=IBTEST_HOST,
+            database=IBTEST_DB_PATH,
+            user=IBTEST_USER,
+            password=IBTEST_PASSWORD,
+            sql_dialect=IBTEST_SQL_DIALECT,
+            ssl=IBTEST_SERVER_PUBLIC_FILE is not None,
+            server_public_file=IBTEST_SERVER_PUBLIC_FILE
+        )
+
+    def tearDown(self):
+        self.pool.close()
+
+    def test_reuse(self):
+        self.assertEqual(self.pool.size, 1)
+        with self.pool.connection() as con:
+            cur = con.cursor()
+            cur.execute('insert into t (c1) values (1)')
+            tr = con.trans()
+            tr.begin()
+        self.assertFalse(con.main_transaction.active)
+        self.assertTrue(tr.closed)
+        self.assertEqual(len(con.transactions), 2)
+        with self.pool.connection() as con2:
+            self.assertIs(con2, con)
+            cur = con2.cursor()
+            cur.execute('select count(*) from t where c1 = 1')
+            self.assertEqual(cur.fetchone()[0], 0)
+        stats = self.pool.stats
+        self.assertEqual(stats['created'], 1)
+        self.assertEqual(stats['acquired'], 2)
+        self.assertEqual(stats['in_use'], 0)
+
+    def test_exhausted(self):
+        con1 = self.pool.acquire()
+        con2 = self.pool.acquire()
+        with self.assertRaises(interbase.OperationalError):
+            self.pool.acquire(0.1)
+        self.pool.release(con1)
+        self.assertIs(self.pool.acquire(), con1)
+        self.pool.release(con1)
+        self.pool.release(con2)
+        with self.assertRaises(interbase.ProgrammingError):
+            self.pool.release(con2)
+        self.assertEqual(self.pool.stats['timeouts'], 1)
+
+    def test_eviction(self):
+        self.pool.max_idle = 0.1
+        con1 = self.pool.acquire()
+        con2 = self.pool.acquire()
+        self.pool.release(con1)
+        self.pool.release(con2)
+        time.sleep(0.2)
+        self.assertEqual(self.pool.prune(), 1)
+        self.assertEqual(self.pool.size, 1)
+        con = self.pool.acquire()
+        con.close()
+        self.pool.release(con)
+        self.assertEqual(self.pool.size, 0)
+
+    @unittest.skipUnless(hasattr(os, 'fork'), "requires os.fork()")
+    def test_fork(self):
+        con = self.pool.acquire()
+        pid = os.fork()
+        if pid == 0:
+            status = 1
+            try:
+                # Inherited connection is invalidated without detaching it
+                if con.closed and self.pool.size == 0:
+                    with self.pool.connection() as child_con:
+                        cur = child_con.cursor()
+                        cur.execute('select count(*) from country')
+                        if cur.fetchone()[0] == 14 and child_con is not con:
+                            status = 0
+            finally:
+                os._exit(status)
+        _, status = os.waitpid(pid, 0)
+        self.assertEqual(status, 0)
+        # Parent's attachment is still usable
+        self.assertFalse(con.closed)
+        cur = con.cursor()
+        cur.execute('select count(*) from country')
+        self.assertEqual(cur.fetchone()[0], 14)
+        self.pool.release(con)
@@ -27,7 +27,7 @@
 import os
 import interbase
 
-from io import StringIO
+from io import StringIO, BytesIO
 from .core import InterBaseTestBase
 from contextlib import closing
 from .constants import IBTEST_HOST, IBTEST_USER, IBTEST_PASSWORD, IBTEST_DB_PATH, IBTEST_SQL_DIALECT,\
@@ -101,6 +101,23 @@ Stream blobs are stored as a continuous array of data bytes with no length indic
                 'The database stores segmented blobs in chunks.\n'
             )
 
+    def testStreamBlobNotCached(self):
+        cur = self.con.cursor()
+        cur.execute('insert into T2 (C1,C9) values (?,?)', [4, 'This is a BLOB!'])
+        self.con.commit()
+        cmd = 'select C1,C9 from T2 where C1 = 4'
+        cur.execute(cmd)
+        cur.set_stream_blob('C9')
+        blob_reader = cur.fetchone()[1]
+        self.assertIsInstance(blob_reader, interbase.BlobReader)
+        self.assertEqual(blob_reader.read(), 'This is a BLOB!')
+        blob_reader.close()
+        cur.close()
+        # Same command on other cursor returns materialized BLOB
+        cur2 = self.con.cursor()
+        cur2.execute(cmd)
+        self.assertTupleEqual(cur2.fetchone(), (4, 'This is a BLOB!'))
+
     def testBlobExtended(self):
         blob = """InterBase supports two types of blobs, stream and segmented.
 The database stores segmented blobs in chunks.
@@ -152,3 +169,82 @@ Stream blobs are stored as a continuous array of data bytes with no length indic
                     blob_reader.readline(),
                     'The database stores segmented blobs in chunks.\n'
                 )
+
+    def testBlobReadlineMultibyte(self):
+        con = interbase.connect(
+            host=IBTEST_HOST,
+            database=IBTEST_DB_PATH,
+            user=IBTEST_USER,
+            password=IBTEST_PASSWORD,
+            sql_dialect=IBTEST_SQL_DIALECT,
+            charset='UTF8',
+            ssl=IBTEST_SERVER_PUBLIC_FILE is not None,
+            server_public_file=IBTEST_SERVER_PUBLIC_FILE
+        )
+        # Lines are long enough to span several segments, and multi-byte
+        # characters are split across segment boundaries
+        blob = ''.join('%05d Žluťoučký kůň úpěl ďábelské ódy %s\n' % (i, 'ř' * i)
+                       for i in range(200))
+        with closing(con):
+            cur = con.cursor()
+            cur.execute('insert into T2 (C1,C9) values (?,?)', [5, StringIO(blob)])
+            con.commit()
+            p = cur.prep('select C1,C9 from T2 where C1 = 5')
+            p.set_stream_blob('C9')
+            cur.execute(p)
+            blob_reader = cur.fetchone()[1]
+            with closing(p):
+                self.assertListEqual(blob_reader.readlines(),
+                                     StringIO(blob).readlines())
+                blob_reader.seek(0)
+                self.assertEqual(blob_reader.read(), blob)
+                blob_reader.seek(0)
+                self.assertEqual(''.join(iter(lambda: blob_reader.read(7), '')),
+                                 blob)
+
+    def testBlobReadinto(self):
+        blob = b'\x00\x01\x02\x03' * 50000
+        cur = self.con.cursor()
+        cur.execute('insert into T2 (C1,C16) values (?,?)', [6, BytesIO(blob)])
+        self.con.commit()
+        p = cur.prep('select C1,C16 from T2 where C1 = 6')
+        p.set_stream_blob('C16')
+        cur.execute(p)
+        blob_reader = cur.fetchone()[1]
+        with closing(p):
+            buf = bytearray(len(blob) + 10)
+            self.assertEqual(blob_reader.readinto(memoryview(buf)[10:]),
+                             len(blob))
+            self.assertEqual(bytes(buf[10:]), blob)
+            self.assertEqual(blob_reader.readinto(buf), 0)
+            blob_reader.seek(0)
+            view = blob_reader.read_view(100)
+            self.assertIsInstance(view, memoryview)
+            self.assertEqual(view.tobytes(), blob[:100])
+            self.assertEqual(blob_reader.read_view().tobytes(), blob[100:])
+            self.assertEqual(len(blob_reader.read_view()), 0)
+
+    def testBlobStreamThreshold(self):
+        cur = self.con.cursor()
+        cur.execute('insert into T2 (C1,C9) values (?,?)', [7, 'short'])
+        cur.execute('insert into T2 (C1,C9) values (?,?)', [8, 'x' * 1000])
+        self.con.commit()
+        cur.blob_stream_threshold = 100
+        cur.execute('select C1,C9 from T2 where C1 in (7,8) order by C1')
+        rows = cur.fetchall()
+        self.assertEqual(rows[0][1], 'short')
+        self.assertIsInstance(rows[1][1], interbase.BlobReader)
+        with closing(rows[1][1]):
+            self.assertEqual(rows[1][1].read(), 'x' * 1000)
+        cur.close()
+        # Cursor value overrides connection default
+        self.con.blob_stream_threshold = 10
+        cur = self.con.cursor()
+        cur.execute('select C1,C9 from T2 where C1 = 7')
+        blob_reader = cur.fetchone()[1]
+        self.assertIsInstance(blob_reader, interbase.BlobReader)
+        with closing(blob_reader):
+            self.assertEqual(blob_reader.read(), 'short')
+        cur.blob_stream_threshold = 10000
+        cur.execute('select C1,C9 from T2 where C1 = 8')
+        self.assertEqual(cur.fetchone()[1], 'x' * 1000)